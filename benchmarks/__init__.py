@@ -0,0 +1,6 @@
+"""Benchmarks for the ABB-free@home integration.
+
+The benchmarks are not part of the default test run, run them with
+``pytest benchmarks`` and optionally ``--benchmark-output results.json``.
+A stand-alone SysAP simulator can be started with ``python -m benchmarks.simulator``.
+"""
@@ -0,0 +1,152 @@
+"""Fixtures for the ABB-free@home benchmarks."""
+
+from collections.abc import AsyncGenerator, Awaitable, Callable
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from abbfreeathome import FreeAtHome
+from abbfreeathome.bin.interface import Interface
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abbfreeathome_ci.const import DOMAIN
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
+from custom_components.abbfreeathome_ci.snapshot import STORAGE_VERSION
+from homeassistant.core import HomeAssistant
+
+from .generator import SYSAP_SERIAL, InstallationProfile, generate_configuration
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+PROFILES = [
+    *(
+        InstallationProfile(channel_count=_channel_count)
+        for _channel_count in (50, 500, 2000, 10000)
+    ),
+    # Many single channel wireless sensors
+    InstallationProfile(
+        channel_count=2000,
+        name="rf-sensors",
+        channels_per_device=1,
+        channel_mix={"WindowDoorSensor": 1},
+        interfaces=(Interface.WIRELESS_RF,),
+    ),
+    # Few large wired actuators
+    InstallationProfile(
+        channel_count=2000,
+        name="tp-actuators",
+        channels_per_device=8,
+        channel_mix={"SwitchActuator": 1, "DimmingActuator": 1},
+        interfaces=(Interface.WIRED_BUS,),
+    ),
+]
+
+_RESULTS: list[dict[str, Any]] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark command line options."""
+    parser.addoption(
+        "--benchmark-output",
+        action="store",
+        default=None,
+        help="Write the benchmark results as JSON to the given file.",
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    """Print the benchmark results and optionally write them to a file."""
+    if not _RESULTS:
+        return
+
+    terminalreporter.section("ABB-free@home benchmarks")
+    for _result in _RESULTS:
+        terminalreporter.write_line(
+            " ".join(f"{_key}={_value}" for _key, _value in _result.items())
+        )
+
+    if _output := config.getoption("--benchmark-output"):
+        with open(_output, "w", encoding="utf-8") as _file:
+            json.dump(_RESULTS, _file, indent=2)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations."""
+    return
+
+
+@pytest.fixture
+def benchmark_results() -> list[dict[str, Any]]:
+    """Return the list the benchmark results are collected in."""
+    return _RESULTS
+
+
+@pytest.fixture(params=PROFILES, ids=lambda profile: profile.label)
+def profile(request: pytest.FixtureRequest) -> InstallationProfile:
+    """Return the installation profile to benchmark."""
+    return request.param
+
+
+@pytest.fixture
+async def setup_installation(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> AsyncGenerator[Callable[..., Awaitable[FreeAtHomeData]]]:
+    """Return a function which sets up a synthetic installation.
+
+    The configuration is served from the snapshot store, the websocket and the
+    reconciliation with the SysAP are disabled so nothing leaves the process.
+    """
+
+    async def _setup(
+        profile: InstallationProfile, options: dict[str, Any] | None = None
+    ) -> FreeAtHomeData:
+        _entry = MockConfigEntry(
+            version=1,
+            minor_version=5,
+            domain=DOMAIN,
+            title=f"Benchmark SysAP ({SYSAP_SERIAL})",
+            data={
+                "serial": SYSAP_SERIAL,
+                "name": "Benchmark SysAP",
+                "host": "http://127.0.0.1",
+                "username": "installer",
+                "password": "benchmark",
+                "include_orphan_channels": True,
+                "include_virtual_devices": False,
+                "create_subdevices": False,
+                "ssl_cert_file_path": None,
+                "verify_ssl": False,
+            },
+            options=options or {},
+            source="user",
+            unique_id=SYSAP_SERIAL,
+        )
+        _entry.add_to_hass(hass)
+
+        _key = f"{DOMAIN}.{_entry.entry_id}.snapshot"
+        hass_storage[_key] = {
+            "version": STORAGE_VERSION,
+            "minor_version": 1,
+            "key": _key,
+            "data": {
+                "settings": {
+                    "name": "Benchmark SysAP",
+                    "version": "3.0.0",
+                    "hardware_version": "1.0",
+                },
+                "configuration": generate_configuration(profile),
+            },
+        }
+
+        assert await hass.config_entries.async_setup(_entry.entry_id)
+        await hass.async_block_till_done()
+        return hass.data[DOMAIN][_entry.entry_id]
+
+    with (
+        patch.object(FreeAtHome, "ws_listen", AsyncMock()),
+        patch.object(FreeAtHome, "ws_close", AsyncMock()),
+        patch("custom_components.abbfreeathome_ci._async_reconcile_snapshot"),
+    ):
+        yield _setup
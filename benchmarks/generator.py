@@ -0,0 +1,182 @@
+"""Synthetic SysAP configuration generator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import itertools
+from typing import Any
+
+from abbfreeathome.bin.function import Function
+from abbfreeathome.bin.interface import Interface
+from abbfreeathome.bin.pairing import Pairing
+
+SYSAP_SERIAL = "BENCH00000"
+
+ROOMS_PER_FLOOR = 8
+
+# Inputs and outputs of each generated channel type, as (pairing, initial value).
+CHANNEL_TEMPLATES: dict[str, dict[str, Any]] = {
+    "SwitchActuator": {
+        "function": Function.FID_SWITCH_ACTUATOR,
+        "inputs": [(Pairing.AL_SWITCH_ON_OFF, "0"), (Pairing.AL_FORCED, "0")],
+        "outputs": [(Pairing.AL_INFO_ON_OFF, "0"), (Pairing.AL_INFO_FORCE, "0")],
+    },
+    "DimmingActuator": {
+        "function": Function.FID_DIMMING_ACTUATOR,
+        "inputs": [
+            (Pairing.AL_SWITCH_ON_OFF, "0"),
+            (Pairing.AL_ABSOLUTE_SET_VALUE_CONTROL, "0"),
+            (Pairing.AL_FORCED, "0"),
+        ],
+        "outputs": [
+            (Pairing.AL_INFO_ON_OFF, "0"),
+            (Pairing.AL_INFO_ACTUAL_DIMMING_VALUE, "0"),
+            (Pairing.AL_INFO_FORCE, "0"),
+        ],
+    },
+    "BlindActuator": {
+        "function": Function.FID_BLIND_ACTUATOR,
+        "inputs": [
+            (Pairing.AL_MOVE_UP_DOWN, "0"),
+            (Pairing.AL_STOP_STEP_UP_DOWN, "0"),
+            (Pairing.AL_SET_ABSOLUTE_POSITION_BLINDS_PERCENTAGE, "0"),
+            (Pairing.AL_FORCED_UP_DOWN, "0"),
+        ],
+        "outputs": [
+            (Pairing.AL_INFO_MOVE_UP_DOWN, "0"),
+            (Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE, "0"),
+            (Pairing.AL_INFO_FORCE, "0"),
+        ],
+    },
+    "Trigger": {
+        "function": Function.FID_TRIGGER,
+        "inputs": [],
+        "outputs": [(Pairing.AL_TIMED_START_STOP, "0")],
+    },
+    "WindowDoorSensor": {
+        "function": Function.FID_WINDOW_DOOR_SENSOR,
+        "inputs": [],
+        "outputs": [
+            (Pairing.AL_WINDOW_DOOR, "0"),
+            (Pairing.AL_WINDOW_DOOR_POSITION, "0"),
+        ],
+    },
+}
+
+DEFAULT_CHANNEL_MIX: dict[str, int] = {
+    "SwitchActuator": 4,
+    "DimmingActuator": 3,
+    "BlindActuator": 2,
+    "Trigger": 1,
+    "WindowDoorSensor": 2,
+}
+
+DEFAULT_INTERFACES: tuple[Interface, ...] = (
+    Interface.WIRED_BUS,
+    Interface.WIRELESS_RF,
+)
+
+
+@dataclass(frozen=True)
+class InstallationProfile:
+    """Shape of a synthetic free@home installation."""
+
+    channel_count: int
+    name: str = "mixed"
+    channels_per_device: int = 4
+    channel_mix: dict[str, int] = field(
+        default_factory=lambda: dict(DEFAULT_CHANNEL_MIX)
+    )
+    interfaces: tuple[Interface, ...] = DEFAULT_INTERFACES
+
+    @property
+    def device_count(self) -> int:
+        """Return the number of devices needed for the channel count."""
+        return -(-self.channel_count // self.channels_per_device)
+
+    @property
+    def label(self) -> str:
+        """Return a short identifier, used as pytest parameter id."""
+        return f"{self.name}-{self.channel_count}ch"
+
+
+def _cycle_channel_types(channel_mix: dict[str, int]) -> Iterator[str]:
+    """Cycle through the channel types, weighted by the channel mix."""
+    return itertools.cycle(
+        [
+            _channel_type
+            for _channel_type, _weight in channel_mix.items()
+            for _ in range(_weight)
+        ]
+    )
+
+
+def _datapoints(prefix: str, datapoints: list[tuple[Pairing, str]]) -> dict:
+    """Return the inputs or outputs of a channel."""
+    return {
+        f"{prefix}{_index:04x}": {"pairingID": _pairing.value, "value": _value}
+        for _index, (_pairing, _value) in enumerate(datapoints)
+    }
+
+
+def generate_configuration(profile: InstallationProfile) -> dict[str, Any]:
+    """Generate a SysAP configuration for the given installation profile."""
+    _floor_count = max(1, profile.device_count // (ROOMS_PER_FLOOR * 4))
+    _floorplan = {
+        "floors": {
+            f"{_floor:02X}": {
+                "name": f"Floor {_floor}",
+                "rooms": {
+                    f"{_room:02X}": {"name": f"Room {_floor}.{_room}"}
+                    for _room in range(1, ROOMS_PER_FLOOR + 1)
+                },
+            }
+            for _floor in range(1, _floor_count + 1)
+        }
+    }
+
+    _channel_types = _cycle_channel_types(profile.channel_mix)
+    _interfaces = itertools.cycle(profile.interfaces)
+    _devices: dict[str, Any] = {}
+    _remaining = profile.channel_count
+
+    for _device_index in range(profile.device_count):
+        _floor = f"{_device_index % _floor_count + 1:02X}"
+        _room = f"{_device_index % ROOMS_PER_FLOOR + 1:02X}"
+        _channels = {}
+
+        for _channel_index in range(min(profile.channels_per_device, _remaining)):
+            _template = CHANNEL_TEMPLATES[next(_channel_types)]
+            _channels[f"ch{_channel_index:04x}"] = {
+                "displayName": f"Channel {_device_index}.{_channel_index}",
+                "functionID": f"{_template['function'].value:x}",
+                "floor": _floor,
+                "room": _room,
+                "inputs": _datapoints("idp", _template["inputs"]),
+                "outputs": _datapoints("odp", _template["outputs"]),
+                "parameters": {},
+            }
+        _remaining -= len(_channels)
+
+        _devices[f"BENCH{_device_index:07d}"] = {
+            "displayName": f"Device {_device_index}",
+            "deviceId": "B002",
+            "interface": next(_interfaces).value,
+            "floor": _floor,
+            "room": _room,
+            "nativeId": f"BENCH{_device_index:07d}",
+            "unresponsive": False,
+            "unresponsiveCounter": 0,
+            "defect": False,
+            "channels": _channels,
+            "parameters": {},
+        }
+
+    return {
+        "sysapName": "Benchmark SysAP",
+        "devices": _devices,
+        "floorplan": _floorplan,
+        "users": {},
+        "error": None,
+    }
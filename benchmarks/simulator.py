@@ -0,0 +1,352 @@
+"""Local stand-in for the SysAP local API.
+
+Serves a synthetic configuration with configurable latency, jitter, websocket
+update rate and disconnects, run it with ``python -m benchmarks.simulator``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import logging
+import random
+from typing import Any
+
+from abbfreeathome.bin.pairing import Pairing
+from aiohttp import WSMsgType, web
+
+from .generator import SYSAP_SERIAL, InstallationProfile, generate_configuration
+
+_LOGGER = logging.getLogger(__name__)
+
+SYSAP_UUID = "00000000-0000-0000-0000-000000000000"
+API_PATH = "/fhapi/v1/api"
+
+# Output datapoints which follow the value written to an input datapoint.
+INPUT_TO_OUTPUT_PAIRING: dict[int, int] = {
+    Pairing.AL_SWITCH_ON_OFF.value: Pairing.AL_INFO_ON_OFF.value,
+    Pairing.AL_ABSOLUTE_SET_VALUE_CONTROL.value: (
+        Pairing.AL_INFO_ACTUAL_DIMMING_VALUE.value
+    ),
+    Pairing.AL_SET_ABSOLUTE_POSITION_BLINDS_PERCENTAGE.value: (
+        Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE.value
+    ),
+    Pairing.AL_FORCED.value: Pairing.AL_INFO_FORCE.value,
+}
+
+
+@dataclass
+class SimulatorOptions:
+    """Behaviour of the simulated SysAP."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    update_rate: float = 0.0
+    disconnect_interval: float | None = None
+
+
+class SysAPSimulator:
+    """Simulated SysAP serving the local API of a synthetic installation."""
+
+    def __init__(
+        self,
+        profile: InstallationProfile,
+        options: SimulatorOptions | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the simulator."""
+        self.options = options or SimulatorOptions()
+        self.configuration = generate_configuration(profile)
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.updates_sent = 0
+        self.disconnects = 0
+
+        self._websockets: set[web.WebSocketResponse] = set()
+        self._runner: web.AppRunner | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._echo_tasks: set[asyncio.Task] = set()
+
+        _app = web.Application(middlewares=[self._latency_middleware])
+        _app.add_routes(
+            [
+                web.get("/settings.json", self._settings),
+                web.get(f"{API_PATH}/rest/configuration", self._get_configuration),
+                web.get(
+                    f"{API_PATH}/rest/datapoint/{{sysap}}/{{datapoint}}",
+                    self._get_datapoint,
+                ),
+                web.put(
+                    f"{API_PATH}/rest/datapoint/{{sysap}}/{{datapoint}}",
+                    self._put_datapoint,
+                ),
+                web.put(
+                    f"{API_PATH}/rest/virtualdevice/{{sysap}}/{{serial}}",
+                    self._put_virtualdevice,
+                ),
+                web.get(f"{API_PATH}/ws", self._websocket),
+            ]
+        )
+        self._app = _app
+
+    @property
+    def url(self) -> str:
+        """Return the base url of the simulator."""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start serving the local API."""
+        self._runner = web.AppRunner(self._app)
+        await self._runner.setup()
+        _site = web.TCPSite(self._runner, self.host, self.port)
+        await _site.start()
+
+        # Resolve the port when an ephemeral port was requested
+        self.port = self._runner.addresses[0][1]
+
+        if self.options.update_rate > 0:
+            self._tasks.append(asyncio.create_task(self._push_updates()))
+        if self.options.disconnect_interval:
+            self._tasks.append(asyncio.create_task(self._disconnect_clients()))
+
+        _LOGGER.info("SysAP simulator listening on %s", self.url)
+
+    async def stop(self) -> None:
+        """Stop serving the local API."""
+        _tasks = [*self._tasks, *self._echo_tasks]
+        for _task in _tasks:
+            _task.cancel()
+        await asyncio.gather(*_tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        for _websocket in list(self._websockets):
+            await _websocket.close()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def broadcast(self, datapoints: dict[str, str]) -> None:
+        """Push datapoint updates to all connected websocket clients."""
+        _message = {
+            SYSAP_UUID: {
+                "datapoints": datapoints,
+                "devices": {},
+                "devicesAdded": [],
+                "devicesRemoved": [],
+                "scenesTriggered": {},
+            }
+        }
+
+        for _websocket in list(self._websockets):
+            with contextlib.suppress(ConnectionError):
+                await _websocket.send_json(_message)
+
+        self.updates_sent += len(datapoints)
+
+    @web.middleware
+    async def _latency_middleware(self, request: web.Request, handler) -> Any:
+        """Delay every request by the configured latency and jitter."""
+        self.requests += 1
+        if _delay := self._delay():
+            await asyncio.sleep(_delay)
+        return await handler(request)
+
+    def _delay(self) -> float:
+        """Return the latency of a single request or message."""
+        return max(
+            0.0,
+            self.options.latency
+            + random.uniform(-self.options.jitter, self.options.jitter),
+        )
+
+    def _datapoint(self, key: str) -> tuple[dict[str, Any], str, str] | None:
+        """Return the channel, channel path and datapoint of a datapoint key."""
+        try:
+            _serial, _channel_id, _datapoint = key.split(".")
+            _channel = self.configuration["devices"][_serial]["channels"][_channel_id]
+        except (KeyError, ValueError):
+            return None
+
+        return _channel, f"{_serial}/{_channel_id}", _datapoint
+
+    async def _settings(self, request: web.Request) -> web.Response:
+        """Return the SysAP settings."""
+        return web.json_response(
+            {
+                "flags": {
+                    "name": self.configuration["sysapName"],
+                    "serialNumber": SYSAP_SERIAL,
+                    "version": "3.0.0",
+                    "hardwareVersion": "1.0",
+                },
+                "usernames": ["installer"],
+                "users": [
+                    {
+                        "name": "installer",
+                        "jid": f"installer@{SYSAP_UUID}",
+                        "enabled": True,
+                        "flags": [],
+                        "grantedPermissions": [],
+                        "requestedPermissions": [],
+                        "role": "installer",
+                    }
+                ],
+            }
+        )
+
+    async def _get_configuration(self, request: web.Request) -> web.Response:
+        """Return the SysAP configuration."""
+        return web.json_response({SYSAP_UUID: self.configuration})
+
+    async def _get_datapoint(self, request: web.Request) -> web.Response:
+        """Return the value of a single datapoint."""
+        if (_result := self._datapoint(request.match_info["datapoint"])) is None:
+            raise web.HTTPNotFound
+
+        _channel, _, _datapoint = _result
+        _values = _channel["inputs"] | _channel["outputs"]
+        if _datapoint not in _values:
+            raise web.HTTPNotFound
+
+        return web.json_response(
+            {SYSAP_UUID: {"values": [_values[_datapoint]["value"]]}}
+        )
+
+    async def _put_datapoint(self, request: web.Request) -> web.Response:
+        """Set the value of an input datapoint and echo it to its outputs."""
+        if (_result := self._datapoint(request.match_info["datapoint"])) is None:
+            raise web.HTTPNotFound
+
+        _channel, _channel_path, _datapoint = _result
+        if _datapoint not in _channel["inputs"]:
+            raise web.HTTPNotFound
+
+        _value = await request.text()
+        _input = _channel["inputs"][_datapoint]
+        _input["value"] = _value
+
+        _updates = {}
+        _output_pairing = INPUT_TO_OUTPUT_PAIRING.get(_input["pairingID"])
+        for _key, _output in _channel["outputs"].items():
+            if _output["pairingID"] == _output_pairing:
+                _output["value"] = _value
+                _updates[f"{_channel_path}/{_key}"] = _value
+
+        if _updates:
+            _task = asyncio.create_task(self._echo(_updates))
+            self._echo_tasks.add(_task)
+            _task.add_done_callback(self._echo_tasks.discard)
+
+        return web.json_response(
+            {SYSAP_UUID: {"result": "OK", request.match_info["datapoint"]: "OK"}}
+        )
+
+    async def _echo(self, datapoints: dict[str, str]) -> None:
+        """Push the new output values after the SysAP had time to process them."""
+        if _delay := self._delay():
+            await asyncio.sleep(_delay)
+        await self.broadcast(datapoints)
+
+    async def _put_virtualdevice(self, request: web.Request) -> web.Response:
+        """Create or update a virtual device."""
+        _serial = request.match_info["serial"]
+        await request.json()
+
+        return web.json_response(
+            {SYSAP_UUID: {"devices": {_serial: {"serial": f"6000{_serial[-8:]}"}}}}
+        )
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve a websocket connection pushing datapoint updates."""
+        _websocket = web.WebSocketResponse(heartbeat=30)
+        await _websocket.prepare(request)
+        self._websockets.add(_websocket)
+
+        try:
+            async for _message in _websocket:
+                if _message.type is WSMsgType.ERROR:
+                    break
+        finally:
+            self._websockets.discard(_websocket)
+
+        return _websocket
+
+    async def _push_updates(self) -> None:
+        """Push output datapoint updates at the configured rate."""
+        _outputs = [
+            (f"{_serial}/{_channel_id}/{_key}", _output)
+            for _serial, _device in self.configuration["devices"].items()
+            for _channel_id, _channel in _device["channels"].items()
+            for _key, _output in _channel["outputs"].items()
+        ]
+        if not _outputs:
+            return
+
+        _interval = 1 / self.options.update_rate
+        while True:
+            _path, _output = random.choice(_outputs)
+            _output["value"] = "1" if _output["value"] == "0" else "0"
+            await self.broadcast({_path: _output["value"]})
+            await asyncio.sleep(_interval)
+
+    async def _disconnect_clients(self) -> None:
+        """Drop all websocket connections at the configured interval."""
+        while True:
+            await asyncio.sleep(self.options.disconnect_interval)
+            _LOGGER.info("Dropping %s websocket clients", len(self._websockets))
+            for _websocket in list(self._websockets):
+                await _websocket.close()
+                self.disconnects += 1
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the simulator until it is interrupted."""
+    _simulator = SysAPSimulator(
+        InstallationProfile(
+            channel_count=args.channels, channels_per_device=args.channels_per_device
+        ),
+        SimulatorOptions(
+            latency=args.latency,
+            jitter=args.jitter,
+            update_rate=args.update_rate,
+            disconnect_interval=args.disconnect_interval,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    await _simulator.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await _simulator.stop()
+
+
+def main() -> None:
+    """Parse the command line and run the simulator."""
+    _parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _parser.add_argument("--host", default="127.0.0.1")
+    _parser.add_argument("--port", type=int, default=8080)
+    _parser.add_argument("--channels", type=int, default=500)
+    _parser.add_argument("--channels-per-device", type=int, default=4)
+    _parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    _parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    _parser.add_argument(
+        "--update-rate", type=float, default=0.0, help="updates per second"
+    )
+    _parser.add_argument(
+        "--disconnect-interval", type=float, default=None, help="seconds"
+    )
+    _args = _parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(_args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark the ABB-free@home integration against the SysAP simulator."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+import time
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abbfreeathome_ci.const import DOMAIN
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant
+
+from .generator import SYSAP_SERIAL, InstallationProfile
+from .simulator import SimulatorOptions, SysAPSimulator
+
+UPDATE_RATE = 200
+MEASURE_SECONDS = 5
+
+
+@pytest.fixture
+async def simulator(socket_enabled) -> AsyncGenerator[SysAPSimulator]:
+    """Run a SysAP simulator with a realistic latency."""
+    _simulator = SysAPSimulator(
+        InstallationProfile(channel_count=500),
+        SimulatorOptions(latency=0.02, jitter=0.01, update_rate=UPDATE_RATE),
+    )
+    await _simulator.start()
+    yield _simulator
+    await _simulator.stop()
+
+
+async def test_end_to_end(
+    hass: HomeAssistant,
+    simulator: SysAPSimulator,
+    benchmark_results: list[dict[str, Any]],
+) -> None:
+    """Benchmark a cold setup and the websocket update throughput."""
+    _entry = MockConfigEntry(
+        version=1,
+        minor_version=5,
+        domain=DOMAIN,
+        title=f"Simulated SysAP ({SYSAP_SERIAL})",
+        data={
+            "serial": SYSAP_SERIAL,
+            "name": "Simulated SysAP",
+            "host": simulator.url,
+            "username": "installer",
+            "password": "simulator",
+            "include_orphan_channels": True,
+            "include_virtual_devices": False,
+            "create_subdevices": False,
+            "ssl_cert_file_path": None,
+            "verify_ssl": False,
+        },
+        source="user",
+        unique_id=SYSAP_SERIAL,
+    )
+    _entry.add_to_hass(hass)
+
+    _start = time.perf_counter()
+    assert await hass.config_entries.async_setup(_entry.entry_id)
+    await hass.async_block_till_done()
+    _setup_duration = time.perf_counter() - _start
+
+    _state_changes = 0
+
+    def _count_state_change(event: Event) -> None:
+        nonlocal _state_changes
+        _state_changes += 1
+
+    _updates_sent = simulator.updates_sent
+    _unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_change)
+    await asyncio.sleep(MEASURE_SECONDS)
+    _unsubscribe()
+    _updates_sent = simulator.updates_sent - _updates_sent
+
+    assert await hass.config_entries.async_unload(_entry.entry_id)
+
+    benchmark_results.append(
+        {
+            "benchmark": "end_to_end",
+            "setup_s": round(_setup_duration, 3),
+            "requests": simulator.requests,
+            "updates_sent": _updates_sent,
+            "state_changes": _state_changes,
+            "state_changes_per_s": round(_state_changes / MEASURE_SECONDS),
+        }
+    )
@@ -0,0 +1,129 @@
+"""Benchmark the ABB-free@home setup, memory and callback dispatch."""
+
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from custom_components.abbfreeathome_ci.const import CONF_RETAIN_CONFIGURATION, DOMAIN
+from custom_components.abbfreeathome_ci.memory import async_measure_memory
+from homeassistant.core import HomeAssistant
+
+from .generator import InstallationProfile
+
+DISPATCH_ROUNDS = 5
+
+# Upper bound of the retained bytes per channel, a regression beyond it fails
+MEMORY_BUDGET_PER_CHANNEL = {True: 32768, False: 24576}
+
+
+async def test_setup_entry(
+    hass: HomeAssistant,
+    profile: InstallationProfile,
+    setup_installation,
+    benchmark_results: list[dict[str, Any]],
+) -> None:
+    """Benchmark the setup of a config entry and each platform."""
+    _start = time.perf_counter()
+    data = await setup_installation(profile)
+    _duration = time.perf_counter() - _start
+
+    benchmark_results.append(
+        {
+            "benchmark": "setup_entry",
+            "profile": profile.label,
+            "devices": profile.device_count,
+            "entities": len(hass.states.async_all()),
+            "duration_s": round(_duration, 3),
+            **data.setup_timings.phases,
+        }
+    )
+
+
+async def test_setup_entry_memory(
+    hass: HomeAssistant,
+    profile: InstallationProfile,
+    setup_installation,
+    benchmark_results: list[dict[str, Any]],
+) -> None:
+    """Benchmark the peak memory allocated while setting up a config entry."""
+    tracemalloc.start()
+    try:
+        await setup_installation(profile)
+        _current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark_results.append(
+        {
+            "benchmark": "setup_entry_memory",
+            "profile": profile.label,
+            "retained_mib": round(_current / 2**20, 1),
+            "peak_mib": round(_peak / 2**20, 1),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "retain_configuration", [True, False], ids=["retained", "dropped"]
+)
+async def test_memory_per_channel(
+    hass: HomeAssistant,
+    profile: InstallationProfile,
+    setup_installation,
+    benchmark_results: list[dict[str, Any]],
+    retain_configuration: bool,
+) -> None:
+    """Benchmark the retained bytes per channel against the memory budget."""
+    await setup_installation(profile, {CONF_RETAIN_CONFIGURATION: retain_configuration})
+    _entry = hass.config_entries.async_entries(DOMAIN)[0]
+    _report = await async_measure_memory(hass, _entry)
+
+    benchmark_results.append(
+        {
+            "benchmark": "memory_per_channel",
+            "profile": profile.label,
+            "configuration": "retained" if retain_configuration else "dropped",
+            "bytes_per_channel": _report.bytes_per_channel,
+            **_report.categories,
+        }
+    )
+
+    assert bool(_report.categories["configuration"]) is retain_configuration
+    assert _report.bytes_per_channel <= MEMORY_BUDGET_PER_CHANNEL[retain_configuration]
+
+
+async def test_callback_dispatch(
+    hass: HomeAssistant,
+    profile: InstallationProfile,
+    setup_installation,
+    benchmark_results: list[dict[str, Any]],
+) -> None:
+    """Benchmark pushing datapoint updates through the channels to the entities."""
+    data = await setup_installation(profile)
+    _channels = [
+        _channel
+        for _channel_class in data.channel_index.channel_classes
+        for _channel in data.channel_index.get_channels_by_class(_channel_class)
+    ]
+
+    _updates = 0
+    _start = time.perf_counter()
+    for _round in range(DISPATCH_ROUNDS):
+        for _channel in _channels:
+            # Every generated channel has its state on the first output datapoint
+            _channel.update_channel("odp0000", str(_round % 2))
+            _updates += 1
+    await hass.async_block_till_done()
+    _duration = time.perf_counter() - _start
+
+    benchmark_results.append(
+        {
+            "benchmark": "callback_dispatch",
+            "profile": profile.label,
+            "updates": _updates,
+            "duration_s": round(_duration, 3),
+            "updates_per_s": round(_updates / _duration),
+        }
+    )
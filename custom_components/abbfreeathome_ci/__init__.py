@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 from urllib.parse import urlparse, urlunparse
 
-from abbfreeathome import FreeAtHome, FreeAtHomeApi
+from abbfreeathome import FreeAtHome
 from abbfreeathome.api import (
     VIRTUAL_DEVICE_PROPERTIES_SCHEMA,
     VIRTUAL_DEVICE_ROOT_SCHEMA,
+    ClientConnectionError,
     FreeAtHomeSettings,
+    InvalidHostException,
 )
 from abbfreeathome.bin.interface import Interface
 from abbfreeathome.exceptions import BadRequestException
 import voluptuous as vol
 
-from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry, ConfigEntryState
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    Platform,
+)
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
@@ -29,17 +40,40 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
+from .commands import CommandScheduler
 from .const import (
+    CONF_COMMAND_CONCURRENCY,
     CONF_CREATE_SUBDEVICES,
     CONF_INCLUDE_ORPHAN_CHANNELS,
     CONF_INCLUDE_VIRTUAL_DEVICES,
+    CONF_RETAIN_CONFIGURATION,
     CONF_SERIAL,
     CONF_SSL_CERT_FILE_PATH,
+    CONF_UPDATE_QUEUE_SIZE,
     CONF_VERIFY_SSL,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_RETAIN_CONFIGURATION,
+    DEFAULT_UPDATE_QUEUE_SIZE,
     DOMAIN,
     MANUFACTURER,
+    PLATFORM_CHANNEL_CLASSES,
+    REFRESH_STATE,
     VIRTUAL_DEVICE,
 )
+from .devices import async_sync_devices
+from .dispatcher import ChannelDispatcher
+from .metrics import SetupTimings
+from .models import ChannelIndex, FreeAtHomeData
+from .snapshot import (
+    ConfigSnapshot,
+    ConfigSnapshotStore,
+    FreeAtHomeSnapshotApi,
+    apply_datapoint_values,
+    async_fetch_snapshot,
+    diff_configurations,
+)
+from .update_queue import UpdateQueue
+from .websocket import WebsocketSupervisor
 
 VIRTUALDEVICE_SCHEMA = (
     vol.Schema(
@@ -51,8 +85,22 @@ VIRTUALDEVICE_SCHEMA = (
     .extend(VIRTUAL_DEVICE_PROPERTIES_SCHEMA.schema)
 )
 
+REFRESH_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
 _LOGGER = logging.getLogger(__name__)
 
+RECONCILE_RETRY_DELAY_MIN = 5
+RECONCILE_RETRY_DELAY_MAX = 300
+
+# Above this number of channels a single configuration fetch is cheaper than
+# refreshing every channel on its own.
+REFRESH_FETCH_THRESHOLD = 20
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -107,6 +155,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ABB-free@home from a config entry."""
+    _setup_timings = SetupTimings()
 
     # Get the Home Assistant ClientSession Object
     _client_session = async_get_clientsession(hass)
@@ -126,14 +175,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         else:
             _LOGGER.info("HTTPS connection with SSL certificate verification enabled")
 
-    # Get settings from free@home SysAP
+    # Settings of the free@home SysAP
     _free_at_home_settings = FreeAtHomeSettings(
         host=entry.data[CONF_HOST],
         client_session=_client_session,
         verify_ssl=_verify_ssl,
         ssl_cert_ca_file=_ssl_cert_file_path,
     )
-    await _free_at_home_settings.load()
 
     # Attempt to fetch orphan channels config entry, if not found fallback to True
     try:
@@ -160,7 +208,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create the FreeAtHome Object
     _free_at_home = FreeAtHome(
-        api=FreeAtHomeApi(
+        api=FreeAtHomeSnapshotApi(
             host=entry.data[CONF_HOST],
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
@@ -173,13 +221,193 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         include_orphan_channels=_include_orphan_channels,
     )
 
-    # Verify we can fetch the config from the api
-    await _free_at_home.get_config()
+    # Warm-start from the last known configuration if there is one, otherwise
+    # fetch the settings and configuration from the SysAP.
+    _snapshot_store = ConfigSnapshotStore(
+        hass,
+        entry.entry_id,
+        retain=entry.options.get(
+            CONF_RETAIN_CONFIGURATION, DEFAULT_RETAIN_CONFIGURATION
+        ),
+    )
+    with _setup_timings.measure("snapshot_load"):
+        _snapshot = await _snapshot_store.async_load()
+    _warm_start = _snapshot is not None
+
+    if _warm_start:
+        _LOGGER.debug("Starting from the last known configuration of the SysAP")
+    else:
+        with _setup_timings.measure("config_fetch"):
+            _snapshot = await async_fetch_snapshot(
+                _free_at_home_settings, _free_at_home.api
+            )
+        await _snapshot_store.async_save(_snapshot)
+
+    # Load devices into the free at home object from the fetched configuration,
+    # the library must not request it from the SysAP a second time.
+    with (
+        _setup_timings.measure("library_load"),
+        _free_at_home.api.preloaded_configuration(_snapshot.configuration),
+    ):
+        await _free_at_home.load()
+
+    with _setup_timings.measure("device_sync"):
+        # Register SysAP as a Device
+        _async_register_sysap(hass, entry, _snapshot.settings)
+
+        # Register the devices which are new or changed since the last start
+        _device_sync = async_sync_devices(hass, entry, _free_at_home)
+    _LOGGER.debug(
+        "Device registry sync: %s created, %s updated, %s skipped",
+        _device_sync.created,
+        _device_sync.updated,
+        _device_sync.skipped,
+    )
+
+    async def _async_resync() -> None:
+        """Bring the channel states up to date after a websocket reconnect."""
+        await _async_reconcile_snapshot(
+            hass,
+            entry,
+            free_at_home=_free_at_home,
+            settings=_free_at_home_settings,
+            store=_snapshot_store,
+            snapshot=await _snapshot_store.async_get(),
+        )
+
+    _websocket = WebsocketSupervisor(_free_at_home, _async_resync)
+    _free_at_home.api.ws_connect_callback = _websocket.async_connected
+
+    # Queue the state writes, so a burst of updates does not delay the websocket
+    _update_queue = UpdateQueue(
+        maxsize=entry.options.get(CONF_UPDATE_QUEUE_SIZE, DEFAULT_UPDATE_QUEUE_SIZE)
+    )
+    entry.async_create_background_task(
+        hass, _update_queue.async_run(), f"{DOMAIN}_update_queue"
+    )
+
+    # Add the FreeAtHome object and the channel index to hass data
+    _dispatcher = ChannelDispatcher()
+    _free_at_home.api.ws_message_callback = _dispatcher.async_message_received
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = FreeAtHomeData(
+        free_at_home=_free_at_home,
+        channel_index=ChannelIndex(_free_at_home),
+        dispatcher=_dispatcher,
+        device_sync=_device_sync,
+        setup_timings=_setup_timings,
+        websocket=_websocket,
+        update_queue=_update_queue,
+        command_scheduler=CommandScheduler(
+            entry.options.get(CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY)
+        ),
+        snapshot_store=_snapshot_store,
+    )
+
+    # Setup only the platforms which have channels to create entities for
+    await _async_forward_platforms(hass, entry)
+
+    _setup_timings.finish()
+    _LOGGER.debug(
+        "Setup finished in %ss (%s)",
+        _setup_timings.total,
+        ", ".join(
+            f"{_phase}: {_duration}s"
+            for _phase, _duration in _setup_timings.phases.items()
+        ),
+    )
+
+    # Create a supervised websocket connection to listen for changes in device
+    # entities, reconnects only resync the channel states.
+    _websocket.async_start(hass, entry)
+
+    # Bring the snapshot up to date with the live configuration of the SysAP.
+    if _warm_start:
+        entry.async_create_background_task(
+            hass,
+            _async_reconcile_snapshot(
+                hass,
+                entry,
+                free_at_home=_free_at_home,
+                settings=_free_at_home_settings,
+                store=_snapshot_store,
+                snapshot=_snapshot,
+            ),
+            f"{DOMAIN}_reconcile",
+        )
+
+    # Setup services
+    if not hass.services.has_service(DOMAIN, VIRTUAL_DEVICE):
+        await async_setup_service(hass, entry)
+
+    # Reload to apply changed options
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    return True
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _required_platforms(data: FreeAtHomeData) -> set[Platform]:
+    """Return the platforms which have channels to create entities for."""
+    _channel_classes = {
+        _channel_class.__name__ for _channel_class in data.channel_index.channel_classes
+    }
+    _platforms = {
+        _platform
+        for _platform in PLATFORMS
+        if not PLATFORM_CHANNEL_CLASSES[_platform].isdisjoint(_channel_classes)
+    }
+
+    # These platforms also host the diagnostic sensors of the SysAP
+    _platforms.update((Platform.BINARY_SENSOR, Platform.SENSOR))
+    return _platforms
+
+
+async def _async_forward_platforms(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Set up the platforms required by the loaded channels which are not set up."""
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    _required = _required_platforms(data)
+    _platforms = [
+        _platform
+        for _platform in PLATFORMS
+        if _platform in _required and _platform not in data.platforms
+    ]
+
+    if not _platforms:
+        return
+
+    _LOGGER.debug("Setting up platforms: %s", ", ".join(_platforms))
+    data.platforms.update(_platforms)
+
+    # Platforms which appear after the config entry is loaded need a late forward.
+    if entry.state is ConfigEntryState.LOADED:
+        _forward = hass.config_entries.async_late_forward_entry_setups
+    else:
+        _forward = hass.config_entries.async_forward_entry_setups
+
+    async def _async_forward_platform(platform: Platform) -> None:
+        with data.setup_timings.measure(f"platform_{platform}"):
+            await _forward(entry, [platform])
+
+    await asyncio.gather(
+        *(_async_forward_platform(_platform) for _platform in _platforms)
+    )
+
 
-    # Load devices into the free at home object
-    await _free_at_home.load()
+async def async_rebuild_channel_index(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Rebuild the channel index and set up platforms for new channel classes."""
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    data.channel_index.rebuild()
+    await _async_forward_platforms(hass, entry)
 
-    # Register SysAP as a Device
+
+def _async_register_sysap(
+    hass: HomeAssistant, entry: ConfigEntry, settings: dict[str, str | None]
+) -> None:
+    """Register the SysAP as a device."""
     _configuration_url = entry.data[CONF_HOST]
     parsed_url = urlparse(_configuration_url)
 
@@ -197,63 +425,155 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         )
 
-    device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
+    dr.async_get(hass).async_get_or_create(
         config_entry_id=entry.entry_id,
         identifiers={(DOMAIN, entry.data[CONF_SERIAL])},
         manufacturer=MANUFACTURER,
         model="System Access Point",
-        name=_free_at_home_settings.name,
+        name=settings["name"],
         serial_number=entry.data[CONF_SERIAL],
-        sw_version=_free_at_home_settings.version,
-        hw_version=_free_at_home_settings.hardware_version,
+        sw_version=settings["version"],
+        hw_version=settings["hardware_version"],
         configuration_url=_configuration_url,
     )
 
-    for _device in _free_at_home.get_devices().values():
-        if not _free_at_home.get_channels_by_device(_device.device_serial):
-            continue
-
-        device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, _device.device_serial)},
-            name=_device.display_name,
-            manufacturer=MANUFACTURER,
-            serial_number=_device.device_serial,
-            hw_version=_device.device_id,
-            suggested_area=_device.room_name,
-            via_device=(DOMAIN, entry.data[CONF_SERIAL]),
+
+async def _async_reconcile_snapshot(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    *,
+    free_at_home: FreeAtHome,
+    settings: FreeAtHomeSettings,
+    store: ConfigSnapshotStore,
+    snapshot: ConfigSnapshot | None,
+) -> None:
+    """Fetch the live SysAP configuration and apply it to the loaded channels.
+
+    The snapshot only tells whether devices or channels changed. Renamed or
+    moved devices are updated in the device registry, other changes reload the
+    config entry. The values are applied to every channel, as the snapshot does
+    not hold the values the channels currently show. Without a snapshot to
+    compare with, the live configuration becomes the new snapshot and only its
+    values are applied.
+    """
+    _delay = RECONCILE_RETRY_DELAY_MIN
+    while True:
+        try:
+            _live_snapshot = await async_fetch_snapshot(settings, free_at_home.api)
+            break
+        except (ClientConnectionError, InvalidHostException, TimeoutError):
+            _LOGGER.debug(
+                "SysAP not reachable, retrying configuration fetch in %s seconds",
+                _delay,
+            )
+            await asyncio.sleep(_delay)
+            _delay = min(_delay * 2, RECONCILE_RETRY_DELAY_MAX)
+
+    await store.async_save(_live_snapshot)
+
+    if snapshot is None:
+        _LOGGER.debug("No snapshot to compare with, keeping the live configuration")
+        _async_register_sysap(hass, entry, _live_snapshot.settings)
+    else:
+        if _live_snapshot.settings != snapshot.settings:
+            _async_register_sysap(hass, entry, _live_snapshot.settings)
+
+        _diff = diff_configurations(
+            snapshot.configuration, _live_snapshot.configuration
+        )
+
+        # Devices or channels were added, removed or changed, rebuild everything.
+        if _diff.structure_changed:
+            _LOGGER.info("SysAP configuration changed since the last start, reloading")
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
+
+        if _diff.renamed_devices:
+            _LOGGER.debug("Updating %s renamed devices", len(_diff.renamed_devices))
+            async_sync_devices(hass, entry, free_at_home, names=_diff.renamed_devices)
+
+    _LOGGER.debug("Applying the live datapoint values to the channels")
+    apply_datapoint_values(
+        (
+            _channel
+            for _device in free_at_home.get_devices().values()
+            for _channel in free_at_home.get_channels_by_device(_device.device_serial)
+        ),
+        _live_snapshot.configuration,
+    )
+
+
+async def async_refresh_channels(
+    hass: HomeAssistant, entry: ConfigEntry, channels: list[Any]
+) -> None:
+    """Refresh the state of the channels with as few requests as possible.
+
+    Many channels are refreshed with a single configuration fetch, whose
+    datapoint values are applied to them. Otherwise every channel is refreshed
+    through the command scheduler, which limits the concurrent requests.
+    """
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    _store = data.snapshot_store
+
+    if (
+        len(channels) > REFRESH_FETCH_THRESHOLD
+        and _store is not None
+        and (_snapshot := await _store.async_get()) is not None
+    ):
+        _configuration = await data.free_at_home.api.get_configuration()
+        await _store.async_save(
+            ConfigSnapshot(settings=_snapshot.settings, configuration=_configuration)
         )
 
-    # Add the FreeAtHome object to hass data
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = _free_at_home
+        if diff_configurations(
+            _snapshot.configuration, _configuration
+        ).structure_changed:
+            _LOGGER.info("SysAP configuration changed, reloading")
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
 
-    # Setup platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        _LOGGER.debug(
+            "Applying the fetched datapoint values to %s channels", len(channels)
+        )
+        apply_datapoint_values(channels, _configuration)
+        return
 
-    # Create a websocket connection for listen for changes in device entities.
-    entry.async_create_background_task(hass, _free_at_home.ws_listen(), f"{DOMAIN}_ws")
+    _LOGGER.debug("Refreshing %s channels", len(channels))
 
-    # Setup services
-    if not hass.services.has_service(DOMAIN, VIRTUAL_DEVICE):
-        await async_setup_service(hass, entry)
+    async def _async_refresh(channel) -> None:
+        if data.command_scheduler is None:
+            await channel.refresh_state()
+            return
 
-    return True
+        await data.command_scheduler.async_execute_shared(
+            channel.device_serial,
+            (channel.device_serial, channel.channel_id),
+            channel.refresh_state,
+        )
+
+    await asyncio.gather(*(_async_refresh(_channel) for _channel in channels))
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Close websocket connection
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
-    await free_at_home.ws_close()
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    if data.websocket is not None:
+        await data.websocket.async_stop()
+    await data.free_at_home.ws_close()
 
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, data.platforms)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the configuration snapshot when a config entry is removed."""
+    await ConfigSnapshotStore(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
@@ -265,8 +585,10 @@ async def async_remove_config_entry_device(
     )
 
     # Unload the device from the FreeAtHome class
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
-    free_at_home.unload_device(device_serial)
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    data.free_at_home.unload_device(device_serial)
+    data.device_info.invalidate(device_serial)
+    await async_rebuild_channel_index(hass, entry)
 
     return True
 
@@ -347,7 +669,7 @@ async def async_setup_service(hass: HomeAssistant, entry: ConfigEntry) -> None:
         if "capabilities" in call.data:
             data["properties"]["capabilities"] = call.data.get("capabilities")
 
-        _fah = hass.data[DOMAIN][entry.entry_id]
+        _fah = hass.data[DOMAIN][entry.entry_id].free_at_home
 
         try:
             _result = await _fah.api.virtualdevice(
@@ -359,6 +681,47 @@ async def async_setup_service(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
         return _result
 
+    async def refresh_state(call: ServiceCall) -> None:
+        """Service call to refresh the state of devices, areas or everything."""
+        _device_registry = dr.async_get(hass)
+        _device_ids = set(call.data.get(ATTR_DEVICE_ID, []))
+        for _area_id in call.data.get(ATTR_AREA_ID, []):
+            _device_ids.update(
+                _device.id
+                for _device in dr.async_entries_for_area(_device_registry, _area_id)
+            )
+
+        # Identifiers of devices and sub devices, None refreshes everything
+        _identifiers: set[str] | None = None
+        if ATTR_DEVICE_ID in call.data or ATTR_AREA_ID in call.data:
+            _identifiers = {
+                _value
+                for _device_id in _device_ids
+                if (_device := _device_registry.async_get(_device_id)) is not None
+                for _domain, _value in _device.identifiers
+                if _domain == DOMAIN
+            }
+
+        for _entry_id, _data in hass.data[DOMAIN].items():
+            _fah = _data.free_at_home
+            _channels = [
+                _channel
+                for _device in _fah.get_devices().values()
+                for _channel in _fah.get_channels_by_device(_device.device_serial)
+                if _identifiers is None
+                or _channel.device_serial in _identifiers
+                or f"{_channel.device_serial}_{_channel.channel_id}" in _identifiers
+            ]
+
+            if _channels:
+                await async_refresh_channels(
+                    hass, hass.config_entries.async_get_entry(_entry_id), _channels
+                )
+
+    hass.services.async_register(
+        DOMAIN, REFRESH_STATE, refresh_state, schema=REFRESH_STATE_SCHEMA
+    )
+
     hass.services.async_register(
         DOMAIN,
         VIRTUAL_DEVICE,
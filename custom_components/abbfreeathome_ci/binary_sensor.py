@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.air_quality_sensor import AirQualitySensor
 from abbfreeathome.channels.brightness_sensor import BrightnessSensor
 from abbfreeathome.channels.carbon_monoxide_sensor import CarbonMonoxideSensor
@@ -22,11 +21,20 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
+from .websocket import WebsocketSupervisor
 
 SENSOR_DESCRIPTIONS = {
     "AirQualitySensorCO2Alert": {
@@ -119,6 +127,8 @@ SENSOR_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(SENSOR_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -126,7 +136,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up binary sensor entities."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in SENSOR_DESCRIPTIONS.items():
         async_add_entities(
@@ -138,17 +148,24 @@ async def async_setup_entry(
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
             if getattr(channel, description.get("value_attribute")) is not None
         )
 
+    if data.websocket is not None:
+        async_add_entities(
+            [
+                FreeAtHomeWebsocketBinarySensorEntity(
+                    data.websocket, sysap_serial_number=entry.data[CONF_SERIAL]
+                )
+            ]
+        )
 
-class FreeAtHomeBinarySensorEntity(BinarySensorEntity):
-    """Defines a free@home binary sensor entity."""
 
-    _attr_should_poll: bool = False
+class FreeAtHomeBinarySensorEntity(FreeAtHomeEntity, BinarySensorEntity):
+    """Defines a free@home binary sensor entity."""
 
     def __init__(
         self,
@@ -173,67 +190,82 @@ class FreeAtHomeBinarySensorEntity(BinarySensorEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = BinarySensorEntityDescription(
+        self.entity_description = shared_description(
+            BinarySensorEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             translation_placeholders={"channel_id": channel.channel_id},
             **entity_description_kwargs,
         )
+        self._identity = ChannelIdentity.from_channel(
+            channel, self.entity_description.key
+        )
+        self._attr_unique_id = self._identity.unique_id
+        self._attr_translation_key = self.entity_description.translation_key
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        self._channel.register_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
-        )
+        self.async_subscribe(self._value_attribute)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        self._channel.remove_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def is_on(self) -> bool | None:
         """Return state of the binary sensor."""
         return getattr(self._channel, self._value_attribute)
 
+
+class FreeAtHomeWebsocketBinarySensorEntity(BinarySensorEntity):
+    """Defines the websocket connectivity sensor of the SysAP."""
+
+    _attr_should_poll: bool = False
+
+    def __init__(
+        self, websocket: WebsocketSupervisor, sysap_serial_number: str
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__()
+        self._websocket = websocket
+        self._sysap_serial_number = sysap_serial_number
+
+        self.entity_description = BinarySensorEntityDescription(
+            key="Websocket",
+            has_entity_name=True,
+            device_class=BinarySensorDeviceClass.CONNECTIVITY,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            translation_key="websocket",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Run when this Entity has been added to HA."""
+        self._websocket.register_callback(self.async_write_ha_state)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Entity being removed from hass."""
+        self._websocket.remove_callback(self.async_write_ha_state)
+
     @property
-    def translation_key(self):
-        """Return the translation key to translate the entity's name and states.
+    def device_info(self) -> DeviceInfo:
+        """Information about this entity/device."""
+        return DeviceInfo(identifiers={(DOMAIN, self._sysap_serial_number)})
 
-        If the device_name and channel_name are the same, then this sensor is not the
-        main feature of the device and should have it's name translated.
-        """
-        _translation_key = None
-        if hasattr(self, "_attr_translation_key"):
-            _translation_key = self._attr_translation_key
-        if hasattr(self, "entity_description"):
-            _translation_key = self.entity_description.translation_key
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the connection health."""
+        return {
+            "connection_state": self._websocket.state,
+            "connects": self._websocket.connects,
+            "disconnects": self._websocket.disconnects,
+        }
 
-        return _translation_key
+    @property
+    def is_on(self) -> bool | None:
+        """Return whether the websocket is connected."""
+        return self._websocket.is_connected
 
     @property
     def unique_id(self) -> str | None:
         """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
+        return f"{self._sysap_serial_number}_{self.entity_description.key}"
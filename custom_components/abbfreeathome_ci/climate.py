@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.room_temperature_controller import RoomTemperatureController
 
 from homeassistant.components.climate import (
@@ -14,10 +13,13 @@ from homeassistant.components.climate.const import HVACAction, HVACMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import ChannelIdentity, FreeAtHomeEntity, shared_description
+from .models import FreeAtHomeData
+
+CHANNEL_CLASSES = frozenset({RoomTemperatureController.__name__})
 
 
 async def async_setup_entry(
@@ -26,7 +28,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up climate devices."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
         FreeAtHomeClimateEntity(
@@ -34,16 +36,15 @@ async def async_setup_entry(
             sysap_serial_number=entry.data[CONF_SERIAL],
             create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
         )
-        for channel in free_at_home.get_channels_by_class(
+        for channel in data.channel_index.get_channels_by_class(
             channel_class=RoomTemperatureController
         )
     )
 
 
-class FreeAtHomeClimateEntity(ClimateEntity):
+class FreeAtHomeClimateEntity(FreeAtHomeEntity, ClimateEntity):
     """Defines a free@home climate entity."""
 
-    _attr_should_poll: bool = False
     _callback_attributes: list[str] = [
         "state",
         "current_temperature",
@@ -65,52 +66,21 @@ class FreeAtHomeClimateEntity(ClimateEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = ClimateEntityDescription(
+        self.entity_description = shared_description(
+            ClimateEntityDescription,
             key="RoomTemperatureController",
             name=channel.channel_name,
         )
+        self._identity = ChannelIdentity.from_channel(channel, "climate")
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        for _callback_attribute in self._callback_attributes:
-            self._channel.register_callback(
-                callback_attribute=_callback_attribute,
-                callback=self.async_write_ha_state,
-            )
+        self.async_subscribe(*self._callback_attributes)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        for _callback_attribute in self._callback_attributes:
-            self._channel.remove_callback(
-                callback_attribute=_callback_attribute,
-                callback=self.async_write_ha_state,
-            )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_climate"
+        self.async_unsubscribe()
 
     @property
     def temperature_unit(self) -> str | None:
@@ -206,31 +176,31 @@ class FreeAtHomeClimateEntity(ClimateEntity):
     async def async_set_hvac_mode(self, hvac_mode) -> None:
         """Set new target operation mode."""
         if hvac_mode == HVACMode.HEAT_COOL:
-            await self._channel.turn_on()
+            await self.async_send_command(self._channel.turn_on)
 
         if hvac_mode == HVACMode.OFF:
-            await self._channel.turn_off()
+            await self.async_send_command(self._channel.turn_off)
 
     async def async_turn_on(self) -> None:
         """Turn the device on."""
-        await self._channel.turn_on()
+        await self.async_send_command(self._channel.turn_on)
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
-        await self._channel.turn_off()
+        await self.async_send_command(self._channel.turn_off)
 
     async def async_set_preset_mode(self, preset_mode) -> None:
         """Set new preset mode."""
         if preset_mode == "eco":
-            await self._channel.eco_on()
+            await self.async_send_command(self._channel.eco_on)
         else:
-            await self._channel.eco_off()
+            await self.async_send_command(self._channel.eco_off)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        await self._channel.set_temperature(temperature)
+        await self.async_send_latest_command(self._channel.set_temperature, temperature)
 
     async def async_update(self, **kwargs: Any) -> None:
         """Update the switch state."""
-        await self._channel.refresh_state()
+        await self.async_refresh_state()
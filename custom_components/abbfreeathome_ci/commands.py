@@ -0,0 +1,149 @@
+"""Command scheduler of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+import time
+from typing import Any, TypeVar
+
+from .metrics import LatencyHistogram
+
+_T = TypeVar("_T")
+
+
+class CommandScheduler:
+    """Limit the number of commands sent to the SysAP at the same time.
+
+    Commands waiting for a free slot are queued per device and the devices
+    take turns, so an automation touching many channels of one device does
+    not hold up the commands for all other devices.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        """Initialize the scheduler."""
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._waiting: dict[str, deque[asyncio.Future[None]]] = {}
+        self._latest: dict[Hashable, asyncio.Future[None]] = {}
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+
+        self.wait_times = LatencyHistogram()
+        self.high_water = 0
+        self.executed = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        """Return the number of commands waiting for a free slot."""
+        return sum(len(_queue) for _queue in self._waiting.values())
+
+    async def async_execute(
+        self, device_serial: str, command: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Send a command for the device once a slot is free."""
+        _enqueued = time.monotonic()
+
+        if self._active < self._max_concurrent and not self._waiting:
+            self._active += 1
+        else:
+            _slot = asyncio.get_running_loop().create_future()
+            self._waiting.setdefault(device_serial, deque()).append(_slot)
+            self.high_water = max(self.high_water, len(self))
+
+            try:
+                await _slot
+            except asyncio.CancelledError:
+                # The slot might have been handed over right before
+                if _slot.done() and not _slot.cancelled():
+                    self._release()
+                raise
+
+        self.wait_times.record(time.monotonic() - _enqueued)
+
+        try:
+            return await command()
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.executed += 1
+            self._release()
+
+    async def async_execute_latest(
+        self, device_serial: str, key: Hashable, command: Callable[[], Awaitable[_T]]
+    ) -> _T | None:
+        """Send a command for the device, unless a newer one replaces it.
+
+        While a command for the key is in flight, only the newest of the
+        commands for the key received in the meantime is sent after it. The
+        older ones return None without being sent.
+        """
+        _previous = self._latest.get(key)
+        self._latest[key] = _done = asyncio.get_running_loop().create_future()
+
+        try:
+            if _previous is not None:
+                await asyncio.wait({_previous})
+
+                if self._latest[key] is not _done:
+                    self.coalesced += 1
+                    return None
+
+            return await self.async_execute(device_serial, command)
+        finally:
+            _done.set_result(None)
+            if self._latest.get(key) is _done:
+                del self._latest[key]
+
+    async def async_execute_shared(
+        self, device_serial: str, key: Hashable, command: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Send a command for the device, or join the one in flight for the key.
+
+        Used for requests without side effects like refreshing a channel, where
+        concurrent callers can share the result of a single request.
+        """
+        if (_task := self._in_flight.get(key)) is not None:
+            self.shared += 1
+        else:
+            _task = self._in_flight[key] = asyncio.get_running_loop().create_task(
+                self.async_execute(device_serial, command)
+            )
+            _task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # A cancelled caller must not cancel the request of the others
+        return await asyncio.shield(_task)
+
+    def _release(self) -> None:
+        """Hand the slot of a finished command to the next device in turn."""
+        while self._waiting:
+            _device_serial = next(iter(self._waiting))
+            _queue = self._waiting.pop(_device_serial)
+            _slot = _queue.popleft()
+
+            # Move the device to the back of the line
+            if _queue:
+                self._waiting[_device_serial] = _queue
+
+            if not _slot.done():
+                _slot.set_result(None)
+                return
+
+        self._active -= 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler statistics as a dictionary."""
+        return {
+            "max_concurrent": self._max_concurrent,
+            "active": self._active,
+            "queued": len(self),
+            "high_water": self.high_water,
+            "executed": self.executed,
+            "failed": self.failed,
+            "coalesced": self.coalesced,
+            "shared": self.shared,
+            "wait": self.wait_times.as_dict(),
+        }
@@ -21,20 +21,32 @@ import voluptuous as vol
 from homeassistant.components import zeroconf
 from homeassistant.config_entries import (
     CONN_CLASS_LOCAL_PUSH,
+    ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
+    OptionsFlow,
 )
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    CONF_COMMAND_CONCURRENCY,
     CONF_CREATE_SUBDEVICES,
     CONF_INCLUDE_ORPHAN_CHANNELS,
     CONF_INCLUDE_VIRTUAL_DEVICES,
+    CONF_OPTIMISTIC_TIMEOUT,
+    CONF_RETAIN_CONFIGURATION,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
     CONF_SERIAL,
     CONF_SSL_CERT_FILE_PATH,
+    CONF_UPDATE_QUEUE_SIZE,
     CONF_VERIFY_SSL,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_OPTIMISTIC_TIMEOUT,
+    DEFAULT_RETAIN_CONFIGURATION,
+    DEFAULT_UPDATE_QUEUE_SIZE,
     DOMAIN,
     SYSAP_VERSION,
 )
@@ -80,6 +92,32 @@ def _schema_with_defaults(include_ssl: bool = True) -> vol.Schema:
     return vol.Schema(schema_fields)
 
 
+def _schema_options() -> vol.Schema:
+    """Get options schema."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_UPDATE_QUEUE_SIZE, default=DEFAULT_UPDATE_QUEUE_SIZE
+            ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+            vol.Required(
+                CONF_COMMAND_CONCURRENCY, default=DEFAULT_COMMAND_CONCURRENCY
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+            vol.Required(
+                CONF_OPTIMISTIC_TIMEOUT, default=DEFAULT_OPTIMISTIC_TIMEOUT
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+            vol.Optional(CONF_SENSOR_DEADBAND): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=100)
+            ),
+            vol.Optional(CONF_SENSOR_MIN_INTERVAL): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Required(
+                CONF_RETAIN_CONFIGURATION, default=DEFAULT_RETAIN_CONFIGURATION
+            ): bool,
+        }
+    )
+
+
 def _schema_ssl_config() -> vol.Schema:
     """Get schema for SSL configuration step."""
     return vol.Schema(_schema_ssl_cert_fields())
@@ -191,6 +229,12 @@ class FreeAtHomeConfigFlow(ConfigFlow, domain=DOMAIN):
         self._ssl_cert_file_path: str | None = None
         self._verify_ssl: bool = True
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> FreeAtHomeOptionsFlow:
+        """Get the options flow for this handler."""
+        return FreeAtHomeOptionsFlow()
+
     async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
         """Handle import from yaml configuration."""
         _default_verify_ssl = self._is_https_host(import_data.get(CONF_HOST))
@@ -584,3 +628,21 @@ class FreeAtHomeConfigFlow(ConfigFlow, domain=DOMAIN):
 
     def _is_https_host(self, host: str) -> bool:
         return host.lower().startswith("https://")
+
+
+class FreeAtHomeOptionsFlow(OptionsFlow):
+    """Handle the options of ABB-free@home."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                _schema_options(), self.config_entry.options
+            ),
+        )
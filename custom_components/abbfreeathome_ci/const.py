@@ -1,5 +1,7 @@
 """Constants for the ABB-free@home integration."""
 
+from homeassistant.const import Platform
+
 DOMAIN = "abbfreeathome_ci"
 MANUFACTURER = "ABB Busch-Jaeger"
 
@@ -14,5 +16,117 @@ CONF_VERIFY_SSL = "verify_ssl"
 # SysAP Settings
 SYSAP_VERSION = "sysap_version"
 
+# Options
+CONF_UPDATE_QUEUE_SIZE = "update_queue_size"
+DEFAULT_UPDATE_QUEUE_SIZE = 1000
+CONF_COMMAND_CONCURRENCY = "command_concurrency"
+DEFAULT_COMMAND_CONCURRENCY = 4
+CONF_OPTIMISTIC_TIMEOUT = "optimistic_timeout"
+DEFAULT_OPTIMISTIC_TIMEOUT = 0
+CONF_SENSOR_DEADBAND = "sensor_deadband"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_RETAIN_CONFIGURATION = "retain_configuration"
+DEFAULT_RETAIN_CONFIGURATION = True
+
 # Service Calls
+REFRESH_STATE = "refresh_state"
 VIRTUAL_DEVICE = "virtual_device"
+
+# Channels whose state writes go ahead of other updates
+PRIORITY_CHANNEL_CLASSES = frozenset(
+    {
+        "CarbonMonoxideSensor",
+        "DesDoorRingingSensor",
+        "SmokeDetector",
+        "WindowDoorSensor",
+    }
+)
+
+# Names of the channel classes each platform creates entities for, used to only
+# set up the platforms an installation has channels for.
+PLATFORM_CHANNEL_CLASSES: dict[Platform, frozenset[str]] = {
+    Platform.BINARY_SENSOR: frozenset(
+        {
+            "AirQualitySensor",
+            "BlockableMovementDetector",
+            "BrightnessSensor",
+            "CarbonMonoxideSensor",
+            "MovementDetector",
+            "RainSensor",
+            "SmokeDetector",
+            "TemperatureSensor",
+            "WindSensor",
+            "WindowDoorSensor",
+        }
+    ),
+    Platform.BUTTON: frozenset({"Trigger", "VirtualTrigger"}),
+    Platform.CLIMATE: frozenset({"RoomTemperatureController"}),
+    Platform.COVER: frozenset(
+        {"AtticWindowActuator", "AwningActuator", "BlindActuator", "ShutterActuator"}
+    ),
+    Platform.EVENT: frozenset(
+        {
+            "BlindSensor",
+            "DesDoorRingingSensor",
+            "DimmingSensor",
+            "ForceOnOffSensor",
+            "SwitchSensor",
+            "VirtualRoomTemperatureController",
+            "VirtualSwitchActuator",
+        }
+    ),
+    Platform.LIGHT: frozenset({"ColorTemperatureActuator", "DimmingActuator"}),
+    Platform.LOCK: frozenset({"DesDoorOpenerActuator"}),
+    Platform.NUMBER: frozenset(
+        {
+            "VirtualBrightnessSensor",
+            "VirtualEnergyBattery",
+            "VirtualEnergyInverter",
+            "VirtualEnergyTwoWayMeter",
+            "VirtualRoomTemperatureController",
+            "VirtualTemperatureSensor",
+            "VirtualWindSensor",
+        }
+    ),
+    Platform.SELECT: frozenset(
+        {
+            "AtticWindowActuator",
+            "AwningActuator",
+            "BlindActuator",
+            "DimmingActuator",
+            "ShutterActuator",
+            "SwitchActuator",
+        }
+    ),
+    Platform.SENSOR: frozenset(
+        {
+            "AirQualitySensor",
+            "BlockableMovementDetector",
+            "BrightnessSensor",
+            "MovementDetector",
+            "TemperatureSensor",
+            "WindSensor",
+            "WindowDoorSensor",
+        }
+    ),
+    Platform.SWITCH: frozenset(
+        {
+            "BlockableMovementDetector",
+            "DimmingSensor",
+            "MWireSwitchActuator",
+            "SwitchActuator",
+            "SwitchSensor",
+            "VirtualBrightnessSensor",
+            "VirtualRainSensor",
+            "VirtualRoomTemperatureController",
+            "VirtualSwitchActuator",
+            "VirtualTemperatureSensor",
+            "VirtualWindSensor",
+            "VirtualWindowDoorSensor",
+            "WelcomeIPMuteActuator",
+        }
+    ),
+    Platform.VALVE: frozenset(
+        {"CoolingActuator", "HeatingActuator", "HeatingCoolingActuator"}
+    ),
+}
@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.cover_actuator import (
     AtticWindowActuator,
     AwningActuator,
@@ -21,10 +20,16 @@ from homeassistant.components.cover import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
 
 SELECT_DESCRIPTIONS = {
     "AtticWindowActuator": {
@@ -53,6 +58,8 @@ SELECT_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(SELECT_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,7 +67,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switches."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in SELECT_DESCRIPTIONS.items():
         async_add_entities(
@@ -71,16 +78,15 @@ async def async_setup_entry(
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
         )
 
 
-class FreeAtHomeCoverEntity(CoverEntity):
+class FreeAtHomeCoverEntity(FreeAtHomeEntity, CoverEntity):
     """Defines a free@home cover entity."""
 
-    _attr_should_poll: bool = False
     _callback_attributes: list[str] = [
         "state",
         "position",
@@ -99,58 +105,27 @@ class FreeAtHomeCoverEntity(CoverEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = CoverEntityDescription(
+        self.entity_description = shared_description(
+            CoverEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             **entity_description_kwargs,
         )
+        self._identity = ChannelIdentity.from_channel(
+            channel, self.entity_description.key
+        )
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        for _callback_attribute in self._callback_attributes:
-            self._channel.register_callback(
-                callback_attribute=_callback_attribute,
-                callback=self.async_write_ha_state,
-            )
-
+        _attributes = list(self._callback_attributes)
         if hasattr(self._channel, "tilt_position"):
-            self._channel.register_callback(
-                callback_attribute="tilt_position", callback=self.async_write_ha_state
-            )
+            _attributes.append("tilt_position")
+        self.async_subscribe(*_attributes)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        for _callback_attribute in self._callback_attributes:
-            self._channel.remove_callback(
-                callback_attribute=_callback_attribute,
-                callback=self.async_write_ha_state,
-            )
-
-        if hasattr(self._channel, "tilt_position"):
-            self._channel.remove_callback(
-                callback_attribute="tilt_position", callback=self.async_write_ha_state
-            )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def current_cover_position(self) -> int:
@@ -165,11 +140,6 @@ class FreeAtHomeCoverEntity(CoverEntity):
             return abs(self._channel.tilt_position - 100)
         return None
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
-
     @property
     def is_closed(self) -> bool:
         """If the cover is closed or not."""
@@ -178,12 +148,18 @@ class FreeAtHomeCoverEntity(CoverEntity):
     @property
     def is_closing(self) -> bool:
         """If the cover is closing or not."""
-        return self._channel.state == CoverActuatorState.closing.name
+        return (
+            self.optimistic_value("state", self._channel.state)
+            == CoverActuatorState.closing.name
+        )
 
     @property
     def is_opening(self) -> bool:
         """If the cover is opening or not."""
-        return self._channel.state == CoverActuatorState.opening.name
+        return (
+            self.optimistic_value("state", self._channel.state)
+            == CoverActuatorState.opening.name
+        )
 
     @property
     def supported_features(self) -> CoverEntityFeature:
@@ -203,23 +179,48 @@ class FreeAtHomeCoverEntity(CoverEntity):
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        await self._channel.open()
+        await self.async_send_command(
+            self._channel.open, optimistic={"state": CoverActuatorState.opening.name}
+        )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
-        await self._channel.close()
+        await self.async_send_command(
+            self._channel.close, optimistic={"state": CoverActuatorState.closing.name}
+        )
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
 
         _position = abs(kwargs[ATTR_POSITION] - 100)
-        await self._channel.set_position(_position)
+        await self.async_send_latest_command(
+            self._channel.set_position,
+            _position,
+            optimistic=self._moving_state(self._channel.position, _position),
+        )
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
-        await self._channel.stop()
+        await self.async_send_command(self._channel.stop)
 
     async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
         """Move the cover tilt to a specific position."""
         _tilt_position = abs(kwargs[ATTR_TILT_POSITION] - 100)
-        await self._channel.set_tilt_position(_tilt_position)
+        await self.async_send_latest_command(
+            self._channel.set_tilt_position,
+            _tilt_position,
+            optimistic=self._moving_state(self._channel.tilt_position, _tilt_position),
+        )
+
+    @staticmethod
+    def _moving_state(position: int, target: int) -> dict[str, Any] | None:
+        """Return the optimistic state of moving from the position to the target.
+
+        The position itself is left to the device, which takes a while to get
+        there.
+        """
+        if target < position:
+            return {"state": CoverActuatorState.opening.name}
+        if target > position:
+            return {"state": CoverActuatorState.closing.name}
+        return None
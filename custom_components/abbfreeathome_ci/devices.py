@@ -0,0 +1,139 @@
+"""Device registry sync for the ABB-free@home integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from abbfreeathome import FreeAtHome
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import CONF_SERIAL, DOMAIN, MANUFACTURER
+
+
+@dataclass
+class DeviceSyncResult:
+    """Number of device registry entries touched by a sync."""
+
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+
+class DeviceInfoCache:
+    """DeviceInfo of the devices and sub devices, shared by their entities."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._device_info: dict[tuple[str, str | None], DeviceInfo] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached devices and sub devices."""
+        return len(self._device_info)
+
+    def get(self, channel: Any, create_subdevices: bool) -> DeviceInfo:
+        """Return the DeviceInfo of the device or sub device of the channel."""
+        _subdevice = create_subdevices and channel.device.is_multi_device
+        _key = (channel.device_serial, channel.channel_id if _subdevice else None)
+
+        if (_device_info := self._device_info.get(_key)) is None:
+            _device_info = self._device_info[_key] = build_device_info(
+                channel, create_subdevices
+            )
+        return _device_info
+
+    def invalidate(self, device_serial: str) -> None:
+        """Drop the DeviceInfo of the device and its sub devices."""
+        for _key in [_key for _key in self._device_info if _key[0] == device_serial]:
+            del self._device_info[_key]
+
+
+def build_device_info(channel: Any, create_subdevices: bool) -> DeviceInfo:
+    """Build the DeviceInfo of the device or sub device of the channel."""
+    if create_subdevices and channel.device.is_multi_device:
+        _serial = f"{channel.device_serial}_{channel.channel_id}"
+        return DeviceInfo(
+            identifiers={(DOMAIN, _serial)},
+            name=f"{channel.device_name} ({channel.channel_id})",
+            manufacturer=MANUFACTURER,
+            serial_number=_serial,
+            hw_version=f"{channel.device.device_id} (sub)",
+            suggested_area=channel.room_name,
+            via_device=(DOMAIN, channel.device_serial),
+        )
+
+    return DeviceInfo(identifiers={(DOMAIN, channel.device_serial)})
+
+
+@callback
+def async_sync_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    free_at_home: FreeAtHome,
+    names: dict[str, tuple[str | None, str | None]] | None = None,
+) -> DeviceSyncResult:
+    """Create or update the registry entries of devices that are new or changed.
+
+    A device is fingerprinted by its name, room, hardware version and parent device,
+    registry entries with a matching fingerprint are left alone. Names holds the
+    name and room of devices renamed since the configuration was loaded.
+    """
+    _result = DeviceSyncResult()
+    _names = names or {}
+    device_registry = dr.async_get(hass)
+
+    _via_device = (DOMAIN, entry.data[CONF_SERIAL])
+    _via_device_entry = device_registry.async_get_device(identifiers={_via_device})
+    _via_device_id = _via_device_entry.id if _via_device_entry else None
+
+    for _device in free_at_home.get_devices().values():
+        if not free_at_home.get_channels_by_device(_device.device_serial):
+            continue
+
+        _device_entry = device_registry.async_get_device(
+            identifiers={(DOMAIN, _device.device_serial)}
+        )
+        _name, _room_name = _names.get(
+            _device.device_serial, (_device.display_name, _device.room_name)
+        )
+
+        if (
+            _device_entry is not None
+            and entry.entry_id in _device_entry.config_entries
+            and (
+                _device_entry.name,
+                _device_entry.suggested_area,
+                _device_entry.hw_version,
+                _device_entry.via_device_id,
+            )
+            == (
+                _name,
+                _room_name,
+                _device.device_id,
+                _via_device_id,
+            )
+        ):
+            _result.skipped += 1
+            continue
+
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, _device.device_serial)},
+            name=_name,
+            manufacturer=MANUFACTURER,
+            serial_number=_device.device_serial,
+            hw_version=_device.device_id,
+            suggested_area=_room_name,
+            via_device=_via_device,
+        )
+
+        if _device_entry is None:
+            _result.created += 1
+        else:
+            _result.updated += 1
+
+    return _result
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
 from typing import Any
 
 from abbfreeathome import FreeAtHome
@@ -10,91 +9,137 @@ from abbfreeathome.bin.function import Function
 from abbfreeathome.bin.pairing import Pairing
 from abbfreeathome.bin.parameter import Parameter
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .memory import async_measure_memory
+from .models import FreeAtHomeData
 
 TO_REDACT = {"latitude", "longitude", "sysapName", "uartSerialNumber"}
 
+# Above this number of channels the diagnostics are built in the executor
+DIAGNOSTICS_EXECUTOR_CHANNELS = 500
 
-def inject_function_pairing_parameter_names(device_list: list[dict]):
-    """Inject the function, pairaing and parameter names into the list of devices."""
-
-    for _device_value in device_list.values():
-        _device_value["parameterNames"] = {}
-        for _device_param_key, _device_param_value in _device_value.get(
-            "parameters"
-        ).items():
-            try:
-                _device_value["parameterNames"][
-                    f"{Parameter(int(_device_param_key.lstrip('par'), 16)).name} ({_device_param_key})"
-                ] = _device_param_value
-            except ValueError:  # noqa: PERF203
-                _device_value["parameterNames"][f"UNKNOWN ({_device_param_key})"] = (
-                    _device_param_value
-                )
-
-        for _channel_key, _channel_value in _device_value.get("channels").items():
-            for _input_key, _input_value in _channel_value.get("inputs").items():
-                try:
-                    _input_value["pairing"] = Pairing(
-                        _input_value.get("pairingID")
-                    ).name
-                except ValueError:
-                    _input_value["pairing"] = "UNKNOWN"
-
-                _channel_value["inputs"][_input_key] = OrderedDict(
-                    sorted(_input_value.items())
-                )
-
-            for _output_key, _output_value in _channel_value.get("outputs").items():
-                try:
-                    _output_value["pairing"] = Pairing(
-                        _output_value.get("pairingID")
-                    ).name
-                except ValueError:
-                    _output_value["pairing"] = "UNKNOWN"
-
-                _channel_value["outputs"][_output_key] = OrderedDict(
-                    sorted(_output_value.items())
-                )
-
-            _channel_value["parameterNames"] = {}
-            for _channel_param_key, _channel_param_value in _channel_value.get(
-                "parameters"
-            ).items():
-                try:
-                    _channel_value["parameterNames"][
-                        f"{Parameter(int(_channel_param_key.lstrip('par'), 16)).name} ({_channel_param_key})"
-                    ] = _channel_param_value
-                except ValueError:  # noqa: PERF203
-                    _channel_value["parameterNames"][
-                        f"UNKNOWN ({_channel_param_key})"
-                    ] = _channel_param_value
-
-            try:
-                _channel_value["function"] = Function(
-                    int(_channel_value.get("functionID"), 16)
-                ).name
-            except ValueError:
-                _channel_value["function"] = "UNKNOWN"
-
-            _device_value["channels"][_channel_key] = OrderedDict(
-                sorted(_channel_value.items())
-            )
+PARAMETER_NAMES: dict[int, str] = {_member.value: _member.name for _member in Parameter}
+PAIRING_NAMES: dict[int, str] = {_member.value: _member.name for _member in Pairing}
+FUNCTION_NAMES: dict[int, str] = {_member.value: _member.name for _member in Function}
+
+
+def _redact(key: str, value: Any) -> Any:
+    """Redact the value of a key in TO_REDACT, and the keys of nested values."""
+    if key in TO_REDACT and value is not None and value != "":
+        return REDACTED
+    if isinstance(value, dict):
+        return {_key: _redact(_key, _value) for _key, _value in value.items()}
+    if isinstance(value, list):
+        return [_redact("", _item) for _item in value]
+    return value
+
+
+def _hex_name(names: dict[int, str], value: Any) -> str:
+    """Return the name of a hexadecimal ID, or UNKNOWN."""
+    try:
+        return names.get(int(value, 16), "UNKNOWN")
+    except (TypeError, ValueError):
+        return "UNKNOWN"
+
+
+def _parameter_names(parameters: dict[str, Any]) -> dict[str, Any]:
+    """Return the parameters keyed by their name and key."""
+    return {
+        f"{_hex_name(PARAMETER_NAMES, _key.lstrip('par'))} ({_key})": _value
+        for _key, _value in parameters.items()
+    }
+
+
+def _datapoint(datapoint: dict[str, Any]) -> dict[str, Any]:
+    """Return the datapoint with its pairing name, sorted by key."""
+    _result = {_key: _redact(_key, _value) for _key, _value in datapoint.items()}
+    _result["pairing"] = PAIRING_NAMES.get(datapoint.get("pairingID"), "UNKNOWN")
+    return dict(sorted(_result.items()))
+
+
+def _channel(channel: dict[str, Any]) -> dict[str, Any]:
+    """Return the channel with its function, pairing and parameter names."""
+    _result: dict[str, Any] = {}
+    for _key, _value in channel.items():
+        if _key in ("inputs", "outputs"):
+            _result[_key] = {_id: _datapoint(_dp) for _id, _dp in _value.items()}
+        else:
+            _result[_key] = _redact(_key, _value)
+
+    _result["parameterNames"] = _parameter_names(channel.get("parameters", {}))
+    _result["function"] = _hex_name(FUNCTION_NAMES, channel.get("functionID"))
+    return dict(sorted(_result.items()))
+
+
+def _device(device: dict[str, Any]) -> dict[str, Any]:
+    """Return the device with its parameter names and annotated channels."""
+    _result: dict[str, Any] = {}
+    for _key, _value in device.items():
+        if _key == "channels":
+            _result[_key] = {_id: _channel(_ch) for _id, _ch in _value.items()}
+        else:
+            _result[_key] = _redact(_key, _value)
+
+    _result["parameterNames"] = _parameter_names(device.get("parameters", {}))
+    return _result
+
+
+def diagnostics_configuration(configuration: dict[str, Any]) -> dict[str, Any]:
+    """Return the redacted configuration with function, pairing and parameter names.
+
+    Redacting, adding the names and sorting is done in a single pass, which
+    builds a new configuration and leaves the given one untouched.
+    """
+    return {
+        _key: {_serial: _device(_dev) for _serial, _dev in _value.items()}
+        if _key == "devices"
+        else _redact(_key, _value)
+        for _key, _value in configuration.items()
+    }
 
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
-    _free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    """Return diagnostics for a config entry.
 
-    # Inject Function and Pairing names into configuration.
-    inject_function_pairing_parameter_names(
-        (await _free_at_home.get_config()).get("devices")
-    )
+    The SysAP configuration and the runtime metrics of the integration are
+    kept apart, so neither can shadow a key of the other.
+    """
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    _free_at_home: FreeAtHome = data.free_at_home
 
-    return async_redact_data(await _free_at_home.get_config(), TO_REDACT)
+    _configuration = await _free_at_home.get_config()
+
+    # Keep the event loop responsive while annotating large configurations
+    _channels = sum(
+        len(_dev.get("channels", {}))
+        for _dev in _configuration.get("devices", {}).values()
+    )
+    if _channels > DIAGNOSTICS_EXECUTOR_CHANNELS:
+        _diagnostics = await hass.async_add_executor_job(
+            diagnostics_configuration, _configuration
+        )
+    else:
+        _diagnostics = diagnostics_configuration(_configuration)
+
+    return {
+        "configuration": _diagnostics,
+        "runtime": {
+            "setup_timings": data.setup_timings.as_dict(),
+            "state_writes": data.write_metrics.as_dict(),
+            "dispatcher": data.dispatcher.as_dict(),
+            "update_latency": data.update_latency.as_dict(),
+            "optimistic": data.optimistic_metrics.as_dict(),
+            "memory": (await async_measure_memory(hass, entry)).as_dict(),
+            "websocket": data.websocket.as_dict() if data.websocket else None,
+            "update_queue": data.update_queue.as_dict() if data.update_queue else None,
+            "commands": data.command_scheduler.as_dict()
+            if data.command_scheduler
+            else None,
+        },
+    }
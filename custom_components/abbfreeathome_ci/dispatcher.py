@@ -0,0 +1,100 @@
+"""Dispatcher of the channel callbacks of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+DispatcherKey = tuple[str, str, str]
+
+
+class ChannelDispatcher:
+    """Fan out the attribute callbacks of the free@home channels to subscribers.
+
+    Only a single callback is registered on a channel per attribute, the
+    subscribers of all entities are kept in sets indexed by device serial,
+    channel id and attribute. Subscribers read the arrival time of the
+    websocket message which fired the callbacks from `received_at`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher."""
+        self._subscribers: dict[DispatcherKey, set[Callable[[], None]]] = {}
+        self._relays: dict[DispatcherKey, tuple[Any, Callable[[], None]]] = {}
+        self._clear_handle: asyncio.Handle | None = None
+        self.received_at: float | None = None
+
+    @callback
+    def async_message_received(self, received_at: float) -> None:
+        """Stamp the arrival of a websocket message for the callbacks it fires.
+
+        The library applies a message right after receiving it, so the stamp is
+        cleared again in the next event loop iteration.
+        """
+        self.received_at = received_at
+        if self._clear_handle is None:
+            self._clear_handle = asyncio.get_running_loop().call_soon(
+                self._clear_received_at
+            )
+
+    @callback
+    def _clear_received_at(self) -> None:
+        """Forget the arrival time of the last websocket message."""
+        self._clear_handle = None
+        self.received_at = None
+
+    @callback
+    def subscribe(
+        self, channel: Any, attributes: Iterable[str], subscriber: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe to changes of the attributes of a channel.
+
+        Returns a callback which removes the subscription again.
+        """
+        _keys = tuple(
+            (channel.device_serial, channel.channel_id, _attribute)
+            for _attribute in attributes
+        )
+
+        for _key in _keys:
+            if (_subscribers := self._subscribers.get(_key)) is None:
+                _subscribers = self._subscribers[_key] = set()
+                _relay = partial(self._async_dispatch, _key)
+                self._relays[_key] = (channel, _relay)
+                channel.register_callback(callback_attribute=_key[2], callback=_relay)
+
+            _subscribers.add(subscriber)
+
+        return partial(self._unsubscribe, _keys, subscriber)
+
+    @callback
+    def _unsubscribe(
+        self, keys: tuple[DispatcherKey, ...], subscriber: Callable[[], None]
+    ) -> None:
+        """Remove a subscription and the channel callbacks nobody needs anymore."""
+        for _key in keys:
+            if (_subscribers := self._subscribers.get(_key)) is None:
+                continue
+
+            _subscribers.discard(subscriber)
+            if not _subscribers:
+                del self._subscribers[_key]
+                _channel, _relay = self._relays.pop(_key)
+                _channel.remove_callback(callback_attribute=_key[2], callback=_relay)
+
+    @callback
+    def _async_dispatch(self, key: DispatcherKey) -> None:
+        """Run the subscribers of a changed channel attribute."""
+        for _subscriber in tuple(self._subscribers.get(key, ())):
+            _subscriber()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the number of attributes and subscriptions as a dictionary."""
+        return {
+            "attributes": len(self._subscribers),
+            "subscriptions": sum(len(_s) for _s in self._subscribers.values()),
+        }
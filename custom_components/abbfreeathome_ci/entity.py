@@ -0,0 +1,377 @@
+"""Base entity of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+import time
+from typing import Any, TypeVar
+from weakref import WeakValueDictionary
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.event import async_call_later
+
+from .commands import CommandScheduler
+from .const import (
+    CONF_OPTIMISTIC_TIMEOUT,
+    DEFAULT_OPTIMISTIC_TIMEOUT,
+    DOMAIN,
+    PRIORITY_CHANNEL_CLASSES,
+)
+from .devices import build_device_info
+from .dispatcher import ChannelDispatcher
+from .metrics import OptimisticMetrics, StateWriteMetrics, UpdateLatencyMetrics
+from .update_queue import UpdateQueue
+
+_DescriptionT = TypeVar("_DescriptionT", bound=EntityDescription)
+
+# Descriptions are frozen, entities with equal descriptions share one instance.
+# A description is released with the last entity using it, e.g. on unload.
+_DESCRIPTIONS: WeakValueDictionary[Hashable, Any] = WeakValueDictionary()
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelIdentity:
+    """Identity of the entity of a channel, computed once."""
+
+    device_serial: str
+    channel_id: str
+    unique_id: str
+
+    @classmethod
+    def from_channel(cls, channel: Any, suffix: str) -> ChannelIdentity:
+        """Create the identity of the entity with the unique ID suffix."""
+        return cls(
+            device_serial=channel.device_serial,
+            channel_id=channel.channel_id,
+            unique_id=f"{channel.device_serial}_{channel.channel_id}_{suffix}",
+        )
+
+
+def _hashable(value: Any) -> Hashable:
+    """Return a hashable equivalent of a description value."""
+    if isinstance(value, dict):
+        return tuple(sorted((_key, _hashable(_v)) for _key, _v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(_v) for _v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def shared_description(
+    description_class: type[_DescriptionT], **kwargs: Any
+) -> _DescriptionT:
+    """Return the shared description built from the keyword arguments."""
+    _key = (description_class, _hashable(kwargs))
+    if (_description := _DESCRIPTIONS.get(_key)) is None:
+        _description = _DESCRIPTIONS[_key] = description_class(**kwargs)
+    return _description
+
+
+def description_channel_classes(descriptions: dict[str, Any]) -> frozenset[str]:
+    """Return the names of the channel classes of the platform descriptions."""
+    return frozenset(
+        _description["channel_class"].__name__ for _description in descriptions.values()
+    )
+
+
+def channel_device_info(
+    entity: Entity, channel: Any, create_subdevices: bool
+) -> DeviceInfo:
+    """Return the DeviceInfo of the channel, shared within the config entry."""
+    if entity.platform is None or entity.platform.config_entry is None:
+        return build_device_info(channel, create_subdevices)
+
+    data = entity.hass.data[DOMAIN][entity.platform.config_entry.entry_id]
+    return data.device_info.get(channel, create_subdevices)
+
+
+class FreeAtHomeEntity(Entity):
+    """Base of the free@home channel entities."""
+
+    _attr_should_poll: bool = False
+    _channel: Any
+    _identity: ChannelIdentity
+    _create_subdevices: bool = False
+    _dispatcher: ChannelDispatcher | None = None
+    _unsubscribe: CALLBACK_TYPE | None = None
+    _write_handle: asyncio.Handle | None = None
+    _written_state: tuple[Any, ...] | None = None
+    _write_metrics: StateWriteMetrics | None = None
+    _update_latency: UpdateLatencyMetrics | None = None
+    _dirty_since: float | None = None
+    _update_queue: UpdateQueue | None = None
+    _command_scheduler: CommandScheduler | None = None
+    _priority: bool = False
+    _optimistic_timeout: float | None = None
+    _optimistic_state: dict[str, Any] | None = None
+    _optimistic_metrics: OptimisticMetrics | None = None
+    _unsub_optimistic: CALLBACK_TYPE | None = None
+    _optimistic_pending: int = 0
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Information about this entity/device."""
+        return channel_device_info(self, self._channel, self._create_subdevices)
+
+    async def async_internal_added_to_hass(self) -> None:
+        """Look up the runtime helpers of the config entry."""
+        await super().async_internal_added_to_hass()
+
+        if self.platform.config_entry is not None:
+            data = self.hass.data[DOMAIN][self.platform.config_entry.entry_id]
+            self._dispatcher = data.dispatcher
+            self._write_metrics = data.write_metrics
+            self._update_latency = data.update_latency
+            self._update_queue = data.update_queue
+            self._command_scheduler = data.command_scheduler
+            self._optimistic_metrics = data.optimistic_metrics
+            self._optimistic_timeout = (
+                self.platform.config_entry.options.get(
+                    CONF_OPTIMISTIC_TIMEOUT, DEFAULT_OPTIMISTIC_TIMEOUT
+                )
+                or None
+            )
+
+        # Safety relevant channels skip ahead of high-rate telemetry
+        self._priority = (
+            type(getattr(self, "_channel", None)).__name__ in PRIORITY_CHANNEL_CLASSES
+        )
+
+    async def async_send_command(
+        self,
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+        optimistic: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a command of the channel through the command scheduler."""
+        _command = partial(command, *args)
+        if self._command_scheduler is not None:
+            _command = partial(
+                self._command_scheduler.async_execute,
+                self._channel.device_serial,
+                _command,
+            )
+
+        return await self._async_send(_command, optimistic)
+
+    async def async_send_latest_command(
+        self,
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+        optimistic: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a command of a continuous control, replacing a pending one.
+
+        Used for sliders and setpoints, where only the last value matters.
+        """
+        _command = partial(command, *args)
+        if self._command_scheduler is not None:
+            _serial = self._channel.device_serial
+            _command = partial(
+                self._command_scheduler.async_execute_latest,
+                _serial,
+                (_serial, self._channel.channel_id, command.__name__),
+                _command,
+            )
+
+        return await self._async_send(_command, optimistic)
+
+    async def async_refresh_state(self) -> None:
+        """Refresh the state of the channel, joining a refresh in flight."""
+        if self._command_scheduler is None:
+            await self._channel.refresh_state()
+            return
+
+        _serial = self._channel.device_serial
+        await self._command_scheduler.async_execute_shared(
+            _serial, (_serial, self._channel.channel_id), self._channel.refresh_state
+        )
+
+    async def async_send_batch(
+        self,
+        commands: list[Callable[[], Awaitable[Any]]],
+        optimistic: dict[str, Any] | None = None,
+    ) -> None:
+        """Send several commands of the channel at the same time."""
+        await self._async_send(
+            lambda: asyncio.gather(*(_command() for _command in commands)), optimistic
+        )
+
+    async def _async_send(
+        self,
+        command: Callable[[], Awaitable[Any]],
+        optimistic: dict[str, Any] | None,
+    ) -> Any:
+        """Send a command and show its optimistic values in the meantime."""
+        self._optimistic_pending += 1
+        if optimistic:
+            self.async_set_optimistic(optimistic)
+
+        try:
+            _result = await command()
+        except Exception:
+            if optimistic:
+                self.async_clear_optimistic()
+            raise
+        finally:
+            self._optimistic_pending -= 1
+
+        # The channel may have reported the values while the command was sent
+        if optimistic and self._optimistic_state:
+            self.async_flush_write()
+        return _result
+
+    @callback
+    def async_set_optimistic(self, values: dict[str, Any]) -> None:
+        """Show commanded channel attribute values until the channel confirms them.
+
+        Values not confirmed within the optimistic timeout are rolled back.
+        """
+        if self._optimistic_timeout is None:
+            return
+
+        self._optimistic_state = (self._optimistic_state or {}) | values
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+        self._unsub_optimistic = async_call_later(
+            self.hass, self._optimistic_timeout, self._async_optimistic_expired
+        )
+        self.async_flush_write()
+
+    @callback
+    def async_clear_optimistic(self) -> None:
+        """Show the values of the channel again."""
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+            self._unsub_optimistic = None
+
+        if self._optimistic_state:
+            self._optimistic_state = None
+            self.async_flush_write()
+
+    def optimistic_value(self, key: str, value: Any) -> Any:
+        """Return the commanded value of a channel attribute until it is confirmed."""
+        if not self._optimistic_state:
+            return value
+        return self._optimistic_state.get(key, value)
+
+    @callback
+    def _async_optimistic_expired(self, _now: datetime) -> None:
+        """Roll back the commanded values which have not been confirmed."""
+        self._unsub_optimistic = None
+        if self._optimistic_metrics is not None:
+            self._optimistic_metrics.rolled_back += 1
+
+        self.async_clear_optimistic()
+
+    @callback
+    def async_subscribe(self, *attributes: str) -> None:
+        """Schedule a state write when any of the attributes of the channel change."""
+        if self._dispatcher is not None:
+            self._unsubscribe = self._dispatcher.subscribe(
+                self._channel, attributes, self.async_schedule_write
+            )
+            return
+
+        # Without a config entry the callbacks are registered on the channel
+        for _attribute in attributes:
+            self._channel.register_callback(
+                callback_attribute=_attribute, callback=self.async_schedule_write
+            )
+        self._unsubscribe = partial(self._remove_channel_callbacks, attributes)
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop scheduling state writes on changes of the channel."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _remove_channel_callbacks(self, attributes: tuple[str, ...]) -> None:
+        """Remove the callbacks registered on the channel."""
+        for _attribute in attributes:
+            self._channel.remove_callback(
+                callback_attribute=_attribute, callback=self.async_schedule_write
+            )
+
+    @callback
+    def async_schedule_write(self) -> None:
+        """Mark the state dirty and write it once.
+
+        All attribute callbacks fired for the same websocket message result in a
+        single state write, done by the update queue of the config entry or in the
+        next event loop iteration.
+        """
+        # Measure from the arrival of the websocket message if it fired this
+        if self._dirty_since is None:
+            _received_at = self._dispatcher and self._dispatcher.received_at
+            self._dirty_since = _received_at or time.monotonic()
+
+        if self._update_queue is not None:
+            self._update_queue.enqueue(self, priority=self._priority)
+        elif self._write_handle is None:
+            self._write_handle = self.hass.loop.call_soon(self.async_flush_write)
+
+    @callback
+    def async_flush_write(self) -> None:
+        """Write the state marked dirty, unless nothing visible changed."""
+        _start = time.monotonic()
+        _dirty_since, self._dirty_since = self._dirty_since, None
+        self._write_handle = None
+
+        # Commanded values count as confirmed once sent and reported back
+        if self._optimistic_state and not self._optimistic_pending:
+            self._optimistic_state = {
+                _key: _value
+                for _key, _value in self._optimistic_state.items()
+                if getattr(self._channel, _key, None) != _value
+            }
+            if not self._optimistic_state and self._unsub_optimistic is not None:
+                self._unsub_optimistic()
+                self._unsub_optimistic = None
+                if self._optimistic_metrics is not None:
+                    self._optimistic_metrics.confirmed += 1
+
+        _state = (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+        if _state == self._written_state:
+            if self._write_metrics is not None:
+                self._write_metrics.suppressed += 1
+            return
+
+        self._written_state = _state
+        self.async_write_ha_state()
+        if self._write_metrics is not None:
+            self._write_metrics.written += 1
+
+        if self._update_latency is not None and _dirty_since is not None:
+            self._update_latency.record(
+                self.platform.domain, _start - _dirty_since, time.monotonic() - _start
+            )
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Cancel a pending state write when the entity is removed."""
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+        if self._update_queue is not None:
+            self._update_queue.discard(self)
+
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+            self._unsub_optimistic = None
+
+        await super().async_internal_will_remove_from_hass()
@@ -1,8 +1,8 @@
 """Create ABB-free@home event entities."""
 
+import logging
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.blind_sensor import BlindSensor, BlindSensorState
 from abbfreeathome.channels.des_door_ringing_sensor import DesDoorRingingSensor
 from abbfreeathome.channels.force_on_off_sensor import (
@@ -30,12 +30,20 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    channel_device_info,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
+
+_LOGGER = logging.getLogger(__name__)
 
 EVENT_DESCRIPTIONS = {
     "EventBlindSensorState": {
         "channel_class": BlindSensor,
-        "event_type_callback": lambda state: state,
         "state_attribute": "state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -45,8 +53,8 @@ EVENT_DESCRIPTIONS = {
     },
     "EventDesDoorRingingSensorActivated": {
         "channel_class": DesDoorRingingSensor,
-        "event_type_callback": lambda: "activated",
-        "state_attribute": "",
+        "event_type": "activated",
+        "state_attribute": "state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
             "event_types": ["activated"],
@@ -55,7 +63,6 @@ EVENT_DESCRIPTIONS = {
     },
     "EventDimmingSensorState": {
         "channel_class": DimmingSensor,
-        "event_type_callback": lambda state: state,
         "state_attribute": "state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -70,7 +77,6 @@ EVENT_DESCRIPTIONS = {
     },
     "EventForceOnOffSensorOnOff": {
         "channel_class": ForceOnOffSensor,
-        "event_type_callback": lambda state: state,
         "state_attribute": "state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -80,7 +86,6 @@ EVENT_DESCRIPTIONS = {
     },
     "EventSwitchSensorOnOff": {
         "channel_class": SwitchSensor,
-        "event_type_callback": lambda state: state,
         "state_attribute": "state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -90,9 +95,7 @@ EVENT_DESCRIPTIONS = {
     },
     "EventVirtualRoomTemperatureControllerOnOff": {
         "channel_class": VirtualRoomTemperatureController,
-        "event_type_callback": lambda requested_state: (
-            "On" if requested_state else "Off"
-        ),
+        "event_type_map": {True: "On", False: "Off", None: "Off"},
         "state_attribute": "requested_state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -102,9 +105,7 @@ EVENT_DESCRIPTIONS = {
     },
     "EventVirtualRoomTemperatureControllerEcoOnOff": {
         "channel_class": VirtualRoomTemperatureController,
-        "event_type_callback": lambda requested_eco_mode: (
-            "On" if requested_eco_mode else "Off"
-        ),
+        "event_type_map": {True: "On", False: "Off", None: "Off"},
         "state_attribute": "requested_eco_mode",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -114,9 +115,7 @@ EVENT_DESCRIPTIONS = {
     },
     "EventVirtualRoomTemperatureControllerTargetTemperature": {
         "channel_class": VirtualRoomTemperatureController,
-        "event_type_callback": lambda requested_target_temperature: (
-            "requested_target_temperature"
-        ),
+        "event_type": "requested_target_temperature",
         "state_attribute": "requested_target_temperature",
         "entity_description_kwargs": {
             "event_types": ["requested_target_temperature"],
@@ -126,9 +125,7 @@ EVENT_DESCRIPTIONS = {
     },
     "EventVirtualSwitchActuatorOnOff": {
         "channel_class": VirtualSwitchActuator,
-        "event_type_callback": lambda requested_state: (
-            "On" if requested_state else "Off"
-        ),
+        "event_type_map": {True: "On", False: "Off", None: "Off"},
         "state_attribute": "requested_state",
         "entity_description_kwargs": {
             "device_class": EventDeviceClass.BUTTON,
@@ -138,6 +135,8 @@ EVENT_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(EVENT_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -145,7 +144,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up event entities."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in EVENT_DESCRIPTIONS.items():
         async_add_entities(
@@ -156,12 +155,11 @@ async def async_setup_entry(
                 | description.get("entity_description_kwargs"),
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
-                event_type_callback=description.get("event_type_callback"),
-                extra_data=description.get("extra_data")
-                if "extra_data" in description
-                else None,
+                event_type=description.get("event_type"),
+                event_type_map=description.get("event_type_map"),
+                extra_data=description.get("extra_data"),
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
         )
@@ -182,7 +180,8 @@ class FreeAtHomeEventEntity(EventEntity):
         entity_description_kwargs: dict[str, Any],
         sysap_serial_number: str,
         create_subdevices: bool,
-        event_type_callback: callback,
+        event_type: str | None = None,
+        event_type_map: dict[Any, str] | None = None,
         extra_data: str | None = None,
     ) -> None:
         """Initialize the sensor."""
@@ -191,81 +190,67 @@ class FreeAtHomeEventEntity(EventEntity):
         self._state_attribute = state_attribute
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
-        self._event_type_callback = event_type_callback
-        self._extra_data = extra_data
 
-        self.entity_description = EventEntityDescription(
+        self.entity_description = shared_description(
+            EventEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             translation_placeholders={"channel_id": channel.channel_id},
             **entity_description_kwargs,
         )
+        self._identity = ChannelIdentity.from_channel(
+            channel, self.entity_description.key
+        )
+        self._attr_unique_id = self._identity.unique_id
+
+        # Resolve the event type and extra data once, so handling an event is a
+        # single attribute read and dictionary lookup.
+        self._event_type = event_type
+        self._event_type_map = (
+            event_type_map
+            if event_type_map is not None
+            else {_type: _type for _type in self.entity_description.event_types}
+        )
+        self._extra_data = (
+            extra_data if extra_data and hasattr(channel, extra_data) else None
+        )
 
     @callback
     def _async_handle_event(self) -> None:
         """Handle the event."""
-
-        if hasattr(self._channel, self._state_attribute):
-            event_type = self._event_type_callback(
-                getattr(self._channel, self._state_attribute)
+        _event_type = self._event_type or self._event_type_map.get(
+            getattr(self._channel, self._state_attribute)
+        )
+        if _event_type is None:
+            _LOGGER.debug(
+                "Unknown %s of %s, no event triggered",
+                self._state_attribute,
+                self.entity_id,
             )
-        else:
-            event_type = self._event_type_callback()
-
-        _extra_data = None
+            return
 
-        if self._extra_data and hasattr(self._channel, self._extra_data):
-            _extra_data = getattr(self._channel, self._extra_data)
+        _extra_data = (
+            getattr(self._channel, self._extra_data) if self._extra_data else None
+        )
 
-        self._trigger_event(event_type, {"extra_data": _extra_data})
+        self._trigger_event(_event_type, {"extra_data": _extra_data})
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Entity being added to hass."""
-        if len(self._state_attribute) > 0:
-            self._channel.register_callback(
-                callback_attribute=self._state_attribute,
-                callback=self._async_handle_event,
-            )
-        else:
-            self._channel.register_callback(
-                callback_attribute="state", callback=self._async_handle_event
-            )
+        self._channel.register_callback(
+            callback_attribute=self._state_attribute,
+            callback=self._async_handle_event,
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        if len(self._state_attribute) > 0:
-            self._channel.remove_callback(
-                callback_attribute=self._state_attribute,
-                callback=self._async_handle_event,
-            )
-        else:
-            self._channel.remove_callback(
-                callback_attribute="state", callback=self._async_handle_event
-            )
+        self._channel.remove_callback(
+            callback_attribute=self._state_attribute,
+            callback=self._async_handle_event,
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
         """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
+        return channel_device_info(self, self._channel, self._create_subdevices)
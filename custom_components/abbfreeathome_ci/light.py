@@ -1,8 +1,8 @@
 """Create ABB-free@home light entities."""
 
+from functools import partial
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.dimming_actuator import (
     ColorTemperatureActuator,
     DimmingActuator,
@@ -17,14 +17,19 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util.color import brightness_to_value, value_to_brightness
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import ChannelIdentity, FreeAtHomeEntity, shared_description
+from .models import FreeAtHomeData
 
 BRIGHTNESS_SCALE = (1, 100)
 
+CHANNEL_CLASSES = frozenset(
+    {ColorTemperatureActuator.__name__, DimmingActuator.__name__}
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,7 +37,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up lights."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
         FreeAtHomeLightEntity(
@@ -40,7 +45,9 @@ async def async_setup_entry(
             sysap_serial_number=entry.data[CONF_SERIAL],
             create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
         )
-        for channel in free_at_home.get_channels_by_class(channel_class=DimmingActuator)
+        for channel in data.channel_index.get_channels_by_class(
+            channel_class=DimmingActuator
+        )
     )
     async_add_entities(
         FreeAtHomeLightEntity(
@@ -48,16 +55,15 @@ async def async_setup_entry(
             sysap_serial_number=entry.data[CONF_SERIAL],
             create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
         )
-        for channel in free_at_home.get_channels_by_class(
+        for channel in data.channel_index.get_channels_by_class(
             channel_class=ColorTemperatureActuator
         )
     )
 
 
-class FreeAtHomeLightEntity(LightEntity):
+class FreeAtHomeLightEntity(FreeAtHomeEntity, LightEntity):
     """Defines a free@home light entity."""
 
-    _attr_should_poll: bool = False
     _callback_attributes: list[str] = [
         "state",
         "brightness",
@@ -75,73 +81,43 @@ class FreeAtHomeLightEntity(LightEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = LightEntityDescription(
+        self.entity_description = shared_description(
+            LightEntityDescription,
             key="light",
             name=channel.channel_name,
         )
+        self._identity = ChannelIdentity.from_channel(channel, "light")
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        for _callback_attribute in self._callback_attributes:
-            self._channel.register_callback(
-                callback_attribute=_callback_attribute,
-                callback=self.async_write_ha_state,
-            )
+        _attributes = list(self._callback_attributes)
         if hasattr(self._channel, "color_temperature"):
-            self._channel.register_callback(
-                callback_attribute="color_temperature",
-                callback=self.async_write_ha_state,
-            )
+            _attributes.append("color_temperature")
+        self.async_subscribe(*_attributes)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        for _callback_attribute in self._callback_attributes:
-            self._channel.remove_callback(
-                callback_attribute=_callback_attribute,
-                callback=self.async_write_ha_state,
-            )
-        if hasattr(self._channel, "color_temperature"):
-            self._channel.remove_callback(
-                callback_attribute="color_temperature",
-                callback=self.async_write_ha_state,
-            )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def is_on(self) -> bool | None:
         """Return state of the light."""
-        return self._channel.state
+        return self.optimistic_value("state", self._channel.state)
 
     @property
     def brightness(self) -> int | None:
         """Return the current brightness."""
-        return value_to_brightness(BRIGHTNESS_SCALE, self._channel.brightness)
+        return value_to_brightness(
+            BRIGHTNESS_SCALE,
+            self.optimistic_value("brightness", self._channel.brightness),
+        )
 
     @property
     def color_temp_kelvin(self) -> int | None:
         """Return the color temperature in Kelvin."""
         return map_range(
-            self._channel.color_temperature,
+            self.optimistic_value("color_temperature", self._channel.color_temperature),
             0,
             100,
             self._channel.color_temperature_warmest,
@@ -162,41 +138,62 @@ class FreeAtHomeLightEntity(LightEntity):
             return {ColorMode.COLOR_TEMP}
         return {ColorMode.BRIGHTNESS}
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_light"
-
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the light on."""
+        """Turn the light on.
+
+        Brightness and color temperature requested together are written at the
+        same time, instead of one after the other.
+        """
+        _commands = []
+        _optimistic: dict[str, Any] = {"state": True}
+
         if ATTR_BRIGHTNESS in kwargs:
-            await self._channel.set_brightness(
-                int(brightness_to_value(BRIGHTNESS_SCALE, kwargs[ATTR_BRIGHTNESS]))
+            _brightness = int(
+                brightness_to_value(BRIGHTNESS_SCALE, kwargs[ATTR_BRIGHTNESS])
             )
-            return
-
-        if ATTR_COLOR_TEMP_KELVIN in kwargs:
-            if hasattr(self._channel, "color_temperature"):
-                await self._channel.set_color_temperature(
-                    map_range(
-                        kwargs[ATTR_COLOR_TEMP_KELVIN],
-                        self._channel.color_temperature_warmest,
-                        self._channel.color_temperature_coolest,
-                        0,
-                        100,
-                    )
+            _commands.append(
+                partial(
+                    self.async_send_latest_command,
+                    self._channel.set_brightness,
+                    _brightness,
                 )
-            return
+            )
+            _optimistic["brightness"] = _brightness
+        else:
+            _commands.append(partial(self.async_send_command, self._channel.turn_on))
+
+        if ATTR_COLOR_TEMP_KELVIN in kwargs and hasattr(
+            self._channel, "color_temperature"
+        ):
+            _color_temperature = round(
+                map_range(
+                    kwargs[ATTR_COLOR_TEMP_KELVIN],
+                    self._channel.color_temperature_warmest,
+                    self._channel.color_temperature_coolest,
+                    0,
+                    100,
+                )
+            )
+            _commands.append(
+                partial(
+                    self.async_send_latest_command,
+                    self._channel.set_color_temperature,
+                    _color_temperature,
+                )
+            )
+            _optimistic["color_temperature"] = _color_temperature
 
-        await self._channel.turn_on()
+        await self.async_send_batch(_commands, optimistic=_optimistic)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        await self._channel.turn_off()
+        await self.async_send_command(
+            self._channel.turn_off, optimistic={"state": False}
+        )
 
     async def async_update(self, **kwargs: Any) -> None:
         """Update the light state."""
-        await self._channel.refresh_state()
+        await self.async_refresh_state()
 
 
 def map_range(
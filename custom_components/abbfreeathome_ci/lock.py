@@ -2,16 +2,18 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.des_door_opener_actuator import DesDoorOpenerActuator
 
 from homeassistant.components.lock import LockEntity, LockEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import ChannelIdentity, FreeAtHomeEntity, shared_description
+from .models import FreeAtHomeData
+
+CHANNEL_CLASSES = frozenset({DesDoorOpenerActuator.__name__})
 
 
 async def async_setup_entry(
@@ -20,7 +22,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up valves."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
         FreeAtHomeLockEntity(
@@ -28,17 +30,15 @@ async def async_setup_entry(
             sysap_serial_number=entry.data[CONF_SERIAL],
             create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
         )
-        for channel in free_at_home.get_channels_by_class(
+        for channel in data.channel_index.get_channels_by_class(
             channel_class=DesDoorOpenerActuator
         )
     )
 
 
-class FreeAtHomeLockEntity(LockEntity):
+class FreeAtHomeLockEntity(FreeAtHomeEntity, LockEntity):
     """Defines a free@home lock entity."""
 
-    _attr_should_poll: bool = False
-
     def __init__(
         self,
         channel: DesDoorOpenerActuator,
@@ -51,62 +51,35 @@ class FreeAtHomeLockEntity(LockEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = LockEntityDescription(
+        self.entity_description = shared_description(
+            LockEntityDescription,
             key="DesDoorOpenerActuatorLock",
             name=channel.channel_name,
         )
+        self._identity = ChannelIdentity.from_channel(channel, "valve")
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        self._channel.register_callback(
-            callback_attribute="state", callback=self.async_write_ha_state
-        )
+        self.async_subscribe("state")
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        self._channel.remove_callback(
-            callback_attribute="state", callback=self.async_write_ha_state
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def is_locked(self) -> bool | None:
         """Return if device is on."""
-        return self._channel.state is False
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_valve"
+        return self.optimistic_value("state", self._channel.state) is False
 
     async def async_lock(self, **kwargs):
         """Lock the device."""
-        await self._channel.lock()
+        await self.async_send_command(self._channel.lock, optimistic={"state": False})
 
     async def async_unlock(self, **kwargs):
         """Unlock the device."""
-        await self._channel.unlock()
+        await self.async_send_command(self._channel.unlock, optimistic={"state": True})
 
     async def async_update(self, **kwargs: Any) -> None:
         """Update the lock state."""
-        await self._channel.refresh_state()
+        await self.async_refresh_state()
@@ -0,0 +1,132 @@
+"""Memory accounting of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+import sys
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from .const import DOMAIN
+from .models import FreeAtHomeData
+
+# Objects shared by all config entries, which are never accounted to one
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, Enum)
+
+
+@dataclass
+class MemoryReport:
+    """Retained bytes of a config entry by category.
+
+    An object referenced from several categories counts towards the first one,
+    in the order configuration, device info, callbacks, channels, entities.
+    """
+
+    categories: dict[str, int] = field(default_factory=dict)
+    channels: int = 0
+
+    @property
+    def total(self) -> int:
+        """Return the retained bytes of all categories."""
+        return sum(self.categories.values())
+
+    @property
+    def bytes_per_channel(self) -> int | None:
+        """Return the retained bytes per channel."""
+        if not self.channels:
+            return None
+        return round(self.total / self.channels)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report as a dictionary."""
+        return {
+            "categories": dict(self.categories),
+            "total": self.total,
+            "channels": self.channels,
+            "bytes_per_channel": self.bytes_per_channel,
+        }
+
+
+def retained_size(roots: Iterable[Any], seen: set[int]) -> int:
+    """Return the bytes retained by the objects and the containers they hold.
+
+    The attributes of the given objects are followed, other objects they
+    reference only count with their own size. Objects in seen are skipped and
+    the measured ones are added to it.
+    """
+    _size = 0
+    _stack: list[tuple[Any, bool]] = [(_root, True) for _root in roots]
+
+    while _stack:
+        _obj, _expand = _stack.pop()
+        if id(_obj) in seen or isinstance(_obj, _SHARED_TYPES):
+            continue
+        seen.add(id(_obj))
+        _size += sys.getsizeof(_obj)
+
+        # Containers are copied in one step, the event loop may change them
+        if isinstance(_obj, dict):
+            _stack.extend(
+                (_value, False) for _item in tuple(_obj.items()) for _value in _item
+            )
+        elif isinstance(_obj, (list, tuple, set, frozenset, deque)):
+            _stack.extend((_value, False) for _value in tuple(_obj))
+        elif _expand and (_attributes := getattr(_obj, "__dict__", None)) is not None:
+            _stack.append((_attributes, False))
+
+    return _size
+
+
+def measure_memory(roots: dict[str, list[Any]]) -> MemoryReport:
+    """Measure the memory retained by the roots of each category, in order."""
+    _seen: set[int] = set()
+    return MemoryReport(
+        categories={
+            _category: retained_size(_roots, _seen)
+            for _category, _roots in roots.items()
+        },
+        channels=len(roots["channels"]),
+    )
+
+
+@callback
+def async_memory_roots(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, list[Any]]:
+    """Return the objects retained by a config entry, by category."""
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
+    _fah = data.free_at_home
+    _snapshot = data.snapshot_store.snapshot if data.snapshot_store else None
+
+    return {
+        "configuration": [_snapshot.configuration] if _snapshot else [],
+        "device_info": [data.device_info],
+        "callbacks": [data.dispatcher],
+        "channels": [
+            _channel
+            for _device in _fah.get_devices().values()
+            for _channel in _fah.get_channels_by_device(_device.device_serial)
+        ],
+        "entities": [
+            _entity
+            for _platform in async_get_platforms(hass, DOMAIN)
+            if _platform.config_entry is entry
+            for _entity in _platform.entities.values()
+        ],
+    }
+
+
+async def async_measure_memory(hass: HomeAssistant, entry: ConfigEntry) -> MemoryReport:
+    """Measure the memory retained by a config entry in the executor.
+
+    The roots are collected in the event loop, walking them can take a while
+    on large installations.
+    """
+    return await hass.async_add_executor_job(
+        measure_memory, async_memory_roots(hass, entry)
+    )
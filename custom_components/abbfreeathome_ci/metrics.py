@@ -0,0 +1,168 @@
+"""Runtime metrics of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Any
+
+# Upper bounds in seconds of the latency histogram buckets, from 0.1 ms to about
+# 10 seconds in steps of 25 percent.
+LATENCY_BUCKETS: tuple[float, ...] = tuple(0.0001 * 1.25**_i for _i in range(53))
+LATENCY_STAGES = ("queue", "write", "total")
+
+
+@dataclass
+class SetupTimings:
+    """Durations in seconds of the setup phases of a config entry."""
+
+    started: float = field(default_factory=time.monotonic)
+    phases: dict[str, float] = field(default_factory=dict)
+    total: float | None = None
+    _callbacks: list[Callable[[], None]] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None]:
+        """Measure the duration of a setup phase."""
+        _start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases[phase] = round(time.monotonic() - _start, 3)
+
+    def finish(self) -> None:
+        """Record the total setup duration and notify the registered callbacks."""
+        self.total = round(time.monotonic() - self.started, 3)
+
+        for _callback in self._callbacks:
+            _callback()
+
+    def register_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run when the setup has finished."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Remove a registered callback."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings as a dictionary."""
+        return {"total": self.total, "phases": dict(self.phases)}
+
+
+@dataclass
+class StateWriteMetrics:
+    """Number of state writes of the entities of a config entry."""
+
+    written: int = 0
+    suppressed: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {"written": self.written, "suppressed": self.suppressed}
+
+
+@dataclass
+class OptimisticMetrics:
+    """Number of optimistic states confirmed by the channel or rolled back."""
+
+    confirmed: int = 0
+    rolled_back: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {"confirmed": self.confirmed, "rolled_back": self.rolled_back}
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of latencies in seconds with fixed buckets."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    max: float = 0.0
+
+    def record(self, value: float) -> None:
+        """Record a single latency."""
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the latencies of another histogram."""
+        self.counts = [
+            _a + _b for _a, _b in zip(self.counts, other.counts, strict=True)
+        ]
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return None
+
+        _rank = math.ceil(self.count * percent / 100)
+        _seen = 0
+        for _index, _count in enumerate(self.counts):
+            _seen += _count
+            if _seen >= _rank:
+                break
+
+        if _index == len(LATENCY_BUCKETS):
+            return self.max
+        return min(LATENCY_BUCKETS[_index], self.max)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the count and percentiles as a dictionary."""
+        _percentiles = {
+            f"p{_percent}": self.percentile(_percent) for _percent in (50, 95, 99)
+        }
+        return {"count": self.count} | {
+            _key: None if _value is None else round(_value, 6)
+            for _key, _value in (_percentiles | {"max": self.max}).items()
+        }
+
+
+@dataclass
+class UpdateLatencyMetrics:
+    """Latency of the state updates of the entities of a config entry.
+
+    The queue stage is the time from the arrival of the websocket message, or
+    the first attribute callback of the library for other updates, until the
+    state write starts, the write stage the time spent in the entity writing
+    its state.
+    """
+
+    platforms: dict[str, dict[str, LatencyHistogram]] = field(default_factory=dict)
+
+    def record(self, platform: str, queue: float, write: float) -> None:
+        """Record the latency of a state update of an entity of the platform."""
+        if (_stages := self.platforms.get(platform)) is None:
+            _stages = self.platforms[platform] = {
+                _stage: LatencyHistogram() for _stage in LATENCY_STAGES
+            }
+
+        _stages["queue"].record(queue)
+        _stages["write"].record(write)
+        _stages["total"].record(queue + write)
+
+    def combined(self, stage: str = "total") -> LatencyHistogram:
+        """Return the histogram of a stage over all platforms."""
+        _histogram = LatencyHistogram()
+        for _stages in self.platforms.values():
+            _histogram.merge(_stages[stage])
+        return _histogram
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the percentiles per platform and stage as a dictionary."""
+        return {
+            _platform: {
+                _stage: _histogram.as_dict() for _stage, _histogram in _stages.items()
+            }
+            for _platform, _stages in self.platforms.items()
+        }
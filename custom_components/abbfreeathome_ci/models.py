@@ -0,0 +1,75 @@
+"""Runtime data of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from abbfreeathome import FreeAtHome
+
+from homeassistant.const import Platform
+
+from .commands import CommandScheduler
+from .devices import DeviceInfoCache, DeviceSyncResult
+from .dispatcher import ChannelDispatcher
+from .metrics import (
+    OptimisticMetrics,
+    SetupTimings,
+    StateWriteMetrics,
+    UpdateLatencyMetrics,
+)
+from .snapshot import ConfigSnapshotStore
+from .update_queue import UpdateQueue
+from .websocket import WebsocketSupervisor
+
+
+class ChannelIndex:
+    """Index of the loaded free@home channels by their class."""
+
+    def __init__(self, free_at_home: FreeAtHome) -> None:
+        """Initialize the index."""
+        self._free_at_home = free_at_home
+        self._channels: dict[type, list[Any]] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rebuild the index from the channels loaded in the FreeAtHome object."""
+        _channels: defaultdict[type, list[Any]] = defaultdict(list)
+
+        for _device in self._free_at_home.get_devices().values():
+            for _channel in self._free_at_home.get_channels_by_device(
+                _device.device_serial
+            ):
+                _channels[type(_channel)].append(_channel)
+
+        self._channels = dict(_channels)
+
+    @property
+    def channel_classes(self) -> set[type]:
+        """Return the classes of all loaded channels."""
+        return set(self._channels)
+
+    def get_channels_by_class(self, channel_class: type) -> list[Any]:
+        """Return all channels of the given class."""
+        return self._channels.get(channel_class, [])
+
+
+@dataclass
+class FreeAtHomeData:
+    """Runtime data of a single ABB-free@home config entry."""
+
+    free_at_home: FreeAtHome
+    channel_index: ChannelIndex
+    device_sync: DeviceSyncResult = field(default_factory=DeviceSyncResult)
+    platforms: set[Platform] = field(default_factory=set)
+    device_info: DeviceInfoCache = field(default_factory=DeviceInfoCache)
+    dispatcher: ChannelDispatcher = field(default_factory=ChannelDispatcher)
+    setup_timings: SetupTimings = field(default_factory=SetupTimings)
+    write_metrics: StateWriteMetrics = field(default_factory=StateWriteMetrics)
+    update_latency: UpdateLatencyMetrics = field(default_factory=UpdateLatencyMetrics)
+    optimistic_metrics: OptimisticMetrics = field(default_factory=OptimisticMetrics)
+    websocket: WebsocketSupervisor | None = None
+    update_queue: UpdateQueue | None = None
+    command_scheduler: CommandScheduler | None = None
+    snapshot_store: ConfigSnapshotStore | None = None
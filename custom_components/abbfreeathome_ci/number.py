@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.virtual.virtual_brightness_sensor import (
     VirtualBrightnessSensor,
 )
@@ -33,10 +32,16 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
 
 NUMBER_DESCRIPTIONS = {
     "VirtualBrightnessSensor": {
@@ -281,6 +286,8 @@ NUMBER_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(NUMBER_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -288,7 +295,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up numbers."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in NUMBER_DESCRIPTIONS.items():
         async_add_entities(
@@ -300,18 +307,16 @@ async def async_setup_entry(
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
             if getattr(channel, description.get("value_attribute")) is not None
         )
 
 
-class FreeAtHomeNumberEntity(NumberEntity):
+class FreeAtHomeNumberEntity(FreeAtHomeEntity, NumberEntity):
     """Defines a free@home number entity."""
 
-    _attr_should_poll: bool = False
-
     def __init__(
         self,
         channel: VirtualBrightnessSensor | VirtualTemperatureSensor,
@@ -327,64 +332,41 @@ class FreeAtHomeNumberEntity(NumberEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = NumberEntityDescription(
+        self.entity_description = shared_description(
+            NumberEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             translation_placeholders={"channel_id": channel.channel_id},
             **entity_description_kwargs,
         )
+        self._identity = ChannelIdentity.from_channel(
+            channel, self.entity_description.key
+        )
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this entity has been added to HA."""
-        self._channel.register_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
-        )
+        self.async_subscribe(self._value_attribute)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity beeing removed from hass."""
-        self._channel.remove_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def native_value(self) -> float | None:
         """Return value of the number."""
         return getattr(self._channel, self._value_attribute)
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value.
 
         This is especially needed as there are devices (virtual) with multiple numbers to set.
         """
         _method_to_call = "set_" + self._value_attribute
-        await getattr(self._channel, _method_to_call)(float(value))
+        await self.async_send_latest_command(
+            getattr(self._channel, _method_to_call), float(value)
+        )
 
     async def async_update(self, **kwargs: Any) -> None:
         """Update the number state."""
-        await self._channel.refresh_state()
+        await self.async_refresh_state()
@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.cover_actuator import (
     AtticWindowActuator,
     AwningActuator,
@@ -22,10 +21,16 @@ from abbfreeathome.channels.switch_actuator import (
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
 
 SELECT_DESCRIPTIONS = {
     "AtticWindowActuatorForcedPosition": {
@@ -108,6 +113,8 @@ SELECT_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(SELECT_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -115,7 +122,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switches."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in SELECT_DESCRIPTIONS.items():
         async_add_entities(
@@ -128,17 +135,15 @@ async def async_setup_entry(
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
         )
 
 
-class FreeAtHomeSelectEntity(SelectEntity):
+class FreeAtHomeSelectEntity(FreeAtHomeEntity, SelectEntity):
     """Defines a free@home switch entity."""
 
-    _attr_should_poll: bool = False
-
     def __init__(
         self,
         channel: AtticWindowActuator
@@ -161,7 +166,8 @@ class FreeAtHomeSelectEntity(SelectEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = SelectEntityDescription(
+        self.entity_description = shared_description(
+            SelectEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             translation_placeholders={
@@ -170,52 +176,26 @@ class FreeAtHomeSelectEntity(SelectEntity):
             },
             **entity_description_kwargs,
         )
+        self._identity = ChannelIdentity.from_channel(
+            channel, self.entity_description.key
+        )
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        self._channel.register_callback(
-            callback_attribute=self._current_option_attribute,
-            callback=self.async_write_ha_state,
-        )
+        self.async_subscribe(self._current_option_attribute)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        self._channel.remove_callback(
-            callback_attribute=self._current_option_attribute,
-            callback=self.async_write_ha_state,
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option to represent the entity state."""
         return getattr(self._channel, self._current_option_attribute)
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
-
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await getattr(self._channel, self._select_option_method)(option)
+        await self.async_send_command(
+            getattr(self._channel, self._select_option_method), option
+        )
@@ -1,8 +1,10 @@
 """Create ABB-free@home sensor entities."""
 
+from dataclasses import dataclass, replace
+from datetime import datetime
+import time
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.air_quality_sensor import AirQualitySensor
 from abbfreeathome.channels.brightness_sensor import BrightnessSensor
 from abbfreeathome.channels.movement_detector import (
@@ -27,19 +29,62 @@ from homeassistant.const import (
     CONCENTRATION_PARTS_PER_MILLION,
     LIGHT_LUX,
     PERCENTAGE,
+    EntityCategory,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONF_CREATE_SUBDEVICES,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SERIAL,
+    DOMAIN,
+)
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .metrics import SetupTimings, UpdateLatencyMetrics
+from .models import FreeAtHomeData
+
+# Delay in seconds after which a change held back by the deadband is written
+SENSOR_FILTER_TRAILING_DELAY = 60
+
+
+@dataclass(frozen=True, slots=True)
+class SensorFilter:
+    """Deadband and minimum interval of the state writes of a telemetry sensor."""
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    min_interval: float = 0.0
+
+    def exceeds_deadband(self, value: Any, written_value: Any) -> bool:
+        """Return whether the value changed by more than the deadband."""
+        if not isinstance(value, int | float) or not isinstance(
+            written_value, int | float
+        ):
+            return value != written_value
+
+        _delta = abs(value - written_value)
+        return _delta > 0 and _delta >= max(
+            self.absolute, self.relative * abs(written_value)
+        )
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
 
 SENSOR_DESCRIPTIONS = {
     "AirQualitySensorCO2": {
         "channel_class": AirQualitySensor,
         "value_attribute": "co2",
+        "filter": SensorFilter(absolute=10, min_interval=10),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.CO2,
             "native_unit_of_measurement": CONCENTRATION_PARTS_PER_MILLION,
@@ -50,6 +95,7 @@ SENSOR_DESCRIPTIONS = {
     "AirQualitySensorVOC": {
         "channel_class": AirQualitySensor,
         "value_attribute": "voc_index",
+        "filter": SensorFilter(absolute=5, min_interval=10),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
             "state_class": SensorStateClass.MEASUREMENT,
@@ -59,6 +105,7 @@ SENSOR_DESCRIPTIONS = {
     "AirQualitySensorHumidity": {
         "channel_class": AirQualitySensor,
         "value_attribute": "humidity",
+        "filter": SensorFilter(absolute=0.5, min_interval=10),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.HUMIDITY,
             "native_unit_of_measurement": PERCENTAGE,
@@ -69,6 +116,7 @@ SENSOR_DESCRIPTIONS = {
     "BrightnessSensor": {
         "channel_class": BrightnessSensor,
         "value_attribute": "state",
+        "filter": SensorFilter(absolute=1, relative=0.05, min_interval=5),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.ILLUMINANCE,
             "native_unit_of_measurement": LIGHT_LUX,
@@ -79,6 +127,7 @@ SENSOR_DESCRIPTIONS = {
     "MovementDetectorBrightness": {
         "channel_class": MovementDetector,
         "value_attribute": "brightness",
+        "filter": SensorFilter(absolute=1, relative=0.05, min_interval=5),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.ILLUMINANCE,
             "native_unit_of_measurement": LIGHT_LUX,
@@ -89,6 +138,7 @@ SENSOR_DESCRIPTIONS = {
     "BlockableMovementDetectorBrightness": {
         "channel_class": BlockableMovementDetector,
         "value_attribute": "brightness",
+        "filter": SensorFilter(absolute=1, relative=0.05, min_interval=5),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.ILLUMINANCE,
             "native_unit_of_measurement": LIGHT_LUX,
@@ -118,6 +168,7 @@ SENSOR_DESCRIPTIONS = {
     "WindSensorSpeed": {
         "channel_class": WindSensor,
         "value_attribute": "state",
+        "filter": SensorFilter(absolute=0.2, min_interval=5),
         "entity_description_kwargs": {
             "device_class": SensorDeviceClass.WIND_SPEED,
             "native_unit_of_measurement": UnitOfSpeed.METERS_PER_SECOND,
@@ -138,6 +189,8 @@ SENSOR_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(SENSOR_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -145,7 +198,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in SENSOR_DESCRIPTIONS.items():
         async_add_entities(
@@ -154,20 +207,53 @@ async def async_setup_entry(
                 value_attribute=description.get("value_attribute"),
                 entity_description_kwargs={"key": key}
                 | description.get("entity_description_kwargs"),
+                sensor_filter=_sensor_filter(entry, description.get("filter")),
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
             if getattr(channel, description.get("value_attribute")) is not None
         )
 
+    async_add_entities(
+        [
+            FreeAtHomeSetupDurationSensorEntity(
+                data.setup_timings, sysap_serial_number=entry.data[CONF_SERIAL]
+            ),
+            FreeAtHomeUpdateLatencySensorEntity(
+                data.update_latency, sysap_serial_number=entry.data[CONF_SERIAL]
+            ),
+        ]
+    )
 
-class FreeAtHomeSensorEntity(SensorEntity):
-    """Defines a free@home sensor entity."""
 
-    _attr_should_poll: bool = False
+def _sensor_filter(
+    entry: ConfigEntry, sensor_filter: SensorFilter | None
+) -> SensorFilter | None:
+    """Apply the deadband and minimum interval of the options to a filter.
+
+    The option only sets the relative deadband, the absolute deadband is in the
+    unit of each sensor and stays at the default of the description.
+    """
+    if sensor_filter is None:
+        return None
+
+    if CONF_SENSOR_DEADBAND in entry.options:
+        sensor_filter = replace(
+            sensor_filter, relative=entry.options[CONF_SENSOR_DEADBAND] / 100
+        )
+    if CONF_SENSOR_MIN_INTERVAL in entry.options:
+        sensor_filter = replace(
+            sensor_filter, min_interval=entry.options[CONF_SENSOR_MIN_INTERVAL]
+        )
+
+    return sensor_filter
+
+
+class FreeAtHomeSensorEntity(FreeAtHomeEntity, SensorEntity):
+    """Defines a free@home sensor entity."""
 
     def __init__(
         self,
@@ -180,6 +266,8 @@ class FreeAtHomeSensorEntity(SensorEntity):
         entity_description_kwargs: dict[str, Any],
         sysap_serial_number: str,
         create_subdevices: bool,
+        *,
+        sensor_filter: SensorFilter | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__()
@@ -187,53 +275,202 @@ class FreeAtHomeSensorEntity(SensorEntity):
         self._value_attribute = value_attribute
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
+        self._sensor_filter = sensor_filter
+        self._filter_value: Any = None
+        self._filter_written_at: float | None = None
+        self._unsub_trailing_write: CALLBACK_TYPE | None = None
 
-        self.entity_description = SensorEntityDescription(
+        self.entity_description = shared_description(
+            SensorEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             translation_placeholders={"channel_id": channel.channel_id},
             **entity_description_kwargs,
         )
+        self._identity = ChannelIdentity.from_channel(
+            channel, self.entity_description.key
+        )
+        self._attr_unique_id = self._identity.unique_id
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        self._channel.register_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
+        self.async_subscribe(self._value_attribute)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Entity being removed from hass."""
+        self.async_unsubscribe()
+        self._cancel_trailing_write()
+
+    @callback
+    def async_schedule_write(self) -> None:
+        """Write the state, unless the change is held back by the sensor filter.
+
+        A held back change is written by a trailing write, so the last value
+        always lands.
+        """
+        if self._sensor_filter is None or self._filter_written_at is None:
+            self._async_filter_write()
+            return
+
+        _elapsed = time.monotonic() - self._filter_written_at
+        if _elapsed < self._sensor_filter.min_interval:
+            _delay = self._sensor_filter.min_interval - _elapsed
+            _action = self._async_trailing_write
+        elif self._sensor_filter.exceeds_deadband(
+            self.native_value, self._filter_value
+        ):
+            self._async_filter_write()
+            return
+        else:
+            _delay = SENSOR_FILTER_TRAILING_DELAY
+            _action = self._async_trailing_flush
+
+        if self._unsub_trailing_write is None:
+            self._unsub_trailing_write = async_call_later(self.hass, _delay, _action)
+
+    @callback
+    def _async_filter_write(self) -> None:
+        """Schedule the state write and remember the written value."""
+        self._cancel_trailing_write()
+        self._filter_value = self.native_value
+        self._filter_written_at = time.monotonic()
+        super().async_schedule_write()
+
+    @callback
+    def _async_trailing_write(self, _now: datetime) -> None:
+        """Write the last value held back by the minimum interval.
+
+        A value still within the deadband is held back until the trailing flush.
+        """
+        self._unsub_trailing_write = None
+        if self._sensor_filter is not None and not self._sensor_filter.exceeds_deadband(
+            self.native_value, self._filter_value
+        ):
+            self._unsub_trailing_write = async_call_later(
+                self.hass, SENSOR_FILTER_TRAILING_DELAY, self._async_trailing_flush
+            )
+            return
+
+        self._async_filter_write()
+
+    @callback
+    def _async_trailing_flush(self, _now: datetime) -> None:
+        """Write the last value held back by the deadband."""
+        self._unsub_trailing_write = None
+        self._async_filter_write()
+
+    def _cancel_trailing_write(self) -> None:
+        """Cancel a pending trailing write."""
+        if self._unsub_trailing_write is not None:
+            self._unsub_trailing_write()
+            self._unsub_trailing_write = None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return state of the sensor."""
+        return getattr(self._channel, self._value_attribute)
+
+
+class FreeAtHomeSetupDurationSensorEntity(SensorEntity):
+    """Defines the setup duration diagnostic sensor of the SysAP."""
+
+    _attr_should_poll: bool = False
+
+    def __init__(self, setup_timings: SetupTimings, sysap_serial_number: str) -> None:
+        """Initialize the sensor."""
+        super().__init__()
+        self._setup_timings = setup_timings
+        self._sysap_serial_number = sysap_serial_number
+
+        self.entity_description = SensorEntityDescription(
+            key="SetupDuration",
+            has_entity_name=True,
+            device_class=SensorDeviceClass.DURATION,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            translation_key="setup_duration",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Run when this Entity has been added to HA."""
+        self._setup_timings.register_callback(self.async_write_ha_state)
+
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        self._channel.remove_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
+        self._setup_timings.remove_callback(self.async_write_ha_state)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Information about this entity/device."""
+        return DeviceInfo(identifiers={(DOMAIN, self._sysap_serial_number)})
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float]:
+        """Return the duration of each setup phase."""
+        return self._setup_timings.phases
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the total setup duration."""
+        return self._setup_timings.total
+
+    @property
+    def unique_id(self) -> str | None:
+        """Return a unique ID."""
+        return f"{self._sysap_serial_number}_{self.entity_description.key}"
+
+
+class FreeAtHomeUpdateLatencySensorEntity(SensorEntity):
+    """Defines the update latency diagnostic sensor of the SysAP."""
+
+    # Polled, a push on every recorded update would itself cause state writes
+    _attr_should_poll: bool = True
+
+    def __init__(
+        self, update_latency: UpdateLatencyMetrics, sysap_serial_number: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__()
+        self._update_latency = update_latency
+        self._sysap_serial_number = sysap_serial_number
+
+        self.entity_description = SensorEntityDescription(
+            key="UpdateLatency",
+            has_entity_name=True,
+            device_class=SensorDeviceClass.DURATION,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=4,
+            translation_key="update_latency",
         )
 
     @property
     def device_info(self) -> DeviceInfo:
         """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
+        return DeviceInfo(identifiers={(DOMAIN, self._sysap_serial_number)})
 
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the percentiles of the update latency of each platform."""
+        return {
+            _platform: {
+                _percentile: _value
+                for _percentile, _value in _stages["total"].as_dict().items()
+                if _percentile in ("p50", "p95", "p99")
+            }
+            for _platform, _stages in self._update_latency.platforms.items()
+        }
 
     @property
     def native_value(self) -> float | None:
-        """Return state of the sensor."""
-        return getattr(self._channel, self._value_attribute)
+        """Return the 95th percentile of the update latency of all platforms."""
+        return self._update_latency.combined().percentile(95)
 
     @property
     def unique_id(self) -> str | None:
         """Return a unique ID."""
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
+        return f"{self._sysap_serial_number}_{self.entity_description.key}"
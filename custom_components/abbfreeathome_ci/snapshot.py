@@ -0,0 +1,251 @@
+"""Persisted SysAP configuration snapshot for the ABB-free@home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from abbfreeathome import FreeAtHomeApi
+from abbfreeathome.api import FreeAtHomeSettings
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+# Keys which define how a device/channel is built, anything else (datapoint values,
+# unresponsive counters, etc.) can change without affecting the created entities.
+# The name and room of a device only end up in the device registry.
+DEVICE_STRUCTURE_KEYS = ("interface", "nativeId")
+CHANNEL_STRUCTURE_KEYS = ("displayName", "floor", "room", "functionID", "parameters")
+
+
+class FreeAtHomeSnapshotApi(FreeAtHomeApi):
+    """FreeAtHomeApi which can serve an already known configuration."""
+
+    _preloaded_configuration: dict[str, Any] | None = None
+
+    # Run whenever the websocket to the SysAP was opened, and with the arrival
+    # time of every message received on it.
+    ws_connect_callback: Callable[[], None] | None = None
+    ws_message_callback: Callable[[float], None] | None = None
+
+    @contextmanager
+    def preloaded_configuration(self, configuration: dict[str, Any]) -> Generator[None]:
+        """Serve the given configuration instead of fetching it from the SysAP."""
+        self._preloaded_configuration = configuration
+        try:
+            yield
+        finally:
+            self._preloaded_configuration = None
+
+    async def get_configuration(self) -> dict[str, Any]:
+        """Get the configuration, from the preloaded payload if available."""
+        if self._preloaded_configuration is not None:
+            return self._preloaded_configuration
+
+        return await super().get_configuration()
+
+    async def ws_connect(self, *args: Any, **kwargs: Any) -> None:
+        """Connect the websocket and report the open connection."""
+        await super().ws_connect(*args, **kwargs)
+
+        if self.ws_connect_callback is not None:
+            self.ws_connect_callback()
+
+    async def ws_receive(self, *args: Any, **kwargs: Any) -> Any:
+        """Receive a websocket message and report its arrival."""
+        _message = await super().ws_receive(*args, **kwargs)
+
+        if self.ws_message_callback is not None:
+            self.ws_message_callback(time.monotonic())
+        return _message
+
+
+@dataclass
+class ConfigSnapshot:
+    """Last known good SysAP settings and configuration."""
+
+    settings: dict[str, str | None]
+    configuration: dict[str, Any]
+
+    @classmethod
+    def from_settings(
+        cls, settings: FreeAtHomeSettings, configuration: dict[str, Any]
+    ) -> ConfigSnapshot:
+        """Create a snapshot from freshly loaded SysAP settings and configuration."""
+        return cls(
+            settings={
+                "name": settings.name,
+                "version": settings.version,
+                "hardware_version": settings.hardware_version,
+            },
+            configuration=configuration,
+        )
+
+
+@dataclass
+class ConfigurationDiff:
+    """Differences between two SysAP configurations."""
+
+    structure_changed: bool = False
+    renamed_devices: dict[str, tuple[str | None, str | None]] = field(
+        default_factory=dict
+    )
+
+
+class ConfigSnapshotStore:
+    """Persist the configuration snapshot of a single SysAP."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, retain: bool = True) -> None:
+        """Initialize the snapshot store.
+
+        Without retain the snapshot is not kept in memory, but read from disk
+        each time it is needed.
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot", private=True
+        )
+        self._retain = retain
+        self.snapshot: ConfigSnapshot | None = None
+
+    async def async_load(self) -> ConfigSnapshot | None:
+        """Load the snapshot, if one was saved before."""
+        if (_data := await self._store.async_load()) is None:
+            return None
+
+        _snapshot = ConfigSnapshot(
+            settings=_data["settings"], configuration=_data["configuration"]
+        )
+        if self._retain:
+            self.snapshot = _snapshot
+        return _snapshot
+
+    async def async_get(self) -> ConfigSnapshot | None:
+        """Return the snapshot, loading it from disk if it is not retained."""
+        if self.snapshot is not None:
+            return self.snapshot
+        return await self.async_load()
+
+    async def async_save(self, snapshot: ConfigSnapshot) -> None:
+        """Save the snapshot."""
+        if self._retain:
+            self.snapshot = snapshot
+        await self._store.async_save(
+            {"settings": snapshot.settings, "configuration": snapshot.configuration}
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
+
+
+async def async_fetch_snapshot(
+    settings: FreeAtHomeSettings, api: FreeAtHomeApi
+) -> ConfigSnapshot:
+    """Fetch the SysAP settings and configuration in a single round trip each."""
+    _, _configuration = await asyncio.gather(settings.load(), api.get_configuration())
+    return ConfigSnapshot.from_settings(settings, _configuration)
+
+
+def _datapoint_structure(datapoints: dict[str, Any]) -> dict[str, Any]:
+    """Return the datapoints without their values."""
+    return {
+        _key: {_k: _v for _k, _v in _datapoint.items() if _k != "value"}
+        for _key, _datapoint in datapoints.items()
+    }
+
+
+def _datapoint_values(channel: dict[str, Any]) -> dict[str, Any]:
+    """Return the input and output values of a channel."""
+    return {
+        _key: _datapoint.get("value")
+        for _datapoints in (channel.get("inputs", {}), channel.get("outputs", {}))
+        for _key, _datapoint in _datapoints.items()
+    }
+
+
+def configuration_structure(configuration: dict[str, Any]) -> dict[str, Any]:
+    """Return the part of the configuration devices and entities are built from."""
+    return {
+        "devices": {
+            _serial: {
+                **{_key: _device.get(_key) for _key in DEVICE_STRUCTURE_KEYS},
+                "channels": {
+                    _channel_id: {
+                        **{_key: _channel.get(_key) for _key in CHANNEL_STRUCTURE_KEYS},
+                        "inputs": _datapoint_structure(_channel.get("inputs", {})),
+                        "outputs": _datapoint_structure(_channel.get("outputs", {})),
+                    }
+                    for _channel_id, _channel in _device.get("channels", {}).items()
+                },
+            }
+            for _serial, _device in configuration.get("devices", {}).items()
+        },
+    }
+
+
+def apply_datapoint_values(
+    channels: Iterable[Any], configuration: dict[str, Any]
+) -> None:
+    """Apply the datapoint values of a configuration to the loaded channels.
+
+    Afterwards the channels hold the values of the SysAP, whatever updates the
+    websocket missed. Entities only write their state if it visibly changed.
+    """
+    _devices = configuration.get("devices", {})
+
+    for _channel in channels:
+        _channel_configuration = (
+            _devices.get(_channel.device_serial, {})
+            .get("channels", {})
+            .get(_channel.channel_id)
+        )
+        if _channel_configuration is None:
+            continue
+
+        for _key, _value in _datapoint_values(_channel_configuration).items():
+            if _value is not None:
+                _channel.update_channel(_key, _value)
+
+
+def device_names(
+    configuration: dict[str, Any],
+) -> dict[str, tuple[str | None, str | None]]:
+    """Return the name and room name of each device of the configuration."""
+    _floors = (configuration.get("floorplan") or {}).get("floors", {})
+    return {
+        _serial: (
+            _device.get("displayName"),
+            _floors.get(_device.get("floor"), {})
+            .get("rooms", {})
+            .get(_device.get("room"), {})
+            .get("name"),
+        )
+        for _serial, _device in configuration.get("devices", {}).items()
+    }
+
+
+def diff_configurations(old: dict[str, Any], new: dict[str, Any]) -> ConfigurationDiff:
+    """Compare two SysAP configurations.
+
+    Renamed or moved devices are returned with their new name and room, they
+    do not count as a structural change.
+    """
+    if configuration_structure(old) != configuration_structure(new):
+        return ConfigurationDiff(structure_changed=True)
+
+    _old_names = device_names(old)
+    return ConfigurationDiff(
+        renamed_devices={
+            _serial: _names
+            for _serial, _names in device_names(new).items()
+            if _old_names.get(_serial) != _names
+        }
+    )
@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.movement_detector import BlockableMovementDetector
 from abbfreeathome.channels.switch_actuator import (
     MWireSwitchActuator,
@@ -33,10 +32,16 @@ from homeassistant.components.switch import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
 
 SWITCH_DESCRIPTIONS = {
     "DimmingSensorLed": {
@@ -149,6 +154,8 @@ SWITCH_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(SWITCH_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -156,7 +163,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switches."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in SWITCH_DESCRIPTIONS.items():
         async_add_entities(
@@ -168,18 +175,16 @@ async def async_setup_entry(
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
             if getattr(channel, description.get("value_attribute")) is not None
         )
 
 
-class FreeAtHomeSwitchEntity(SwitchEntity):
+class FreeAtHomeSwitchEntity(FreeAtHomeEntity, SwitchEntity):
     """Defines a free@home switch entity."""
 
-    _attr_should_poll: bool = False
-
     def __init__(
         self,
         channel: BlockableMovementDetector
@@ -207,98 +212,63 @@ class FreeAtHomeSwitchEntity(SwitchEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = SwitchEntityDescription(
+        self.entity_description = shared_description(
+            SwitchEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             translation_placeholders={"channel_id": channel.channel_id},
             **entity_description_kwargs,
         )
 
+        # Switches without a translation key keep their original unique ID
+        self._identity = ChannelIdentity.from_channel(
+            channel,
+            self.entity_description.key
+            if self.entity_description.translation_key is not None
+            else "switch",
+        )
+        self._attr_unique_id = self._identity.unique_id
+        self._attr_translation_key = self.entity_description.translation_key
+
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        self._channel.register_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
-        )
+        self.async_subscribe(self._value_attribute)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        self._channel.remove_callback(
-            callback_attribute=self._value_attribute, callback=self.async_write_ha_state
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
-
-    @property
-    def translation_key(self):
-        """Return the translation key to translate the entity's name and states.
-
-        if the device_name and channel_name are the same, then this sensor is not the
-        main feature of the device and should have it's name translated.
-        """
-        _translation_key = None
-        if hasattr(self, "_attr_translation_key"):
-            _translation_key = self._attr_translation_key
-        if hasattr(self, "entity_description"):
-            _translation_key = self.entity_description.translation_key
-
-        return _translation_key
+        self.async_unsubscribe()
 
     @property
     def is_on(self) -> bool | None:
         """Return state of the switch."""
-        return getattr(self._channel, self._value_attribute)
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID.
-
-        This is for backward-compatibility, so that existing switch-unique_ids will not change.
-        """
-        if (
-            hasattr(self.entity_description, "translation_key")
-            and self.entity_description.translation_key is not None
-        ):
-            return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
-
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_switch"
+        return self.optimistic_value(
+            self._value_attribute, getattr(self._channel, self._value_attribute)
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         _method = getattr(self._channel, f"turn_on_{self._value_attribute}", None)
 
+        _optimistic = {self._value_attribute: True}
+
         if callable(_method):
-            await _method()
+            await self.async_send_command(_method, optimistic=_optimistic)
         else:
-            await self._channel.turn_on()
+            await self.async_send_command(self._channel.turn_on, optimistic=_optimistic)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         _method = getattr(self._channel, f"turn_off_{self._value_attribute}", None)
 
+        _optimistic = {self._value_attribute: False}
+
         if callable(_method):
-            await _method()
+            await self.async_send_command(_method, optimistic=_optimistic)
         else:
-            await self._channel.turn_off()
+            await self.async_send_command(
+                self._channel.turn_off, optimistic=_optimistic
+            )
 
     async def async_update(self, **kwargs: Any) -> None:
         """Update the switch state."""
-        await self._channel.refresh_state()
+        await self.async_refresh_state()
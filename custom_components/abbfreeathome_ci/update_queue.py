@@ -0,0 +1,90 @@
+"""Bounded queue of pending entity state writes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .entity import FreeAtHomeEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of state writes between two yields to the event loop, so a burst of
+# updates does not hold up receiving the next websocket message.
+UPDATE_QUEUE_BATCH_SIZE = 50
+
+
+class UpdateQueue:
+    """Queue of entities with a pending state write, with a priority lane.
+
+    Each entity is queued at most once, a later update of a queued entity is
+    written together with the pending one. A queued entity stands for its latest
+    state, so a write is never dropped: when the queue is full, the state is
+    written immediately instead. The priority lane is always drained first and
+    is not limited.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue."""
+        self._maxsize = maxsize
+        self._priority: dict[FreeAtHomeEntity, None] = {}
+        self._normal: dict[FreeAtHomeEntity, None] = {}
+        self._wakeup = asyncio.Event()
+
+        self.high_water = 0
+        self.written_inline = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending state writes."""
+        return len(self._priority) + len(self._normal)
+
+    def enqueue(self, entity: FreeAtHomeEntity, priority: bool = False) -> None:
+        """Queue a state write of the entity."""
+        _lane = self._priority if priority else self._normal
+        if entity in _lane:
+            return
+
+        if not priority and len(self) >= self._maxsize:
+            self.written_inline += 1
+            entity.async_flush_write()
+            return
+
+        _lane[entity] = None
+        self.high_water = max(self.high_water, len(self))
+        self._wakeup.set()
+
+    def discard(self, entity: FreeAtHomeEntity) -> None:
+        """Remove a pending state write of the entity."""
+        self._priority.pop(entity, None)
+        self._normal.pop(entity, None)
+
+    async def async_run(self) -> None:
+        """Write the queued states, priority lane first."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while len(self):
+                for _ in range(UPDATE_QUEUE_BATCH_SIZE):
+                    if not (_lane := self._priority or self._normal):
+                        break
+                    _entity = next(iter(_lane))
+                    del _lane[_entity]
+
+                    try:
+                        _entity.async_flush_write()
+                    except Exception:
+                        _LOGGER.exception("Error writing state of %s", _entity)
+
+                await asyncio.sleep(0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue statistics as a dictionary."""
+        return {
+            "maxsize": self._maxsize,
+            "pending": len(self),
+            "high_water": self.high_water,
+            "written_inline": self.written_inline,
+        }
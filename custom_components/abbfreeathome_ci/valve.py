@@ -2,7 +2,6 @@
 
 from typing import Any
 
-from abbfreeathome import FreeAtHome
 from abbfreeathome.channels.valve_actuator import (
     CoolingActuator,
     HeatingActuator,
@@ -17,10 +16,16 @@ from homeassistant.components.valve import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN, MANUFACTURER
+from .const import CONF_CREATE_SUBDEVICES, CONF_SERIAL, DOMAIN
+from .entity import (
+    ChannelIdentity,
+    FreeAtHomeEntity,
+    description_channel_classes,
+    shared_description,
+)
+from .models import FreeAtHomeData
 
 VALVE_DESCRIPTIONS = {
     "HeatingActuatorValve": {
@@ -65,6 +70,8 @@ VALVE_DESCRIPTIONS = {
     },
 }
 
+CHANNEL_CLASSES = description_channel_classes(VALVE_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -72,7 +79,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up valves."""
-    free_at_home: FreeAtHome = hass.data[DOMAIN][entry.entry_id]
+    data: FreeAtHomeData = hass.data[DOMAIN][entry.entry_id]
 
     for key, description in VALVE_DESCRIPTIONS.items():
         async_add_entities(
@@ -86,17 +93,15 @@ async def async_setup_entry(
                 sysap_serial_number=entry.data[CONF_SERIAL],
                 create_subdevices=entry.data[CONF_CREATE_SUBDEVICES],
             )
-            for channel in free_at_home.get_channels_by_class(
+            for channel in data.channel_index.get_channels_by_class(
                 channel_class=description.get("channel_class")
             )
         )
 
 
-class FreeAtHomeValveEntity(ValveEntity):
+class FreeAtHomeValveEntity(FreeAtHomeEntity, ValveEntity):
     """Defines a free@home valve entity."""
 
-    _attr_should_poll: bool = False
-
     def __init__(
         self,
         channel: HeatingActuator | CoolingActuator | HeatingCoolingActuator,
@@ -116,7 +121,8 @@ class FreeAtHomeValveEntity(ValveEntity):
         self._sysap_serial_number = sysap_serial_number
         self._create_subdevices = create_subdevices
 
-        self.entity_description = ValveEntityDescription(
+        self.entity_description = shared_description(
+            ValveEntityDescription,
             has_entity_name=True,
             name=channel.channel_name,
             entity_registry_enabled_default=False,
@@ -124,55 +130,29 @@ class FreeAtHomeValveEntity(ValveEntity):
             **entity_description_kwargs,
         )
 
+        # Maintain backward compatibility: use "_valve" for HeatingActuatorValve
+        self._identity = ChannelIdentity.from_channel(
+            channel,
+            "valve"
+            if self.entity_description.key == "HeatingActuatorValve"
+            else self.entity_description.key,
+        )
+        self._attr_unique_id = self._identity.unique_id
+
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
-        for callback_attribute in self._callback_attributes:
-            self._channel.register_callback(
-                callback_attribute=callback_attribute,
-                callback=self.async_write_ha_state,
-            )
+        self.async_subscribe(*self._callback_attributes)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
-        for callback_attribute in self._callback_attributes:
-            self._channel.remove_callback(
-                callback_attribute=callback_attribute,
-                callback=self.async_write_ha_state,
-            )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Information about this entity/device."""
-        if self._create_subdevices and self._channel.device.is_multi_device:
-            return DeviceInfo(
-                identifiers={
-                    (
-                        DOMAIN,
-                        f"{self._channel.device_serial}_{self._channel.channel_id}",
-                    )
-                },
-                name=f"{self._channel.device_name} ({self._channel.channel_id})",
-                manufacturer=MANUFACTURER,
-                serial_number=f"{self._channel.device_serial}_{self._channel.channel_id}",
-                hw_version=f"{self._channel.device.device_id} (sub)",
-                suggested_area=self._channel.room_name,
-                via_device=(DOMAIN, self._channel.device_serial),
-            )
-
-        return DeviceInfo(identifiers={(DOMAIN, self._channel.device_serial)})
+        self.async_unsubscribe()
 
     @property
     def current_valve_position(self) -> int | None:
         """Return position of the valve."""
-        return getattr(self._channel, self._position_attribute)
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        # Maintain backward compatibility: use "_valve" for HeatingActuatorValve
-        if self.entity_description.key == "HeatingActuatorValve":
-            return f"{self._channel.device_serial}_{self._channel.channel_id}_valve"
-        return f"{self._channel.device_serial}_{self._channel.channel_id}_{self.entity_description.key}"
+        return self.optimistic_value(
+            self._position_attribute, getattr(self._channel, self._position_attribute)
+        )
 
     @property
     def supported_features(self) -> int | None:
@@ -181,8 +161,12 @@ class FreeAtHomeValveEntity(ValveEntity):
 
     async def async_set_valve_position(self, position: int) -> None:
         """Move the valve to a specific position."""
-        await getattr(self._channel, self._set_position_method)(position)
+        await self.async_send_latest_command(
+            getattr(self._channel, self._set_position_method),
+            position,
+            optimistic={self._position_attribute: position},
+        )
 
     async def async_update(self, **kwargs: Any) -> None:
         """Update the valve state."""
-        await self._channel.refresh_state()
+        await self.async_refresh_state()
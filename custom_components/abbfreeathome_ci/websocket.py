@@ -0,0 +1,176 @@
+"""Websocket supervision of the ABB-free@home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+from enum import StrEnum
+import logging
+import random
+import time
+from typing import Any
+
+from abbfreeathome import FreeAtHome
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# A connection which lasted the stable period resets the backoff.
+WS_STABLE_AFTER = 60
+WS_BACKOFF_MIN = 1
+WS_BACKOFF_MAX = 300
+
+
+class ConnectionState(StrEnum):
+    """State of the websocket connection to the SysAP."""
+
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    BACKOFF = "backoff"
+    STOPPED = "stopped"
+
+
+class WebsocketSupervisor:
+    """Keep the websocket connection to the SysAP alive.
+
+    The connection only counts as established once the API reports the
+    websocket as connected through `async_connected`.
+    """
+
+    def __init__(
+        self,
+        free_at_home: FreeAtHome,
+        async_resync: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize the supervisor."""
+        self._free_at_home = free_at_home
+        self._async_resync = async_resync
+        self._callbacks: list[Callable[[], None]] = []
+        self._task: asyncio.Task | None = None
+        self._resync: asyncio.Task | None = None
+
+        self.state = ConnectionState.STOPPED
+        self.connects = 0
+        self.disconnects = 0
+        self.last_error: str | None = None
+        self.connected_since: float | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the websocket is connected."""
+        return self.state is ConnectionState.CONNECTED
+
+    def register_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run when the connection state changes."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Remove a registered callback."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _set_state(self, state: ConnectionState) -> None:
+        """Change the connection state and notify the registered callbacks."""
+        if state is self.state:
+            return
+
+        _LOGGER.debug("Websocket %s -> %s", self.state, state)
+        self.state = state
+        for _callback in self._callbacks:
+            _callback()
+
+    def async_start(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Start supervising the websocket as a background task of the entry."""
+        self._task = entry.async_create_background_task(
+            hass, self.async_run(), f"{DOMAIN}_ws"
+        )
+
+    async def async_stop(self) -> None:
+        """Stop supervising and close the websocket."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def async_run(self) -> None:
+        """Listen on the websocket and reconnect with backoff when it drops."""
+        _delay = WS_BACKOFF_MIN
+
+        try:
+            while True:
+                self._set_state(ConnectionState.CONNECTING)
+                _started = time.monotonic()
+                await self._async_listen()
+
+                # Only back off from the minimum again after a stable connection
+                if time.monotonic() - _started >= WS_STABLE_AFTER:
+                    _delay = WS_BACKOFF_MIN
+
+                self._set_state(ConnectionState.BACKOFF)
+                _sleep = _delay / 2 + random.uniform(0, _delay / 2)
+                _LOGGER.debug("Reconnecting websocket in %.1f seconds", _sleep)
+                await asyncio.sleep(_sleep)
+                _delay = min(_delay * 2, WS_BACKOFF_MAX)
+        finally:
+            self._set_state(ConnectionState.STOPPED)
+
+    @callback
+    def async_connected(self) -> None:
+        """Mark the websocket as connected, called when the API opened it."""
+        # A connect while connected means the library reconnected by itself
+        if self.state is ConnectionState.CONNECTED:
+            self.disconnects += 1
+
+        self.connects += 1
+        self.connected_since = time.time()
+        self._set_state(ConnectionState.CONNECTED)
+
+        # Values may have changed while the websocket was down, resync next to
+        # listening so a dropped connection is still noticed.
+        if self.connects > 1 and (self._resync is None or self._resync.done()):
+            self._resync = asyncio.create_task(self._async_run_resync())
+
+    async def _async_listen(self) -> None:
+        """Run a single websocket session until it ends."""
+        try:
+            await self._free_at_home.ws_listen()
+        except Exception as e:
+            self.last_error = repr(e)
+            _LOGGER.debug("Websocket connection failed", exc_info=True)
+        finally:
+            if self._resync is not None and not self._resync.done():
+                self._resync.cancel()
+            self._resync = None
+
+            if self.state is ConnectionState.CONNECTED:
+                self.disconnects += 1
+            self.connected_since = None
+
+            # Release the connection the library might still hold
+            with contextlib.suppress(Exception):
+                await self._free_at_home.ws_close()
+
+    async def _async_run_resync(self) -> None:
+        """Resync the channel states, a failure does not end the session."""
+        try:
+            await self._async_resync()
+        except Exception:
+            _LOGGER.exception("Failed to resync the channel states after reconnecting")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the connection health as a dictionary."""
+        return {
+            "state": self.state,
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "last_error": self.last_error,
+            "connected_since": self.connected_since,
+        }
@@ -1,14 +1,22 @@
 """Test ABB-free@home binary sensor."""
 
-from unittest.mock import MagicMock
+import gc
+from unittest.mock import AsyncMock, MagicMock
+import weakref
 
 from abbfreeathome.channels.window_door_sensor import WindowDoorSensor
 
 from custom_components.abbfreeathome_ci.binary_sensor import (
     FreeAtHomeBinarySensorEntity,
+    FreeAtHomeWebsocketBinarySensorEntity,
     async_setup_entry,
 )
 from custom_components.abbfreeathome_ci.const import DOMAIN
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
+from custom_components.abbfreeathome_ci.websocket import (
+    ConnectionState,
+    WebsocketSupervisor,
+)
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.core import HomeAssistant
 
@@ -19,9 +27,13 @@ async def test_async_setup_entry_no_sensors(
     """Test setup with no binary sensors."""
     mock_config_entry.add_to_hass(hass)
 
-    mock_free_at_home = MagicMock()
-    mock_free_at_home.get_channels_by_class.return_value = []
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    mock_channel_index = MagicMock()
+    mock_channel_index.get_channels_by_class.return_value = []
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     async_add_entities = MagicMock()
     await async_setup_entry(hass, mock_config_entry, async_add_entities)
@@ -46,7 +58,7 @@ async def test_async_setup_entry_with_window_sensor(
     mock_channel.state = True
     mock_channel.device.is_multi_device = False
 
-    mock_free_at_home = MagicMock()
+    mock_channel_index = MagicMock()
 
     def get_channels_by_class_side_effect(channel_class):
         """Return channels only for WindowDoorSensor."""
@@ -54,10 +66,14 @@ async def test_async_setup_entry_with_window_sensor(
             return [mock_channel]
         return []
 
-    mock_free_at_home.get_channels_by_class.side_effect = (
+    mock_channel_index.get_channels_by_class.side_effect = (
         get_channels_by_class_side_effect
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -174,14 +190,14 @@ async def test_binary_sensor_entity_callbacks(hass: HomeAssistant) -> None:
     await entity.async_added_to_hass()
     mock_channel.register_callback.assert_called_once_with(
         callback_attribute="state",
-        callback=entity.async_write_ha_state,
+        callback=entity.async_schedule_write,
     )
 
     # Test callback removal
     await entity.async_will_remove_from_hass()
     mock_channel.remove_callback.assert_called_once_with(
         callback_attribute="state",
-        callback=entity.async_write_ha_state,
+        callback=entity.async_schedule_write,
     )
 
 
@@ -230,7 +246,7 @@ async def test_binary_sensor_filters_none_values(
     mock_channel_without_state = MagicMock()
     mock_channel_without_state.state = None
 
-    mock_free_at_home = MagicMock()
+    mock_channel_index = MagicMock()
 
     def get_channels_by_class_side_effect(channel_class):
         """Return channels only for WindowDoorSensor."""
@@ -238,10 +254,14 @@ async def test_binary_sensor_filters_none_values(
             return [mock_channel_with_state, mock_channel_without_state]
         return []
 
-    mock_free_at_home.get_channels_by_class.side_effect = (
+    mock_channel_index.get_channels_by_class.side_effect = (
         get_channels_by_class_side_effect
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -287,36 +307,70 @@ async def test_binary_sensor_entity_description(hass: HomeAssistant) -> None:
     }
 
 
-async def test_binary_sensor_translation_key_with_attr(hass: HomeAssistant) -> None:
-    """Test translation_key property with _attr_translation_key."""
-    mock_channel = MagicMock(spec=WindowDoorSensor)
-    mock_channel.channel_name = "Test Window"
-    mock_channel.channel_id = "ch0006"
-    mock_channel.device_serial = "ABB7F57FFFE12345"
-    mock_channel.state = False
+async def test_binary_sensor_shared_description(hass: HomeAssistant) -> None:
+    """Test the identity is computed once and descriptions are shared."""
+
+    def _entity(channel_id: str) -> FreeAtHomeBinarySensorEntity:
+        mock_channel = MagicMock(spec=WindowDoorSensor)
+        mock_channel.channel_name = "Test Window"
+        mock_channel.channel_id = channel_id
+        mock_channel.device_serial = "ABB7F57FFFE12345"
+        mock_channel.state = False
+
+        return FreeAtHomeBinarySensorEntity(
+            channel=mock_channel,
+            value_attribute="state",
+            entity_description_kwargs={
+                "key": "WindowDoorSensorOnOff",
+                "device_class": BinarySensorDeviceClass.WINDOW,
+                "translation_key": "window_door",
+            },
+            sysap_serial_number="TEST123456",
+            create_subdevices=False,
+        )
+
+    entity = _entity("ch0006")
+    assert entity.translation_key == "window_door"
+    assert entity.unique_id == "ABB7F57FFFE12345_ch0006_WindowDoorSensorOnOff"
 
-    entity = FreeAtHomeBinarySensorEntity(
-        channel=mock_channel,
-        value_attribute="state",
-        entity_description_kwargs={
-            "key": "WindowDoorSensorOnOff",
-            "device_class": BinarySensorDeviceClass.WINDOW,
-            "translation_key": "window_door",
-        },
-        sysap_serial_number="TEST123456",
-        create_subdevices=False,
+    # Entities of channels with the same name and channel id share a description
+    assert _entity("ch0006").entity_description is entity.entity_description
+    assert _entity("ch0007").entity_description is not entity.entity_description
+
+    # The description is released with the last entity using it
+    description = weakref.ref(entity.entity_description)
+    del entity
+    gc.collect()
+    assert description() is None
+
+
+async def test_websocket_binary_sensor() -> None:
+    """Test the websocket sensor follows the connection state."""
+    websocket = WebsocketSupervisor(MagicMock(), AsyncMock())
+    entity = FreeAtHomeWebsocketBinarySensorEntity(
+        websocket, sysap_serial_number="TEST123456"
     )
+    entity.async_write_ha_state = MagicMock()
 
-    # Set _attr_translation_key to test that code path
-    entity._attr_translation_key = "custom_translation"
+    assert entity.unique_id == "TEST123456_Websocket"
+    assert entity.device_info == {"identifiers": {(DOMAIN, "TEST123456")}}
+    assert entity.entity_description.device_class == (
+        BinarySensorDeviceClass.CONNECTIVITY
+    )
 
-    # The entity_description.translation_key should still take precedence
-    assert entity.translation_key == "window_door"
+    await entity.async_added_to_hass()
+    assert entity.is_on is False
 
-    # But if we delete the entity_description, _attr_translation_key should be used
-    entity_description_backup = entity.entity_description
-    delattr(entity, "entity_description")
-    assert entity.translation_key == "custom_translation"
+    websocket._set_state(ConnectionState.CONNECTED)
+    entity.async_write_ha_state.assert_called_once()
+    assert entity.is_on is True
+    assert entity.extra_state_attributes == {
+        "connection_state": ConnectionState.CONNECTED,
+        "connects": 0,
+        "disconnects": 0,
+    }
 
-    # Restore for cleanup
-    entity.entity_description = entity_description_backup
+    # A removed sensor is no longer written
+    await entity.async_will_remove_from_hass()
+    websocket._set_state(ConnectionState.BACKOFF)
+    entity.async_write_ha_state.assert_called_once()
@@ -11,6 +11,7 @@ from custom_components.abbfreeathome_ci.button import (
     async_setup_entry,
 )
 from custom_components.abbfreeathome_ci.const import DOMAIN
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
 from homeassistant.core import HomeAssistant
 
 
@@ -20,16 +21,20 @@ async def test_async_setup_entry_no_buttons(
     """Test setup with no button entities."""
     mock_config_entry.add_to_hass(hass)
 
-    mock_free_at_home = MagicMock()
-    mock_free_at_home.get_channels_by_class.return_value = []
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    mock_channel_index = MagicMock()
+    mock_channel_index.get_channels_by_class.return_value = []
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     async_add_entities = MagicMock()
     await async_setup_entry(hass, mock_config_entry, async_add_entities)
 
     assert async_add_entities.call_count == len(BUTTON_DESCRIPTIONS)
-    mock_free_at_home.get_channels_by_class.assert_any_call(channel_class=Trigger)
-    mock_free_at_home.get_channels_by_class.assert_any_call(
+    mock_channel_index.get_channels_by_class.assert_any_call(channel_class=Trigger)
+    mock_channel_index.get_channels_by_class.assert_any_call(
         channel_class=VirtualTrigger
     )
 
@@ -49,11 +54,15 @@ async def test_async_setup_entry_with_trigger(
     mock_channel.room_name = "Entrance"
     mock_channel.device.is_multi_device = False
 
-    mock_free_at_home = MagicMock()
-    mock_free_at_home.get_channels_by_class.side_effect = lambda channel_class: (
+    mock_channel_index = MagicMock()
+    mock_channel_index.get_channels_by_class.side_effect = lambda channel_class: (
         [mock_channel] if channel_class is Trigger else []
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -171,8 +180,8 @@ async def test_button_entity_multiple_channels(
     mock_channel3.channel_id = "ch0002"
     mock_channel3.device_serial = "ABB7F57FFFE67890"
 
-    mock_free_at_home = MagicMock()
-    mock_free_at_home.get_channels_by_class.side_effect = lambda channel_class: (
+    mock_channel_index = MagicMock()
+    mock_channel_index.get_channels_by_class.side_effect = lambda channel_class: (
         [
             mock_channel1,
             mock_channel2,
@@ -181,7 +190,11 @@ async def test_button_entity_multiple_channels(
         if channel_class is Trigger
         else []
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -218,11 +231,15 @@ async def test_async_setup_entry_with_virtual_trigger(
     mock_channel.room_name = "Hallway"
     mock_channel.device.is_multi_device = False
 
-    mock_free_at_home = MagicMock()
-    mock_free_at_home.get_channels_by_class.side_effect = lambda channel_class: (
+    mock_channel_index = MagicMock()
+    mock_channel_index.get_channels_by_class.side_effect = lambda channel_class: (
         [mock_channel] if channel_class is VirtualTrigger else []
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -0,0 +1,174 @@
+"""Test the ABB-free@home command scheduler."""
+
+import asyncio
+
+import pytest
+
+from custom_components.abbfreeathome_ci.commands import CommandScheduler
+
+
+async def test_command_scheduler_concurrency() -> None:
+    """Test no more than the maximum commands run at the same time."""
+    scheduler = CommandScheduler(max_concurrent=2)
+    release = asyncio.Event()
+    running = 0
+    most_running = 0
+
+    async def command() -> str:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await release.wait()
+        running -= 1
+        return "done"
+
+    tasks = [
+        asyncio.create_task(scheduler.async_execute(f"device{i}", command))
+        for i in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert running == 2
+    assert len(scheduler) == 3
+
+    release.set()
+    assert await asyncio.gather(*tasks) == ["done"] * 5
+    assert most_running == 2
+    assert scheduler.as_dict() | {"wait": None} == {
+        "max_concurrent": 2,
+        "active": 0,
+        "queued": 0,
+        "high_water": 3,
+        "executed": 5,
+        "failed": 0,
+        "coalesced": 0,
+        "shared": 0,
+        "wait": None,
+    }
+    assert scheduler.wait_times.count == 5
+
+
+async def test_command_scheduler_fairness() -> None:
+    """Test devices take turns once commands have to wait."""
+    scheduler = CommandScheduler(max_concurrent=1)
+    release = asyncio.Event()
+    order = []
+
+    async def command(name: str) -> None:
+        await release.wait()
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(
+            scheduler.async_execute(device, lambda n=f"{device}{i}": command(n))
+        )
+        for device, i in (("a", 1), ("a", 2), ("a", 3), ("b", 1), ("c", 1))
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["a1", "a2", "b1", "c1", "a3"]
+
+
+async def test_command_scheduler_failure() -> None:
+    """Test a failing command is raised to the caller and frees its slot."""
+    scheduler = CommandScheduler(max_concurrent=1)
+
+    async def command() -> None:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await scheduler.async_execute("device", command)
+
+    assert scheduler.failed == 1
+    assert scheduler.as_dict()["active"] == 0
+
+
+async def test_command_scheduler_cancelled() -> None:
+    """Test a cancelled waiting command is skipped."""
+    scheduler = CommandScheduler(max_concurrent=1)
+    release = asyncio.Event()
+    executed = []
+
+    async def command(name: str) -> None:
+        await release.wait()
+        executed.append(name)
+
+    first = asyncio.create_task(scheduler.async_execute("a", lambda: command("a")))
+    second = asyncio.create_task(scheduler.async_execute("b", lambda: command("b")))
+    third = asyncio.create_task(scheduler.async_execute("c", lambda: command("c")))
+    await asyncio.sleep(0)
+
+    second.cancel()
+    release.set()
+    await asyncio.gather(first, third)
+
+    assert executed == ["a", "c"]
+    assert scheduler.as_dict()["active"] == 0
+
+
+async def test_command_scheduler_latest() -> None:
+    """Test newer values replace a pending command of the same control."""
+    scheduler = CommandScheduler(max_concurrent=4)
+    release = asyncio.Event()
+    sent = []
+
+    async def set_brightness(value: int) -> int:
+        sent.append(value)
+        await release.wait()
+        return value
+
+    key = ("ABB7F500E17A", "ch0003", "set_brightness")
+    tasks = [
+        asyncio.create_task(
+            scheduler.async_execute_latest(
+                "ABB7F500E17A", key, lambda v=value: set_brightness(v)
+            )
+        )
+        for value in (10, 20, 30, 40)
+    ]
+    await asyncio.sleep(0)
+    assert sent == [10]
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [10, None, None, 40]
+    assert sent == [10, 40]
+    assert scheduler.coalesced == 2
+    assert not scheduler._latest
+
+
+async def test_command_scheduler_shared() -> None:
+    """Test concurrent requests of the same key share a single request."""
+    scheduler = CommandScheduler(max_concurrent=4)
+    release = asyncio.Event()
+    sent = 0
+
+    async def refresh_state() -> str:
+        nonlocal sent
+        sent += 1
+        await release.wait()
+        return "refreshed"
+
+    key = ("ABB7F500E17A", "ch0003")
+    tasks = [
+        asyncio.create_task(
+            scheduler.async_execute_shared("ABB7F500E17A", key, refresh_state)
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    # A cancelled caller does not cancel the shared request
+    tasks[0].cancel()
+    release.set()
+    assert await asyncio.gather(*tasks[1:]) == ["refreshed"] * 2
+    assert sent == 1
+    assert scheduler.shared == 2
+    assert not scheduler._in_flight
+
+    # A later request is sent again
+    assert (
+        await scheduler.async_execute_shared("ABB7F500E17A", key, refresh_state)
+        == "refreshed"
+    )
+    assert sent == 2
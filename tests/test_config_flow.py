@@ -16,12 +16,19 @@ from custom_components.abbfreeathome_ci.config_flow import (
     validate_settings,
 )
 from custom_components.abbfreeathome_ci.const import (
+    CONF_COMMAND_CONCURRENCY,
     CONF_CREATE_SUBDEVICES,
     CONF_INCLUDE_ORPHAN_CHANNELS,
     CONF_INCLUDE_VIRTUAL_DEVICES,
+    CONF_OPTIMISTIC_TIMEOUT,
+    CONF_RETAIN_CONFIGURATION,
     CONF_SERIAL,
     CONF_SSL_CERT_FILE_PATH,
+    CONF_UPDATE_QUEUE_SIZE,
     CONF_VERIFY_SSL,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_OPTIMISTIC_TIMEOUT,
+    DEFAULT_RETAIN_CONFIGURATION,
     DOMAIN,
 )
 from homeassistant import config_entries
@@ -1259,3 +1266,27 @@ async def test_show_form_with_sysap_version(
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "user"
     assert result["description_placeholders"]["sysap_version"] == "2.6.0"
+
+
+async def test_options_flow(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test the options flow configures the update queue."""
+    await hass.config_entries.async_add(mock_config_entry)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_UPDATE_QUEUE_SIZE: 200,
+        },
+    )
+
+    assert result2["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options == {
+        CONF_UPDATE_QUEUE_SIZE: 200,
+        CONF_COMMAND_CONCURRENCY: DEFAULT_COMMAND_CONCURRENCY,
+        CONF_OPTIMISTIC_TIMEOUT: DEFAULT_OPTIMISTIC_TIMEOUT,
+        CONF_RETAIN_CONFIGURATION: DEFAULT_RETAIN_CONFIGURATION,
+    }
@@ -0,0 +1,78 @@
+"""Test the ABB-free@home device registry sync."""
+
+from unittest.mock import MagicMock
+
+from custom_components.abbfreeathome_ci.const import DOMAIN
+from custom_components.abbfreeathome_ci.devices import (
+    DeviceInfoCache,
+    async_sync_devices,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+
+async def test_async_sync_devices(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test only new or changed devices touch the device registry."""
+    mock_config_entry.add_to_hass(hass)
+
+    device_registry = dr.async_get(hass)
+    device_registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={(DOMAIN, "TEST123456")},
+    )
+
+    mock_device = MagicMock()
+    mock_device.device_serial = "DEVICE123"
+    mock_device.display_name = "Test Device"
+    mock_device.device_id = "HW123"
+    mock_device.room_name = "Living Room"
+
+    mock_free_at_home = MagicMock()
+    mock_free_at_home.get_devices.return_value = {"DEVICE123": mock_device}
+    mock_free_at_home.get_channels_by_device.return_value = [MagicMock()]
+
+    result = async_sync_devices(hass, mock_config_entry, mock_free_at_home)
+    assert (result.created, result.updated, result.skipped) == (1, 0, 0)
+
+    result = async_sync_devices(hass, mock_config_entry, mock_free_at_home)
+    assert (result.created, result.updated, result.skipped) == (0, 0, 1)
+
+    mock_device.display_name = "Renamed Device"
+    result = async_sync_devices(hass, mock_config_entry, mock_free_at_home)
+    assert (result.created, result.updated, result.skipped) == (0, 1, 0)
+
+    device_entry = device_registry.async_get_device(identifiers={(DOMAIN, "DEVICE123")})
+    assert device_entry.name == "Renamed Device"
+
+
+def test_device_info_cache() -> None:
+    """Test entities of the same device or sub device share their DeviceInfo."""
+    device = MagicMock(device_id="4800", is_multi_device=True)
+    channels = [
+        MagicMock(
+            device=device,
+            device_serial="DEVICE123",
+            device_name="Multi Device",
+            channel_id=channel_id,
+            room_name="Bedroom",
+        )
+        for channel_id in ("ch0000", "ch0001")
+    ]
+    cache = DeviceInfoCache()
+
+    assert cache.get(channels[0], False) is cache.get(channels[1], False)
+    assert cache.get(channels[0], False)["identifiers"] == {(DOMAIN, "DEVICE123")}
+
+    sub_device_info = cache.get(channels[1], True)
+    assert sub_device_info is cache.get(channels[1], True)
+    assert sub_device_info is not cache.get(channels[0], True)
+    assert sub_device_info["identifiers"] == {(DOMAIN, "DEVICE123_ch0001")}
+    assert sub_device_info["name"] == "Multi Device (ch0001)"
+    assert sub_device_info["via_device"] == (DOMAIN, "DEVICE123")
+    assert len(cache) == 3
+
+    # A renamed device gets a new DeviceInfo once invalidated
+    channels[1].device_name = "Renamed Device"
+    cache.invalidate("DEVICE123")
+    assert not len(cache)
+    assert cache.get(channels[1], True)["name"] == "Renamed Device (ch0001)"
@@ -0,0 +1,88 @@
+"""Test the ABB-free@home diagnostics."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from abbfreeathome.bin.function import Function
+from abbfreeathome.bin.pairing import Pairing
+from abbfreeathome.bin.parameter import Parameter
+
+from custom_components.abbfreeathome_ci.const import DOMAIN
+from custom_components.abbfreeathome_ci.diagnostics import (
+    async_get_config_entry_diagnostics,
+    diagnostics_configuration,
+)
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+
+
+def test_diagnostics_configuration() -> None:
+    """Test the configuration is redacted and annotated in one pass."""
+    parameter = next(iter(Parameter))
+    pairing = next(iter(Pairing))
+    function = next(iter(Function))
+    configuration = {
+        "sysapName": "My SysAP",
+        "devices": {
+            "ABB7F500E17A": {
+                "displayName": "Device",
+                "parameters": {f"par{parameter.value:04x}": "1", "parzzzz": "2"},
+                "channels": {
+                    "ch0000": {
+                        "functionID": f"{function.value:x}",
+                        "parameters": {},
+                        "inputs": {
+                            "idp0000": {"value": "0", "pairingID": pairing.value}
+                        },
+                        "outputs": {"odp0000": {"value": "0", "pairingID": -1}},
+                    }
+                },
+            }
+        },
+    }
+
+    diagnostics = diagnostics_configuration(configuration)
+
+    assert diagnostics["sysapName"] == REDACTED
+    device = diagnostics["devices"]["ABB7F500E17A"]
+    assert device["parameterNames"] == {
+        f"{parameter.name} (par{parameter.value:04x})": "1",
+        "UNKNOWN (parzzzz)": "2",
+    }
+
+    channel = device["channels"]["ch0000"]
+    assert list(channel) == sorted(channel)
+    assert channel["function"] == function.name
+    assert channel["inputs"]["idp0000"] == {
+        "pairing": pairing.name,
+        "pairingID": pairing.value,
+        "value": "0",
+    }
+    assert channel["outputs"]["odp0000"]["pairing"] == "UNKNOWN"
+
+    # The fetched configuration is left untouched
+    assert configuration["sysapName"] == "My SysAP"
+    original = configuration["devices"]["ABB7F500E17A"]["channels"]["ch0000"]
+    assert "pairing" not in original["inputs"]["idp0000"]
+
+
+async def test_config_entry_diagnostics(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test the runtime metrics are kept apart from the configuration."""
+    mock_config_entry.add_to_hass(hass)
+    free_at_home = MagicMock()
+    free_at_home.get_config = AsyncMock(
+        return_value={"sysapName": "My SysAP", "devices": {}}
+    )
+    free_at_home.get_devices.return_value = {}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=free_at_home, channel_index=MagicMock()
+        )
+    }
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["configuration"] == {"sysapName": REDACTED, "devices": {}}
+    assert diagnostics["runtime"]["memory"]["channels"] == 0
+    assert diagnostics["runtime"]["websocket"] is None
+    assert diagnostics["runtime"]["commands"] is None
@@ -0,0 +1,74 @@
+"""Test the ABB-free@home channel dispatcher."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.abbfreeathome_ci.dispatcher import ChannelDispatcher
+
+
+def _channel() -> MagicMock:
+    """Create a channel which runs its registered callbacks on update."""
+    channel = MagicMock()
+    channel.device_serial = "ABB7F500E17A"
+    channel.channel_id = "ch0003"
+    channel.callbacks = {}
+    channel.register_callback.side_effect = lambda callback_attribute, callback: (
+        channel.callbacks.setdefault(callback_attribute, []).append(callback)
+    )
+    channel.remove_callback.side_effect = lambda callback_attribute, callback: (
+        channel.callbacks[callback_attribute].remove(callback)
+    )
+    return channel
+
+
+def test_dispatcher_subscribe() -> None:
+    """Test subscribers share a single callback per channel attribute."""
+    dispatcher = ChannelDispatcher()
+    channel = _channel()
+    light, sensor = MagicMock(), MagicMock()
+
+    unsubscribe_light = dispatcher.subscribe(channel, ("state", "brightness"), light)
+    unsubscribe_sensor = dispatcher.subscribe(channel, ("state",), sensor)
+
+    assert channel.register_callback.call_count == 2
+    assert dispatcher.as_dict() == {"attributes": 2, "subscriptions": 3}
+
+    channel.callbacks["state"][0]()
+    light.assert_called_once()
+    sensor.assert_called_once()
+
+    channel.callbacks["brightness"][0]()
+    assert light.call_count == 2
+    sensor.assert_called_once()
+
+    # The channel callback is removed with its last subscriber
+    unsubscribe_light()
+    assert channel.callbacks == {"state": channel.callbacks["state"], "brightness": []}
+    assert dispatcher.as_dict() == {"attributes": 1, "subscriptions": 1}
+
+    unsubscribe_sensor()
+    assert channel.callbacks == {"state": [], "brightness": []}
+    assert dispatcher.as_dict() == {"attributes": 0, "subscriptions": 0}
+
+    # Unsubscribing twice does nothing
+    unsubscribe_sensor()
+    assert channel.remove_callback.call_count == 2
+
+
+async def test_dispatcher_received_at() -> None:
+    """Test the arrival of a websocket message is kept for its callbacks only."""
+    dispatcher = ChannelDispatcher()
+    channel = _channel()
+    received_at = []
+
+    dispatcher.subscribe(
+        channel, ("state",), lambda: received_at.append(dispatcher.received_at)
+    )
+
+    dispatcher.async_message_received(123.0)
+    channel.callbacks["state"][0]()
+    await asyncio.sleep(0)
+
+    # Callbacks after the message was applied have no arrival time
+    channel.callbacks["state"][0]()
+    assert received_at == [123.0, None]
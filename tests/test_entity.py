@@ -0,0 +1,251 @@
+"""Test the ABB-free@home base entity."""
+
+import asyncio
+from datetime import timedelta
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.abbfreeathome_ci.commands import CommandScheduler
+from custom_components.abbfreeathome_ci.dispatcher import ChannelDispatcher
+from custom_components.abbfreeathome_ci.entity import FreeAtHomeEntity
+from custom_components.abbfreeathome_ci.metrics import (
+    OptimisticMetrics,
+    StateWriteMetrics,
+    UpdateLatencyMetrics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+async def test_async_schedule_write(hass: HomeAssistant) -> None:
+    """Test several attribute callbacks result in a single state write."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+
+    entity.async_schedule_write()
+    entity.async_schedule_write()
+    entity.async_schedule_write()
+    entity.async_write_ha_state.assert_not_called()
+
+    await asyncio.sleep(0)
+    entity.async_write_ha_state.assert_called_once()
+
+    # A later update which changes the state is written again
+    entity._attr_available = False
+    entity.async_schedule_write()
+    await asyncio.sleep(0)
+    assert entity.async_write_ha_state.call_count == 2
+
+
+async def test_async_schedule_write_unchanged(hass: HomeAssistant) -> None:
+    """Test state writes are suppressed when nothing visible changed."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+    entity._write_metrics = StateWriteMetrics()
+
+    entity.async_schedule_write()
+    await asyncio.sleep(0)
+    entity.async_schedule_write()
+    await asyncio.sleep(0)
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._write_metrics.as_dict() == {"written": 1, "suppressed": 1}
+
+
+async def test_async_schedule_write_removed(hass: HomeAssistant) -> None:
+    """Test a pending state write is dropped when the entity is removed."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+
+    entity.async_schedule_write()
+    await entity.async_internal_will_remove_from_hass()
+    await asyncio.sleep(0)
+
+    entity.async_write_ha_state.assert_not_called()
+
+
+async def test_async_schedule_write_latency(hass: HomeAssistant) -> None:
+    """Test the latency of a state update is recorded for the platform."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity.platform = MagicMock(domain="switch")
+    entity.async_write_ha_state = MagicMock()
+    entity._update_latency = UpdateLatencyMetrics()
+
+    entity.async_schedule_write()
+    entity.async_schedule_write()
+    await asyncio.sleep(0)
+
+    assert entity._update_latency.as_dict()["switch"]["total"]["count"] == 1
+
+
+async def test_async_schedule_write_latency_from_arrival(
+    hass: HomeAssistant,
+) -> None:
+    """Test the latency is measured from the arrival of the websocket message."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity.platform = MagicMock(domain="switch")
+    entity.async_write_ha_state = MagicMock()
+    entity._update_latency = UpdateLatencyMetrics()
+    entity._dispatcher = ChannelDispatcher()
+
+    entity._dispatcher.async_message_received(time.monotonic() - 2)
+    entity.async_schedule_write()
+    await asyncio.sleep(0)
+
+    assert entity._update_latency.platforms["switch"]["queue"].max >= 2
+
+    # Updates which were not received on the websocket start at the callback
+    entity._update_latency = UpdateLatencyMetrics()
+    entity._written_state = None
+    entity.async_schedule_write()
+    await asyncio.sleep(0)
+
+    assert entity._update_latency.platforms["switch"]["queue"].max < 2
+
+
+async def test_async_subscribe(hass: HomeAssistant) -> None:
+    """Test entities subscribe to the channel through the dispatcher."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity._channel = MagicMock(device_serial="ABB7F500E17A", channel_id="ch0003")
+    entity._dispatcher = ChannelDispatcher()
+
+    entity.async_subscribe("state", "brightness")
+    assert entity._channel.register_callback.call_count == 2
+    assert entity._dispatcher.as_dict() == {"attributes": 2, "subscriptions": 2}
+
+    entity.async_unsubscribe()
+    assert entity._channel.remove_callback.call_count == 2
+    assert entity._dispatcher.as_dict() == {"attributes": 0, "subscriptions": 0}
+
+
+async def test_async_refresh_state(hass: HomeAssistant) -> None:
+    """Test concurrent refreshes of a channel share a single request."""
+    entity = FreeAtHomeEntity()
+    entity.hass = hass
+    entity._channel = MagicMock(
+        device_serial="DEVICE123", channel_id="ch0000", refresh_state=AsyncMock()
+    )
+
+    await entity.async_refresh_state()
+    entity._channel.refresh_state.assert_awaited_once()
+
+    entity._command_scheduler = CommandScheduler(max_concurrent=4)
+    await asyncio.gather(entity.async_refresh_state(), entity.async_refresh_state())
+
+    assert entity._channel.refresh_state.await_count == 2
+    assert entity._command_scheduler.shared == 1
+
+
+class _OptimisticEntity(FreeAtHomeEntity):
+    """Entity showing the optimistic state of its channel."""
+
+    @property
+    def state(self) -> Any:
+        """Return the state of the channel."""
+        return self.optimistic_value("state", self._channel.state)
+
+
+def _optimistic_entity(hass: HomeAssistant) -> _OptimisticEntity:
+    """Create an entity with optimistic state enabled."""
+    entity = _OptimisticEntity()
+    entity.hass = hass
+    entity._channel = MagicMock(state="off")
+    entity.async_write_ha_state = MagicMock()
+    entity._optimistic_timeout = 5
+    entity._optimistic_metrics = OptimisticMetrics()
+    return entity
+
+
+async def test_optimistic_confirmed(hass: HomeAssistant) -> None:
+    """Test the commanded state is shown until the channel confirms it."""
+    entity = _optimistic_entity(hass)
+
+    await entity.async_send_command(AsyncMock(), optimistic={"state": "on"})
+    assert entity.state == "on"
+    entity.async_write_ha_state.assert_called_once()
+
+    entity._channel.state = "on"
+    entity.async_flush_write()
+
+    assert entity._optimistic_metrics.as_dict() == {"confirmed": 1, "rolled_back": 0}
+    assert entity._unsub_optimistic is None
+
+
+async def test_optimistic_confirmed_after_sent(hass: HomeAssistant) -> None:
+    """Test the commanded state is only confirmed once the command is sent."""
+    entity = _optimistic_entity(hass)
+
+    async def _command() -> None:
+        # The channel reports the commanded state before the command returns
+        entity._channel.state = "on"
+        assert entity.state == "on"
+        entity.async_flush_write()
+        assert entity._optimistic_state == {"state": "on"}
+
+    await entity.async_send_command(_command, optimistic={"state": "on"})
+
+    assert entity._optimistic_state == {}
+    assert entity._optimistic_metrics.as_dict() == {"confirmed": 1, "rolled_back": 0}
+    assert entity._unsub_optimistic is None
+
+
+async def test_async_send_batch(hass: HomeAssistant) -> None:
+    """Test the commands of a batch are sent with one optimistic state."""
+    entity = _optimistic_entity(hass)
+    commands = [AsyncMock(), AsyncMock()]
+
+    await entity.async_send_batch(commands, optimistic={"state": "on"})
+
+    for command in commands:
+        command.assert_awaited_once()
+    assert entity.state == "on"
+    assert entity._unsub_optimistic is not None
+
+
+async def test_optimistic_rolled_back(hass: HomeAssistant) -> None:
+    """Test the commanded state is rolled back without a confirmation."""
+    entity = _optimistic_entity(hass)
+
+    await entity.async_send_command(AsyncMock(), optimistic={"state": "on"})
+    assert entity.state == "on"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert entity.state == "off"
+    assert entity.async_write_ha_state.call_count == 2
+    assert entity._optimistic_metrics.as_dict() == {"confirmed": 0, "rolled_back": 1}
+
+
+async def test_optimistic_command_failed(hass: HomeAssistant) -> None:
+    """Test the commanded state is cleared when the command fails."""
+    entity = _optimistic_entity(hass)
+
+    with pytest.raises(ValueError):
+        await entity.async_send_command(
+            AsyncMock(side_effect=ValueError), optimistic={"state": "on"}
+        )
+
+    assert entity.state == "off"
+    assert entity._unsub_optimistic is None
+
+
+async def test_optimistic_disabled(hass: HomeAssistant) -> None:
+    """Test the channel state is shown when optimistic state is disabled."""
+    entity = _optimistic_entity(hass)
+    entity._optimistic_timeout = None
+
+    await entity.async_send_command(AsyncMock(), optimistic={"state": "on"})
+
+    assert entity.state == "off"
+    entity.async_write_ha_state.assert_not_called()
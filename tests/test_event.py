@@ -0,0 +1,95 @@
+"""Test ABB-free@home event."""
+
+from unittest.mock import MagicMock
+
+from custom_components.abbfreeathome_ci.event import (
+    EVENT_DESCRIPTIONS,
+    FreeAtHomeEventEntity,
+)
+
+
+def _event_entity(key: str, channel: MagicMock) -> FreeAtHomeEventEntity:
+    """Create an event entity of a description with a mocked event trigger."""
+    description = EVENT_DESCRIPTIONS[key]
+    channel.channel_name = "Channel"
+    channel.channel_id = "ch0000"
+
+    entity = FreeAtHomeEventEntity(
+        channel,
+        state_attribute=description.get("state_attribute"),
+        entity_description_kwargs={"key": key}
+        | description.get("entity_description_kwargs"),
+        sysap_serial_number="TEST123456",
+        create_subdevices=False,
+        event_type=description.get("event_type"),
+        event_type_map=description.get("event_type_map"),
+        extra_data=description.get("extra_data"),
+    )
+    entity._trigger_event = MagicMock()
+    entity.async_write_ha_state = MagicMock()
+    return entity
+
+
+def test_event_state() -> None:
+    """Test the state of the channel is the event type."""
+    channel = MagicMock(spec=["state"])
+    entity = _event_entity("EventSwitchSensorOnOff", channel)
+
+    channel.state = "On"
+    entity._async_handle_event()
+
+    entity._trigger_event.assert_called_once_with("On", {"extra_data": None})
+    entity.async_write_ha_state.assert_called_once()
+
+
+def test_event_unknown_state() -> None:
+    """Test no event is triggered for an unknown state."""
+    channel = MagicMock(spec=["state"])
+    entity = _event_entity("EventSwitchSensorOnOff", channel)
+
+    channel.state = "Unknown"
+    entity._async_handle_event()
+
+    entity._trigger_event.assert_not_called()
+
+
+def test_event_type_map() -> None:
+    """Test a requested state is mapped to its event type."""
+    channel = MagicMock(spec=["requested_state"])
+    entity = _event_entity("EventVirtualSwitchActuatorOnOff", channel)
+
+    for requested_state, event_type in ((True, "On"), (False, "Off"), (None, "Off")):
+        channel.requested_state = requested_state
+        entity._async_handle_event()
+        entity._trigger_event.assert_called_with(event_type, {"extra_data": None})
+
+
+def test_event_type_constant() -> None:
+    """Test a constant event type with extra data."""
+    channel = MagicMock(spec=["requested_target_temperature"])
+    channel.requested_target_temperature = 21.5
+    entity = _event_entity(
+        "EventVirtualRoomTemperatureControllerTargetTemperature", channel
+    )
+
+    entity._async_handle_event()
+
+    entity._trigger_event.assert_called_once_with(
+        "requested_target_temperature", {"extra_data": 21.5}
+    )
+
+
+async def test_event_callback_registration() -> None:
+    """Test the callback is registered on the state attribute."""
+    channel = MagicMock()
+    entity = _event_entity("EventDesDoorRingingSensorActivated", channel)
+
+    await entity.async_added_to_hass()
+    channel.register_callback.assert_called_once_with(
+        callback_attribute="state", callback=entity._async_handle_event
+    )
+
+    await entity.async_will_remove_from_hass()
+    channel.remove_callback.assert_called_once_with(
+        callback_attribute="state", callback=entity._async_handle_event
+    )
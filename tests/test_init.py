@@ -1,5 +1,6 @@
 """Test the ABB-free@home integration initialization."""
 
+import importlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from abbfreeathome.exceptions import BadRequestException
@@ -7,13 +8,21 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.abbfreeathome_ci import (
+    PLATFORMS,
+    _async_reconcile_snapshot,
+    _async_update_listener,
+    _required_platforms,
     async_migrate_entry,
+    async_rebuild_channel_index,
+    async_refresh_channels,
     async_remove_config_entry_device,
+    async_remove_entry,
     async_setup,
     async_setup_entry,
     async_setup_service,
     async_unload_entry,
 )
+from custom_components.abbfreeathome_ci.commands import CommandScheduler
 from custom_components.abbfreeathome_ci.const import (
     CONF_CREATE_SUBDEVICES,
     CONF_INCLUDE_ORPHAN_CHANNELS,
@@ -22,11 +31,18 @@ from custom_components.abbfreeathome_ci.const import (
     CONF_SSL_CERT_FILE_PATH,
     CONF_VERIFY_SSL,
     DOMAIN,
+    PLATFORM_CHANNEL_CLASSES,
     VIRTUAL_DEVICE,
 )
-from homeassistant.config_entries import SOURCE_IMPORT
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
+from custom_components.abbfreeathome_ci.snapshot import (
+    ConfigSnapshot,
+    ConfigSnapshotStore,
+)
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
 
 
 @pytest.fixture
@@ -46,6 +62,7 @@ def mock_free_at_home():
     mock.ws_close = AsyncMock()
     mock.unload_device = MagicMock()
     mock.api = MagicMock()
+    mock.api.get_configuration = AsyncMock(return_value={"devices": {}})
     mock.api.virtualdevice = AsyncMock()
     return mock
 
@@ -108,7 +125,9 @@ async def test_async_setup_entry_http(
             "custom_components.abbfreeathome_ci.FreeAtHome",
             return_value=mock_free_at_home,
         ),
-        patch("custom_components.abbfreeathome_ci.FreeAtHomeApi") as mock_api_class,
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHomeSnapshotApi"
+        ) as mock_api_class,
         patch(
             "custom_components.abbfreeathome_ci.async_get_clientsession"
         ) as mock_session,
@@ -126,9 +145,20 @@ async def test_async_setup_entry_http(
     assert DOMAIN in hass.data
     assert mock_config_entry.entry_id in hass.data[DOMAIN]
     mock_free_at_home_settings.load.assert_called_once()
-    mock_free_at_home.get_config.assert_called_once()
+    mock_free_at_home.api.get_configuration.assert_called_once()
+    mock_free_at_home.get_config.assert_not_called()
     mock_free_at_home.load.assert_called_once()
-    # Verify FreeAtHomeApi was instantiated with wait_for_result=False
+    setup_timings = hass.data[DOMAIN][mock_config_entry.entry_id].setup_timings
+    assert setup_timings.total is not None
+    assert set(setup_timings.phases) == {
+        "snapshot_load",
+        "config_fetch",
+        "library_load",
+        "device_sync",
+        "platform_binary_sensor",
+        "platform_sensor",
+    }
+    # Verify FreeAtHomeSnapshotApi was instantiated with wait_for_result=False
     mock_api_class.assert_called_once()
     call_kwargs = mock_api_class.call_args.kwargs
     assert call_kwargs["wait_for_result"] is False
@@ -173,7 +203,9 @@ async def test_async_setup_entry_https_without_verification(
             "custom_components.abbfreeathome_ci.FreeAtHome",
             return_value=mock_free_at_home,
         ),
-        patch("custom_components.abbfreeathome_ci.FreeAtHomeApi") as mock_api_class,
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHomeSnapshotApi"
+        ) as mock_api_class,
         patch("custom_components.abbfreeathome_ci.async_get_clientsession"),
         patch("custom_components.abbfreeathome_ci._LOGGER") as mock_logger,
         patch(
@@ -187,7 +219,7 @@ async def test_async_setup_entry_https_without_verification(
     assert result is True
     mock_logger.warning.assert_called_once()
     assert "without SSL verification" in mock_logger.warning.call_args[0][0]
-    # Verify FreeAtHomeApi was instantiated with wait_for_result=False
+    # Verify FreeAtHomeSnapshotApi was instantiated with wait_for_result=False
     mock_api_class.assert_called_once()
     call_kwargs = mock_api_class.call_args.kwargs
     assert call_kwargs["wait_for_result"] is False
@@ -232,7 +264,9 @@ async def test_async_setup_entry_https_with_verification(
             "custom_components.abbfreeathome_ci.FreeAtHome",
             return_value=mock_free_at_home,
         ),
-        patch("custom_components.abbfreeathome_ci.FreeAtHomeApi") as mock_api_class,
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHomeSnapshotApi"
+        ) as mock_api_class,
         patch("custom_components.abbfreeathome_ci.async_get_clientsession"),
         patch("custom_components.abbfreeathome_ci._LOGGER") as mock_logger,
         patch(
@@ -246,7 +280,7 @@ async def test_async_setup_entry_https_with_verification(
     assert result is True
     mock_logger.info.assert_called_once()
     assert "SSL certificate verification enabled" in mock_logger.info.call_args[0][0]
-    # Verify FreeAtHomeApi was instantiated with wait_for_result=False
+    # Verify FreeAtHomeSnapshotApi was instantiated with wait_for_result=False
     mock_api_class.assert_called_once()
     call_kwargs = mock_api_class.call_args.kwargs
     assert call_kwargs["wait_for_result"] is False
@@ -309,7 +343,11 @@ async def test_async_unload_entry(
     hass: HomeAssistant, mock_config_entry, mock_free_at_home
 ) -> None:
     """Test unloading a config entry."""
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=mock_free_at_home, channel_index=MagicMock()
+        )
+    }
 
     with patch(
         "homeassistant.config_entries.ConfigEntries.async_unload_platforms",
@@ -326,7 +364,12 @@ async def test_async_remove_config_entry_device(
     hass: HomeAssistant, mock_config_entry, mock_free_at_home
 ) -> None:
     """Test removing a device from a config entry."""
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    mock_channel_index = MagicMock()
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=mock_free_at_home, channel_index=mock_channel_index
+        )
+    }
 
     mock_device_entry = MagicMock()
     mock_device_entry.identifiers = {(DOMAIN, "DEVICE123")}
@@ -337,6 +380,38 @@ async def test_async_remove_config_entry_device(
 
     assert result is True
     mock_free_at_home.unload_device.assert_called_once_with("DEVICE123")
+    mock_channel_index.rebuild.assert_called_once()
+
+
+async def test_async_update_listener(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test changed options reload the config entry."""
+    mock_config_entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "async_reload") as mock_reload:
+        await _async_update_listener(hass, mock_config_entry)
+
+    mock_reload.assert_called_once_with(mock_config_entry.entry_id)
+
+
+async def test_async_remove_entry(
+    hass: HomeAssistant, hass_storage, mock_config_entry
+) -> None:
+    """Test removing a config entry removes its configuration snapshot."""
+    await ConfigSnapshotStore(hass, mock_config_entry.entry_id).async_save(
+        ConfigSnapshot(
+            settings={
+                "name": "Test SysAP",
+                "version": "3.0.0",
+                "hardware_version": "1.0",
+            },
+            configuration={"devices": {}},
+        )
+    )
+
+    await async_remove_entry(hass, mock_config_entry)
+
+    store = ConfigSnapshotStore(hass, mock_config_entry.entry_id)
+    assert await store.async_load() is None
 
 
 async def test_async_migrate_entry_from_v1_0(hass: HomeAssistant) -> None:
@@ -508,7 +583,7 @@ async def test_async_setup_entry_with_devices(
         pass
 
     mock_fah = MagicMock()
-    mock_fah.get_config = AsyncMock()
+    mock_fah.api.get_configuration = AsyncMock(return_value={"devices": {}})
     mock_fah.load = AsyncMock()
     mock_fah.get_devices = MagicMock(return_value={"DEVICE123": mock_device})
     mock_fah.get_channels_by_device = MagicMock(return_value=[mock_channel])
@@ -702,7 +777,7 @@ async def test_async_setup_service_already_registered(
         pass
 
     mock_fah = MagicMock()
-    mock_fah.get_config = AsyncMock()
+    mock_fah.api.get_configuration = AsyncMock(return_value={"devices": {}})
     mock_fah.load = AsyncMock()
     mock_fah.get_devices = MagicMock(return_value={})
     mock_fah.get_channels_by_device = MagicMock(return_value=[])
@@ -794,7 +869,9 @@ async def test_virtual_device_service(hass: HomeAssistant) -> None:
     # Create mock FreeAtHome object
     mock_fah = MagicMock()
     mock_fah.api.virtualdevice = AsyncMock(return_value={"status": "success"})
-    hass.data[DOMAIN] = {entry.entry_id: mock_fah}
+    hass.data[DOMAIN] = {
+        entry.entry_id: FreeAtHomeData(free_at_home=mock_fah, channel_index=MagicMock())
+    }
 
     # Setup the service
     await async_setup_service(hass, entry)
@@ -867,7 +944,9 @@ async def test_virtual_device_service_minimal_data(hass: HomeAssistant) -> None:
     # Create mock FreeAtHome object
     mock_fah = MagicMock()
     mock_fah.api.virtualdevice = AsyncMock(return_value={"status": "ok"})
-    hass.data[DOMAIN] = {entry.entry_id: mock_fah}
+    hass.data[DOMAIN] = {
+        entry.entry_id: FreeAtHomeData(free_at_home=mock_fah, channel_index=MagicMock())
+    }
 
     # Setup the service
     await async_setup_service(hass, entry)
@@ -914,7 +993,7 @@ async def test_async_setup_entry_device_without_channels(
         pass
 
     mock_fah = MagicMock()
-    mock_fah.get_config = AsyncMock()
+    mock_fah.api.get_configuration = AsyncMock(return_value={"devices": {}})
     mock_fah.load = AsyncMock()
     mock_fah.get_devices = MagicMock(return_value={"DEVICE999": mock_device})
     mock_fah.get_channels_by_device = MagicMock(return_value=[])  # No channels
@@ -1018,7 +1097,9 @@ async def test_async_unload_entry_failure(
     # Create mock FreeAtHome object
     mock_fah = MagicMock()
     mock_fah.ws_close = AsyncMock()
-    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = mock_fah
+    hass.data.setdefault(DOMAIN, {})[mock_config_entry.entry_id] = FreeAtHomeData(
+        free_at_home=mock_fah, channel_index=MagicMock()
+    )
 
     with patch(
         "homeassistant.config_entries.ConfigEntries.async_unload_platforms",
@@ -1031,3 +1112,584 @@ async def test_async_unload_entry_failure(
     mock_fah.ws_close.assert_called_once()
     # Verify entry data was NOT removed (because unload failed)
     assert mock_config_entry.entry_id in hass.data[DOMAIN]
+
+
+async def test_async_setup_entry_warm_start(
+    hass: HomeAssistant,
+    hass_storage,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test setup builds devices from the snapshot without fetching the config."""
+    mock_config_entry.add_to_hass(hass)
+
+    _key = f"{DOMAIN}.{mock_config_entry.entry_id}.snapshot"
+    hass_storage[_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": _key,
+        "data": {
+            "settings": {
+                "name": "Test SysAP",
+                "version": "3.0.0",
+                "hardware_version": "1.0",
+            },
+            "configuration": {"devices": {}},
+        },
+    }
+
+    with (
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHomeSettings",
+            return_value=mock_free_at_home_settings,
+        ),
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHome",
+            return_value=mock_free_at_home,
+        ),
+        patch("custom_components.abbfreeathome_ci.async_get_clientsession"),
+        patch(
+            "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.abbfreeathome_ci._async_reconcile_snapshot",
+            new_callable=AsyncMock,
+        ) as mock_reconcile,
+    ):
+        result = await async_setup_entry(hass, mock_config_entry)
+        await hass.async_block_till_done()
+
+    assert result is True
+    mock_free_at_home.api.get_configuration.assert_not_called()
+    mock_free_at_home_settings.load.assert_not_called()
+    mock_free_at_home.load.assert_called_once()
+    mock_reconcile.assert_awaited_once()
+
+
+async def test_reconcile_snapshot_structure_changed(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test a structural configuration change reloads the config entry."""
+    mock_config_entry.add_to_hass(hass)
+
+    mock_free_at_home.api.get_configuration = AsyncMock(
+        return_value={"devices": {"DEVICE123": {"channels": {"ch0000": {}}}}}
+    )
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    snapshot = ConfigSnapshot(
+        settings={"name": "Test SysAP", "version": "3.0.0", "hardware_version": "1.0"},
+        configuration={"devices": {"DEVICE123": {"channels": {}}}},
+    )
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        await _async_reconcile_snapshot(
+            hass,
+            mock_config_entry,
+            free_at_home=mock_free_at_home,
+            settings=mock_free_at_home_settings,
+            store=store,
+            snapshot=snapshot,
+        )
+
+    store.async_save.assert_called_once()
+    mock_schedule_reload.assert_called_once_with(mock_config_entry.entry_id)
+
+
+async def test_reconcile_snapshot_device_renamed(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test a renamed or moved device is updated without a reload."""
+    mock_config_entry.add_to_hass(hass)
+
+    def _configuration(name: str, room: str) -> dict:
+        return {
+            "floorplan": {
+                "floors": {
+                    "01": {"rooms": {"01": {"name": "Kitchen"}, "02": {"name": "Hall"}}}
+                }
+            },
+            "devices": {
+                "DEVICE123": {
+                    "displayName": name,
+                    "floor": "01",
+                    "room": room,
+                    "channels": {"ch0000": {}},
+                }
+            },
+        }
+
+    mock_free_at_home.get_devices.return_value = {
+        "DEVICE123": MagicMock(
+            device_serial="DEVICE123",
+            device_id="B001",
+            display_name="Old",
+            room_name="Kitchen",
+        )
+    }
+    mock_free_at_home.get_channels_by_device.return_value = [
+        MagicMock(device_serial="DEVICE123", channel_id="ch0000")
+    ]
+    mock_free_at_home.api.get_configuration = AsyncMock(
+        return_value=_configuration("New", "02")
+    )
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    snapshot = ConfigSnapshot(
+        settings={"name": "Test SysAP", "version": "3.0.0", "hardware_version": "1.0"},
+        configuration=_configuration("Old", "01"),
+    )
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        await _async_reconcile_snapshot(
+            hass,
+            mock_config_entry,
+            free_at_home=mock_free_at_home,
+            settings=mock_free_at_home_settings,
+            store=store,
+            snapshot=snapshot,
+        )
+
+    mock_schedule_reload.assert_not_called()
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "DEVICE123")})
+    assert device.name == "New"
+
+
+async def test_reconcile_snapshot_values_changed(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test the live datapoint values are applied to every channel."""
+    mock_config_entry.add_to_hass(hass)
+
+    def _configuration(value: str) -> dict:
+        return {
+            "devices": {
+                "DEVICE123": {
+                    "channels": {
+                        "ch0000": {"outputs": {"odp0000": {"value": value}}},
+                        "ch0001": {"outputs": {"odp0000": {"value": "0"}}},
+                    }
+                }
+            }
+        }
+
+    mock_changed_channel = MagicMock(device_serial="DEVICE123", channel_id="ch0000")
+    mock_unchanged_channel = MagicMock(device_serial="DEVICE123", channel_id="ch0001")
+
+    mock_free_at_home.get_devices.return_value = {
+        "DEVICE123": MagicMock(device_serial="DEVICE123")
+    }
+    mock_free_at_home.get_channels_by_device.return_value = [
+        mock_changed_channel,
+        mock_unchanged_channel,
+    ]
+    mock_free_at_home.api.get_configuration = AsyncMock(
+        return_value=_configuration("1")
+    )
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    snapshot = ConfigSnapshot(
+        settings={"name": "Test SysAP", "version": "3.0.0", "hardware_version": "1.0"},
+        configuration=_configuration("0"),
+    )
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        await _async_reconcile_snapshot(
+            hass,
+            mock_config_entry,
+            free_at_home=mock_free_at_home,
+            settings=mock_free_at_home_settings,
+            store=store,
+            snapshot=snapshot,
+        )
+
+    mock_schedule_reload.assert_not_called()
+    mock_changed_channel.update_channel.assert_called_once_with("odp0000", "1")
+    mock_unchanged_channel.update_channel.assert_called_once_with("odp0000", "0")
+    mock_changed_channel.refresh_state.assert_not_called()
+    mock_unchanged_channel.refresh_state.assert_not_called()
+
+
+async def test_reconcile_snapshot_without_snapshot(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test the live configuration is kept when there is no snapshot to compare."""
+    mock_config_entry.add_to_hass(hass)
+    configuration = {
+        "devices": {
+            "DEVICE123": {
+                "channels": {"ch0000": {"outputs": {"odp0000": {"value": "1"}}}}
+            }
+        }
+    }
+
+    mock_channel = MagicMock(device_serial="DEVICE123", channel_id="ch0000")
+    mock_free_at_home.get_devices.return_value = {
+        "DEVICE123": MagicMock(device_serial="DEVICE123")
+    }
+    mock_free_at_home.get_channels_by_device.return_value = [mock_channel]
+    mock_free_at_home.api.get_configuration = AsyncMock(return_value=configuration)
+    store = MagicMock()
+    store.async_save = AsyncMock()
+
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        await _async_reconcile_snapshot(
+            hass,
+            mock_config_entry,
+            free_at_home=mock_free_at_home,
+            settings=mock_free_at_home_settings,
+            store=store,
+            snapshot=None,
+        )
+
+    mock_schedule_reload.assert_not_called()
+    store.async_save.assert_called_once()
+    assert store.async_save.call_args.args[0].configuration == configuration
+    mock_channel.update_channel.assert_called_once_with("odp0000", "1")
+
+
+async def test_resync_after_reconnect_value_changed_back(
+    hass: HomeAssistant,
+    hass_storage,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test a value which changed and changed back during an outage is resynced."""
+    mock_config_entry.add_to_hass(hass)
+
+    class SwitchActuator:
+        """Stand-in for a switch actuator channel."""
+
+        device_serial = "DEVICE123"
+        channel_id = "ch0000"
+
+        def __init__(self) -> None:
+            self.outputs = {"odp0000": "0"}
+
+        def update_channel(self, datapoint_key: str, datapoint_value: str) -> None:
+            self.outputs[datapoint_key] = datapoint_value
+
+    channel = SwitchActuator()
+    mock_device = MagicMock(device_serial="DEVICE123", device_id="HW123")
+    mock_device.display_name = "Test Device"
+    mock_device.room_name = "Living Room"
+    mock_free_at_home.get_devices.return_value = {"DEVICE123": mock_device}
+    mock_free_at_home.get_channels_by_device.return_value = [channel]
+    mock_free_at_home.api.get_configuration = AsyncMock(
+        return_value={
+            "devices": {
+                "DEVICE123": {
+                    "channels": {"ch0000": {"outputs": {"odp0000": {"value": "0"}}}}
+                }
+            }
+        }
+    )
+
+    with (
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHomeSettings",
+            return_value=mock_free_at_home_settings,
+        ),
+        patch(
+            "custom_components.abbfreeathome_ci.FreeAtHome",
+            return_value=mock_free_at_home,
+        ),
+        patch("custom_components.abbfreeathome_ci.async_get_clientsession"),
+        patch(
+            "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+            return_value=AsyncMock(),
+        ),
+    ):
+        assert await async_setup_entry(hass, mock_config_entry)
+
+    # The websocket turned the channel on, then it dropped and the channel was
+    # turned off again on the SysAP. The live configuration equals the snapshot.
+    channel.update_channel("odp0000", "1")
+
+    data = hass.data[DOMAIN][mock_config_entry.entry_id]
+    with patch.object(
+        hass.config_entries, "async_schedule_reload"
+    ) as mock_schedule_reload:
+        await data.websocket._async_resync()
+
+    mock_schedule_reload.assert_not_called()
+    assert mock_free_at_home.api.get_configuration.call_count == 2
+    assert channel.outputs == {"odp0000": "0"}
+
+    await data.websocket.async_stop()
+
+
+@pytest.mark.parametrize("platform", PLATFORMS)
+def test_platform_channel_classes(platform: Platform) -> None:
+    """Test the platform channel classes match the channel classes of the platform."""
+    _module = importlib.import_module(f"custom_components.abbfreeathome_ci.{platform}")
+
+    assert set(PLATFORM_CHANNEL_CLASSES) == set(PLATFORMS)
+    assert PLATFORM_CHANNEL_CLASSES[platform] == _module.CHANNEL_CLASSES
+
+
+def test_required_platforms() -> None:
+    """Test only platforms with matching channels are required."""
+
+    class SwitchActuator:
+        """Stand-in for the switch actuator channel class."""
+
+    mock_channel_index = MagicMock()
+    mock_channel_index.channel_classes = {SwitchActuator}
+    data = FreeAtHomeData(free_at_home=MagicMock(), channel_index=mock_channel_index)
+
+    assert _required_platforms(data) == {
+        Platform.BINARY_SENSOR,
+        Platform.SELECT,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    }
+
+    # Platforms hosting the SysAP diagnostic sensors are always required
+    mock_channel_index.channel_classes = set()
+    assert _required_platforms(data) == {
+        Platform.BINARY_SENSOR,
+        Platform.SENSOR,
+    }
+
+
+async def test_async_rebuild_channel_index(
+    hass: HomeAssistant, mock_config_entry, mock_free_at_home
+) -> None:
+    """Test platforms for new channel classes are set up after loading."""
+
+    class Trigger:
+        """Stand-in for the trigger channel class."""
+
+    mock_config_entry.mock_state(hass, ConfigEntryState.LOADED)
+    mock_channel_index = MagicMock()
+    mock_channel_index.channel_classes = {Trigger}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=mock_free_at_home,
+            channel_index=mock_channel_index,
+            platforms={Platform.BINARY_SENSOR, Platform.SENSOR, Platform.SWITCH},
+        )
+    }
+
+    with patch(
+        "homeassistant.config_entries.ConfigEntries.async_late_forward_entry_setups",
+    ) as mock_late_forward:
+        await async_rebuild_channel_index(hass, mock_config_entry)
+
+    mock_late_forward.assert_called_once_with(mock_config_entry, [Platform.BUTTON])
+    assert hass.data[DOMAIN][mock_config_entry.entry_id].platforms == {
+        Platform.BINARY_SENSOR,
+        Platform.BUTTON,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    }
+    assert "platform_button" in (
+        hass.data[DOMAIN][mock_config_entry.entry_id].setup_timings.phases
+    )
+
+
+async def test_config_change_forwards_new_platform(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_free_at_home,
+    mock_free_at_home_settings,
+) -> None:
+    """Test a platform for a channel class added on the SysAP is set up."""
+    mock_config_entry.add_to_hass(hass)
+
+    class SwitchActuator:
+        """Stand-in for the switch actuator channel class."""
+
+        device_serial = "DEVICE123"
+        channel_id = "ch0000"
+
+    class Trigger:
+        """Stand-in for the trigger channel class."""
+
+        device_serial = "DEVICE123"
+        channel_id = "ch0001"
+
+    mock_device = MagicMock(device_serial="DEVICE123", device_id="HW123")
+    mock_device.display_name = "Test Device"
+    mock_device.room_name = "Living Room"
+    mock_free_at_home.get_devices.return_value = {"DEVICE123": mock_device}
+    mock_free_at_home.get_channels_by_device.return_value = [SwitchActuator()]
+
+    async def _async_setup_entry() -> set[Platform]:
+        with (
+            patch(
+                "custom_components.abbfreeathome_ci.FreeAtHomeSettings",
+                return_value=mock_free_at_home_settings,
+            ),
+            patch(
+                "custom_components.abbfreeathome_ci.FreeAtHome",
+                return_value=mock_free_at_home,
+            ),
+            patch("custom_components.abbfreeathome_ci.async_get_clientsession"),
+            patch(
+                "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+                return_value=AsyncMock(),
+            ) as mock_forward,
+        ):
+            assert await async_setup_entry(hass, mock_config_entry)
+
+        await hass.data[DOMAIN][mock_config_entry.entry_id].websocket.async_stop()
+        return {call.args[1][0] for call in mock_forward.call_args_list}
+
+    assert Platform.BUTTON not in await _async_setup_entry()
+
+    # A trigger channel was added on the SysAP, the reload sets up its platform
+    mock_free_at_home.get_channels_by_device.return_value = [
+        SwitchActuator(),
+        Trigger(),
+    ]
+    assert Platform.BUTTON in await _async_setup_entry()
+
+
+async def test_refresh_state_service(
+    hass: HomeAssistant, mock_config_entry, mock_free_at_home
+) -> None:
+    """Test the refresh_state service refreshes the channels of the devices."""
+    mock_config_entry.add_to_hass(hass)
+
+    channels = {
+        (serial, channel_id): MagicMock(
+            device_serial=serial, channel_id=channel_id, refresh_state=AsyncMock()
+        )
+        for serial in ("DEVICE123", "DEVICE456")
+        for channel_id in ("ch0000", "ch0001")
+    }
+    mock_free_at_home.get_devices.return_value = {
+        serial: MagicMock(device_serial=serial) for serial in ("DEVICE123", "DEVICE456")
+    }
+    mock_free_at_home.get_channels_by_device.side_effect = lambda serial: [
+        channel for (_serial, _), channel in channels.items() if _serial == serial
+    ]
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=mock_free_at_home,
+            channel_index=MagicMock(),
+            command_scheduler=CommandScheduler(max_concurrent=4),
+        )
+    }
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={(DOMAIN, "DEVICE123")},
+    )
+    sub_device = device_registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={(DOMAIN, "DEVICE456_ch0001")},
+    )
+
+    await async_setup_service(hass, mock_config_entry)
+
+    # Only the channels of the selected device and sub device
+    await hass.services.async_call(
+        DOMAIN,
+        "refresh_state",
+        {"device_id": [device.id, sub_device.id]},
+        blocking=True,
+    )
+    assert [channel.refresh_state.call_count for channel in channels.values()] == [
+        1,
+        1,
+        0,
+        1,
+    ]
+
+    # Without devices or areas everything is refreshed
+    await hass.services.async_call(DOMAIN, "refresh_state", {}, blocking=True)
+    assert [channel.refresh_state.call_count for channel in channels.values()] == [
+        2,
+        2,
+        1,
+        2,
+    ]
+
+
+async def test_refresh_channels_configuration_fetch(
+    hass: HomeAssistant, mock_config_entry, mock_free_at_home
+) -> None:
+    """Test many channels are refreshed with a single configuration fetch."""
+    mock_config_entry.add_to_hass(hass)
+
+    def _configuration(changed: str) -> dict:
+        return {
+            "devices": {
+                "DEVICE123": {
+                    "channels": {
+                        f"ch{index:04}": {"outputs": {"odp0000": {"value": changed}}}
+                        if index == 3
+                        else {"outputs": {"odp0000": {"value": "0"}}}
+                        for index in range(30)
+                    }
+                }
+            }
+        }
+
+    channels = [
+        MagicMock(
+            device_serial="DEVICE123",
+            channel_id=f"ch{index:04}",
+            refresh_state=AsyncMock(),
+        )
+        for index in range(30)
+    ]
+    mock_free_at_home.api.get_configuration = AsyncMock(
+        return_value=_configuration("1")
+    )
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    # The channels are compared against the fetched values, not the snapshot
+    store.async_get = AsyncMock(
+        return_value=ConfigSnapshot(
+            settings={
+                "name": "Test SysAP",
+                "version": "3.0.0",
+                "hardware_version": "1.0",
+            },
+            configuration=_configuration("1"),
+        )
+    )
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=mock_free_at_home,
+            channel_index=MagicMock(),
+            snapshot_store=store,
+        )
+    }
+
+    await async_refresh_channels(hass, mock_config_entry, channels)
+
+    mock_free_at_home.api.get_configuration.assert_called_once()
+    store.async_save.assert_called_once()
+    for channel in channels:
+        channel.refresh_state.assert_not_called()
+        channel.update_channel.assert_called_once_with(
+            "odp0000", "1" if channel.channel_id == "ch0003" else "0"
+        )
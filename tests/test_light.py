@@ -1,5 +1,6 @@
 """Test for light platform."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -9,6 +10,7 @@ from custom_components.abbfreeathome_ci.light import (
     FreeAtHomeLightEntity,
     async_setup_entry,
 )
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_COLOR_TEMP_KELVIN,
@@ -133,20 +135,24 @@ def mock_unavailable_light_channel():
 
 
 @pytest.fixture
-def mock_free_at_home():
-    """Create a mock FreeAtHome API object."""
-    api = Mock()
-    api.get_channels_by_class = Mock(return_value=[])
-    return api
+def mock_channel_index():
+    """Create a mock channel index."""
+    channel_index = Mock()
+    channel_index.get_channels_by_class = Mock(return_value=[])
+    return channel_index
 
 
 async def test_async_setup_entry_no_devices(
-    hass: HomeAssistant, mock_config_entry, mock_free_at_home
+    hass: HomeAssistant, mock_config_entry, mock_channel_index
 ):
     """Test setup entry with no light devices."""
-    mock_free_at_home.get_channels_by_class.return_value = []
+    mock_channel_index.get_channels_by_class.return_value = []
 
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=Mock(), channel_index=mock_channel_index
+        )
+    }
 
     async_add_entities = Mock()
 
@@ -159,13 +165,17 @@ async def test_async_setup_entry_no_devices(
 async def test_async_setup_entry_with_devices(
     hass: HomeAssistant,
     mock_config_entry,
-    mock_free_at_home,
+    mock_channel_index,
     mock_simple_light_channel,
 ):
     """Test setup entry with light devices."""
-    mock_free_at_home.get_channels_by_class.return_value = [mock_simple_light_channel]
+    mock_channel_index.get_channels_by_class.return_value = [mock_simple_light_channel]
 
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=Mock(), channel_index=mock_channel_index
+        )
+    }
 
     async_add_entities = Mock()
 
@@ -388,6 +398,41 @@ async def test_async_turn_on_color_temp_light_with_color_temp(
     assert 45 <= call_args <= 55
 
 
+async def test_async_turn_on_color_temp_light_turns_on(
+    hass: HomeAssistant, mock_color_temp_light_channel
+):
+    """Test turning on with only a color temperature also turns the light on."""
+    entity = FreeAtHomeLightEntity(
+        mock_color_temp_light_channel,
+        sysap_serial_number="SERIAL123",
+        create_subdevices=False,
+    )
+    entity.hass = hass
+
+    await entity.async_turn_on(**{ATTR_COLOR_TEMP_KELVIN: 4000})
+
+    mock_color_temp_light_channel.turn_on.assert_called_once()
+    mock_color_temp_light_channel.set_brightness.assert_not_called()
+    # The color temperature is sent as a whole number
+    mock_color_temp_light_channel.set_color_temperature.assert_called_once_with(34)
+
+
+async def test_async_turn_on_simple_light_with_color_temp(
+    hass: HomeAssistant, mock_simple_light_channel
+):
+    """Test a color temperature is ignored by a light without one."""
+    entity = FreeAtHomeLightEntity(
+        mock_simple_light_channel,
+        sysap_serial_number="SERIAL123",
+        create_subdevices=False,
+    )
+    entity.hass = hass
+
+    await entity.async_turn_on(**{ATTR_COLOR_TEMP_KELVIN: 4000})
+
+    mock_simple_light_channel.turn_on.assert_called_once()
+
+
 async def test_async_turn_off_simple_light(
     hass: HomeAssistant, mock_simple_light_channel
 ):
@@ -557,3 +602,41 @@ async def test_async_turn_on_color_temp_without_attribute(
     # Since color temp is not supported, the function returns early and doesn't call anything
     mock_simple_light_channel.turn_on.assert_not_called()
     mock_simple_light_channel.set_brightness.assert_not_called()
+
+
+async def test_async_turn_on_with_brightness_and_color_temp(
+    hass: HomeAssistant, mock_color_temp_light_channel
+):
+    """Test brightness and color temperature are written at the same time."""
+    entity = FreeAtHomeLightEntity(
+        mock_color_temp_light_channel,
+        sysap_serial_number="SERIAL123",
+        create_subdevices=False,
+    )
+    entity.hass = hass
+
+    # Both writes are issued before either of them completes
+    started = []
+    both_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _write(value):
+        started.append(value)
+        if len(started) == 2:
+            both_started.set()
+        await release.wait()
+
+    mock_color_temp_light_channel.set_brightness.side_effect = _write
+    mock_color_temp_light_channel.set_color_temperature.side_effect = _write
+
+    task = hass.async_create_task(
+        entity.async_turn_on(**{ATTR_BRIGHTNESS: 255, ATTR_COLOR_TEMP_KELVIN: 4600})
+    )
+    await asyncio.wait_for(both_started.wait(), 1)
+
+    release.set()
+    await task
+
+    mock_color_temp_light_channel.set_brightness.assert_called_once_with(100)
+    mock_color_temp_light_channel.set_color_temperature.assert_called_once()
+    mock_color_temp_light_channel.turn_on.assert_not_called()
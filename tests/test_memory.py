@@ -0,0 +1,66 @@
+"""Test the ABB-free@home memory accounting."""
+
+import sys
+
+from custom_components.abbfreeathome_ci.memory import (
+    MemoryReport,
+    measure_memory,
+    retained_size,
+)
+
+
+class _Channel:
+    """Object with attributes, like a channel of the library."""
+
+    def __init__(self, name: str, device: object) -> None:
+        self.name = name
+        self.device = device
+        self.datapoints = {"odp0000": "0"}
+
+
+def test_retained_size() -> None:
+    """Test shared objects count once and only roots are followed."""
+    device = _Channel("device", None)
+    channels = [_Channel(f"channel {i}", device) for i in range(2)]
+
+    seen: set[int] = set()
+    size = retained_size(channels, seen)
+
+    # The attributes of the device are not followed, it only counts once
+    assert id(device) in seen
+    assert id(device.datapoints) not in seen
+    assert size > 2 * sys.getsizeof(channels[0]) + sys.getsizeof(device)
+
+    # Objects already accounted to a category do not count again
+    assert retained_size(channels, seen) == 0
+    assert retained_size([channels[0].datapoints], set()) > 0
+
+
+def test_memory_report() -> None:
+    """Test the memory report totals."""
+    report = MemoryReport(
+        categories={"configuration": 3000, "channels": 2000, "entities": 1000},
+        channels=10,
+    )
+
+    assert report.as_dict() == {
+        "categories": {"configuration": 3000, "channels": 2000, "entities": 1000},
+        "total": 6000,
+        "channels": 10,
+        "bytes_per_channel": 600,
+    }
+    assert MemoryReport().bytes_per_channel is None
+
+
+def test_measure_memory() -> None:
+    """Test objects shared between categories count towards the first one."""
+    device = _Channel("device", None)
+    channels = [_Channel(f"channel {i}", device) for i in range(2)]
+
+    report = measure_memory(
+        {"device_info": [device], "channels": channels, "entities": [device]}
+    )
+
+    assert report.channels == 2
+    assert report.categories["device_info"] > 0
+    assert report.categories["entities"] == 0
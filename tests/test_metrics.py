@@ -0,0 +1,67 @@
+"""Test the ABB-free@home runtime metrics."""
+
+from unittest.mock import MagicMock
+
+from custom_components.abbfreeathome_ci.metrics import (
+    LATENCY_BUCKETS,
+    LatencyHistogram,
+    SetupTimings,
+    UpdateLatencyMetrics,
+)
+
+
+def test_setup_timings() -> None:
+    """Test setup phases are measured and callbacks run when finished."""
+    setup_timings = SetupTimings()
+    callback = MagicMock()
+    setup_timings.register_callback(callback)
+
+    with setup_timings.measure("library_load"):
+        pass
+
+    assert set(setup_timings.phases) == {"library_load"}
+    assert setup_timings.total is None
+
+    setup_timings.finish()
+
+    callback.assert_called_once()
+    assert setup_timings.as_dict() == {
+        "total": setup_timings.total,
+        "phases": {"library_load": setup_timings.phases["library_load"]},
+    }
+
+    setup_timings.remove_callback(callback)
+    setup_timings.finish()
+    callback.assert_called_once()
+
+
+def test_latency_histogram() -> None:
+    """Test percentiles are the upper bound of the bucket and capped at max."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+
+    for _ in range(99):
+        histogram.record(0.001)
+    histogram.record(0.5)
+
+    assert histogram.count == 100
+    assert 0.001 <= histogram.percentile(50) < 0.00125
+    assert histogram.percentile(99) == histogram.percentile(50)
+    assert histogram.percentile(100) == 0.5
+
+    # Latencies beyond the last bucket report the maximum
+    histogram.record(LATENCY_BUCKETS[-1] * 2)
+    assert histogram.percentile(100) == LATENCY_BUCKETS[-1] * 2
+
+
+def test_update_latency_metrics() -> None:
+    """Test update latencies are recorded per platform and stage."""
+    update_latency = UpdateLatencyMetrics()
+    update_latency.record("switch", queue=0.001, write=0.002)
+    update_latency.record("light", queue=0.001, write=0.002)
+
+    assert set(update_latency.as_dict()) == {"switch", "light"}
+    assert set(update_latency.as_dict()["switch"]) == {"queue", "write", "total"}
+    assert update_latency.as_dict()["switch"]["total"]["max"] == 0.003
+    assert update_latency.combined().count == 2
+    assert update_latency.combined("queue").max == 0.001
@@ -0,0 +1,39 @@
+"""Test the ABB-free@home runtime data."""
+
+from unittest.mock import MagicMock
+
+from custom_components.abbfreeathome_ci.models import ChannelIndex
+
+
+class SwitchChannel:
+    """Stand-in for a switch channel class."""
+
+
+class TriggerChannel:
+    """Stand-in for a trigger channel class."""
+
+
+def test_channel_index() -> None:
+    """Test channels are indexed by their class."""
+    switch = SwitchChannel()
+    trigger = TriggerChannel()
+
+    mock_free_at_home = MagicMock()
+    mock_free_at_home.get_devices.return_value = {
+        "DEVICE123": MagicMock(device_serial="DEVICE123")
+    }
+    mock_free_at_home.get_channels_by_device.return_value = [switch, trigger]
+
+    channel_index = ChannelIndex(mock_free_at_home)
+
+    assert channel_index.get_channels_by_class(channel_class=SwitchChannel) == [switch]
+    assert channel_index.get_channels_by_class(channel_class=TriggerChannel) == [
+        trigger
+    ]
+    assert channel_index.channel_classes == {SwitchChannel, TriggerChannel}
+
+    # Channels of unloaded devices are gone after a rebuild
+    mock_free_at_home.get_channels_by_device.return_value = [trigger]
+    channel_index.rebuild()
+
+    assert channel_index.get_channels_by_class(channel_class=SwitchChannel) == []
@@ -0,0 +1,227 @@
+"""Test ABB-free@home sensor."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.abbfreeathome_ci.const import (
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.abbfreeathome_ci.metrics import (
+    SetupTimings,
+    UpdateLatencyMetrics,
+)
+from custom_components.abbfreeathome_ci.sensor import (
+    SENSOR_FILTER_TRAILING_DELAY,
+    FreeAtHomeSensorEntity,
+    FreeAtHomeSetupDurationSensorEntity,
+    FreeAtHomeUpdateLatencySensorEntity,
+    SensorFilter,
+    _sensor_filter,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+def _sensor_entity(hass: HomeAssistant, sensor_filter: SensorFilter | None):
+    """Create a brightness sensor entity with a mocked state write."""
+    channel = MagicMock()
+    channel.channel_name = "Brightness"
+    channel.channel_id = "ch0000"
+    channel.state = 100.0
+
+    entity = FreeAtHomeSensorEntity(
+        channel,
+        value_attribute="state",
+        entity_description_kwargs={"key": "BrightnessSensor"},
+        sysap_serial_number="TEST123456",
+        create_subdevices=False,
+        sensor_filter=sensor_filter,
+    )
+    entity.hass = hass
+    entity.async_flush_write = MagicMock()
+    return entity, channel
+
+
+def test_sensor_filter_exceeds_deadband() -> None:
+    """Test the absolute and relative deadband."""
+    sensor_filter = SensorFilter(absolute=1, relative=0.05)
+
+    assert not sensor_filter.exceeds_deadband(100.0, 100.0)
+    assert not sensor_filter.exceeds_deadband(104.0, 100.0)
+    assert sensor_filter.exceeds_deadband(105.0, 100.0)
+    assert not sensor_filter.exceeds_deadband(10.5, 10.0)
+    assert sensor_filter.exceeds_deadband(11.0, 10.0)
+    assert sensor_filter.exceeds_deadband(1.0, None)
+
+    # Without a deadband every change is written
+    assert SensorFilter().exceeds_deadband(100.1, 100.0)
+
+
+def test_sensor_filter_options(mock_config_entry) -> None:
+    """Test the options override the filter of the description."""
+    sensor_filter = SensorFilter(absolute=1, relative=0.05, min_interval=5)
+
+    assert _sensor_filter(mock_config_entry, None) is None
+    assert _sensor_filter(mock_config_entry, sensor_filter) == sensor_filter
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_SENSOR_DEADBAND: 10, CONF_SENSOR_MIN_INTERVAL: 30},
+    )
+    assert _sensor_filter(entry, sensor_filter) == SensorFilter(
+        absolute=1, relative=0.1, min_interval=30
+    )
+
+
+async def test_sensor_unfiltered(hass: HomeAssistant) -> None:
+    """Test every change of a sensor without a filter is written."""
+    entity, channel = _sensor_entity(hass, None)
+
+    for value in (100.0, 100.1, 100.2):
+        channel.state = value
+        entity.async_schedule_write()
+        await hass.async_block_till_done()
+
+    assert entity.async_flush_write.call_count == 3
+
+
+async def test_sensor_deadband(hass: HomeAssistant) -> None:
+    """Test small changes are held back and written by the trailing write."""
+    entity, channel = _sensor_entity(hass, SensorFilter(absolute=1))
+
+    entity.async_schedule_write()
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 1
+
+    channel.state = 100.5
+    entity.async_schedule_write()
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SENSOR_FILTER_TRAILING_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 2
+
+    # A change beyond the deadband is written immediately
+    channel.state = 102.0
+    entity.async_schedule_write()
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 3
+
+
+async def test_sensor_min_interval(hass: HomeAssistant) -> None:
+    """Test changes within the minimum interval are written once it passed."""
+    entity, channel = _sensor_entity(hass, SensorFilter(min_interval=5))
+
+    entity.async_schedule_write()
+    for value in (200.0, 300.0, 400.0):
+        channel.state = value
+        entity.async_schedule_write()
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 2
+    assert entity._filter_value == 400.0
+
+    # A removed entity cancels its trailing write
+    channel.state = 500.0
+    entity.async_schedule_write()
+    await entity.async_will_remove_from_hass()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 2
+
+
+async def test_sensor_deadband_within_min_interval(hass: HomeAssistant) -> None:
+    """Test small changes within the minimum interval wait for the trailing flush."""
+    entity, channel = _sensor_entity(hass, SensorFilter(absolute=1, min_interval=5))
+
+    entity.async_schedule_write()
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 1
+
+    for value in (100.1, 100.2, 100.3):
+        channel.state = value
+        entity.async_schedule_write()
+    await hass.async_block_till_done()
+
+    # Once the minimum interval passed the change is still within the deadband
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 1
+
+    for value in (100.4, 100.5):
+        channel.state = value
+        entity.async_schedule_write()
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=5 + SENSOR_FILTER_TRAILING_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert entity.async_flush_write.call_count == 2
+    assert entity._filter_value == 100.5
+
+
+async def test_setup_duration_sensor() -> None:
+    """Test the setup duration sensor is written once the setup finished."""
+    setup_timings = SetupTimings()
+    entity = FreeAtHomeSetupDurationSensorEntity(
+        setup_timings, sysap_serial_number="TEST123456"
+    )
+    entity.async_write_ha_state = MagicMock()
+
+    assert entity.unique_id == "TEST123456_SetupDuration"
+    assert entity.device_info == {"identifiers": {(DOMAIN, "TEST123456")}}
+
+    await entity.async_added_to_hass()
+    with setup_timings.measure("library_load"):
+        pass
+    assert entity.native_value is None
+
+    setup_timings.finish()
+    entity.async_write_ha_state.assert_called_once()
+    assert entity.native_value == setup_timings.total
+    assert set(entity.extra_state_attributes) == {"library_load"}
+
+    # A removed sensor is no longer written
+    await entity.async_will_remove_from_hass()
+    setup_timings.finish()
+    entity.async_write_ha_state.assert_called_once()
+
+
+def test_update_latency_sensor() -> None:
+    """Test the update latency sensor reports the percentiles of all platforms."""
+    update_latency = UpdateLatencyMetrics()
+    entity = FreeAtHomeUpdateLatencySensorEntity(
+        update_latency, sysap_serial_number="TEST123456"
+    )
+
+    assert entity.unique_id == "TEST123456_UpdateLatency"
+    assert entity.device_info == {"identifiers": {(DOMAIN, "TEST123456")}}
+    assert entity.should_poll is True
+    assert entity.native_value is None
+    assert entity.extra_state_attributes == {}
+
+    update_latency.record("light", queue=0.001, write=0.001)
+    update_latency.record("sensor", queue=0.5, write=0.5)
+
+    assert entity.native_value == 1.0
+    assert set(entity.extra_state_attributes) == {"light", "sensor"}
+    assert entity.extra_state_attributes["sensor"] == {
+        "p50": 1.0,
+        "p95": 1.0,
+        "p99": 1.0,
+    }
@@ -0,0 +1,138 @@
+"""Test the ABB-free@home configuration snapshot."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from abbfreeathome import FreeAtHomeApi
+import pytest
+
+from custom_components.abbfreeathome_ci.snapshot import (
+    ConfigSnapshot,
+    ConfigSnapshotStore,
+    ConfigurationDiff,
+    FreeAtHomeSnapshotApi,
+    diff_configurations,
+)
+from homeassistant.core import HomeAssistant
+
+
+async def test_preloaded_configuration() -> None:
+    """Test the preloaded configuration is served instead of fetching it."""
+    api = FreeAtHomeSnapshotApi(
+        host="http://192.168.1.100",
+        username="installer",
+        password="test_password",
+        client_session=MagicMock(),
+    )
+
+    with patch.object(
+        FreeAtHomeApi,
+        "get_configuration",
+        new=AsyncMock(return_value={"devices": {"DEVICE123": {}}}),
+    ) as mock_get_configuration:
+        with api.preloaded_configuration({"devices": {}}):
+            assert await api.get_configuration() == {"devices": {}}
+        mock_get_configuration.assert_not_called()
+
+        # The preloaded configuration is only served inside the context
+        assert await api.get_configuration() == {"devices": {"DEVICE123": {}}}
+        mock_get_configuration.assert_called_once()
+
+
+async def test_ws_connect_callback() -> None:
+    """Test the connect callback runs once the websocket is connected."""
+    api = FreeAtHomeSnapshotApi(
+        host="http://192.168.1.100",
+        username="installer",
+        password="test_password",
+        client_session=MagicMock(),
+    )
+    api.ws_connect_callback = MagicMock()
+
+    with (
+        patch.object(
+            FreeAtHomeApi, "ws_connect", new=AsyncMock(side_effect=ConnectionError)
+        ),
+        pytest.raises(ConnectionError),
+    ):
+        await api.ws_connect()
+    api.ws_connect_callback.assert_not_called()
+
+    with patch.object(FreeAtHomeApi, "ws_connect", new=AsyncMock()):
+        await api.ws_connect()
+    api.ws_connect_callback.assert_called_once()
+
+
+async def test_ws_message_callback() -> None:
+    """Test the message callback gets the arrival time of every message."""
+    api = FreeAtHomeSnapshotApi(
+        host="http://192.168.1.100",
+        username="installer",
+        password="test_password",
+        client_session=MagicMock(),
+    )
+    api.ws_message_callback = MagicMock()
+
+    with (
+        patch.object(
+            FreeAtHomeApi, "ws_receive", new=AsyncMock(return_value={"data": 1})
+        ),
+        patch(
+            "custom_components.abbfreeathome_ci.snapshot.time.monotonic",
+            return_value=123.0,
+        ),
+    ):
+        assert await api.ws_receive() == {"data": 1}
+    api.ws_message_callback.assert_called_once_with(123.0)
+
+
+async def test_config_snapshot_store(hass: HomeAssistant, hass_storage) -> None:
+    """Test the snapshot is saved, loaded and removed."""
+    snapshot = ConfigSnapshot(
+        settings={"name": "Test SysAP", "version": "3.0.0", "hardware_version": "1.0"},
+        configuration={"devices": {}},
+    )
+
+    assert await ConfigSnapshotStore(hass, "entry").async_load() is None
+
+    await ConfigSnapshotStore(hass, "entry").async_save(snapshot)
+    assert await ConfigSnapshotStore(hass, "entry").async_load() == snapshot
+
+    await ConfigSnapshotStore(hass, "entry").async_remove()
+    assert await ConfigSnapshotStore(hass, "entry").async_load() is None
+
+
+def test_diff_configurations() -> None:
+    """Test renamed devices are told apart from structural changes."""
+    floorplan = {"floors": {"01": {"rooms": {"01": {"name": "Kitchen"}}}}}
+    configuration = {
+        "floorplan": floorplan,
+        "devices": {
+            "DEVICE123": {
+                "displayName": "Old",
+                "floor": "01",
+                "room": "01",
+                "channels": {"ch0000": {"functionID": "7"}},
+            }
+        },
+    }
+    renamed = {
+        "floorplan": floorplan,
+        "devices": {
+            "DEVICE123": configuration["devices"]["DEVICE123"] | {"displayName": "New"}
+        },
+    }
+    changed = {
+        "floorplan": floorplan,
+        "devices": {
+            "DEVICE123": configuration["devices"]["DEVICE123"]
+            | {"channels": {"ch0000": {"functionID": "7"}, "ch0001": {}}}
+        },
+    }
+
+    assert diff_configurations(configuration, configuration) == ConfigurationDiff()
+    assert diff_configurations(configuration, renamed) == ConfigurationDiff(
+        renamed_devices={"DEVICE123": ("New", "Kitchen")}
+    )
+    assert diff_configurations(configuration, changed) == ConfigurationDiff(
+        structure_changed=True
+    )
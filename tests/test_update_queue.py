@@ -0,0 +1,80 @@
+"""Test the ABB-free@home update queue."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.abbfreeathome_ci.update_queue import UpdateQueue
+from homeassistant.core import HomeAssistant
+
+
+def _flushed(entities: list[MagicMock]) -> list[MagicMock]:
+    """Return the entities in the order their state was written."""
+    _order = []
+    for _entity in entities:
+        _entity.async_flush_write.side_effect = lambda e=_entity: _order.append(e)
+    return _order
+
+
+async def test_update_queue_priority(hass: HomeAssistant) -> None:
+    """Test the priority lane is written first and entities are queued once."""
+    queue = UpdateQueue(10)
+    normal, alarm = MagicMock(), MagicMock()
+    order = _flushed([normal, alarm])
+
+    queue.enqueue(normal)
+    queue.enqueue(normal)
+    queue.enqueue(alarm, priority=True)
+    assert len(queue) == 2
+
+    task = hass.async_create_task(queue.async_run())
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert order == [alarm, normal]
+    assert len(queue) == 0
+    assert queue.as_dict()["high_water"] == 2
+
+
+async def test_update_queue_discard() -> None:
+    """Test a discarded entity is not written."""
+    queue = UpdateQueue(10)
+    entity = MagicMock()
+
+    queue.enqueue(entity)
+    queue.discard(entity)
+
+    assert len(queue) == 0
+
+
+async def test_update_queue_full() -> None:
+    """Test a write is done immediately instead of queued when the queue is full."""
+    queue = UpdateQueue(2)
+    first, second, third = MagicMock(), MagicMock(), MagicMock()
+
+    queue.enqueue(first)
+    queue.enqueue(second)
+    queue.enqueue(third)
+
+    # No pending write is lost, the new one is written right away
+    third.async_flush_write.assert_called_once()
+    first.async_flush_write.assert_not_called()
+    assert list(queue._normal) == [first, second]
+    assert queue.written_inline == 1
+
+    # An entity already queued is not written a second time
+    queue.enqueue(first)
+    first.async_flush_write.assert_not_called()
+    assert queue.written_inline == 1
+
+
+async def test_update_queue_priority_not_limited() -> None:
+    """Test the queue size does not apply to the priority lane."""
+    queue = UpdateQueue(1)
+    normal, alarm = MagicMock(), MagicMock()
+
+    queue.enqueue(normal)
+    queue.enqueue(alarm, priority=True)
+
+    assert len(queue) == 2
+    alarm.async_flush_write.assert_not_called()
+    assert queue.written_inline == 0
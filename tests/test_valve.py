@@ -9,6 +9,7 @@ from abbfreeathome.channels.valve_actuator import (
 )
 
 from custom_components.abbfreeathome_ci.const import DOMAIN
+from custom_components.abbfreeathome_ci.models import FreeAtHomeData
 from custom_components.abbfreeathome_ci.valve import (
     FreeAtHomeValveEntity,
     async_setup_entry,
@@ -23,9 +24,13 @@ async def test_async_setup_entry_no_valves(
     """Test setup with no valve entities."""
     mock_config_entry.add_to_hass(hass)
 
-    mock_free_at_home = MagicMock()
-    mock_free_at_home.get_channels_by_class.return_value = []
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    mock_channel_index = MagicMock()
+    mock_channel_index.get_channels_by_class.return_value = []
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     async_add_entities = MagicMock()
     await async_setup_entry(hass, mock_config_entry, async_add_entities)
@@ -50,7 +55,7 @@ async def test_async_setup_entry_with_heating_actuator(
     mock_channel.position = 75
     mock_channel.device.is_multi_device = False
 
-    mock_free_at_home = MagicMock()
+    mock_channel_index = MagicMock()
 
     def get_channels_by_class_side_effect(channel_class):
         """Return channels only for HeatingActuator."""
@@ -58,10 +63,14 @@ async def test_async_setup_entry_with_heating_actuator(
             return [mock_channel]
         return []
 
-    mock_free_at_home.get_channels_by_class.side_effect = (
+    mock_channel_index.get_channels_by_class.side_effect = (
         get_channels_by_class_side_effect
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -99,7 +108,7 @@ async def test_async_setup_entry_with_cooling_actuator(
     mock_channel.position = 50
     mock_channel.device.is_multi_device = False
 
-    mock_free_at_home = MagicMock()
+    mock_channel_index = MagicMock()
 
     def get_channels_by_class_side_effect(channel_class):
         """Return channels only for CoolingActuator."""
@@ -107,10 +116,14 @@ async def test_async_setup_entry_with_cooling_actuator(
             return [mock_channel]
         return []
 
-    mock_free_at_home.get_channels_by_class.side_effect = (
+    mock_channel_index.get_channels_by_class.side_effect = (
         get_channels_by_class_side_effect
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -147,7 +160,7 @@ async def test_async_setup_entry_with_heating_cooling_actuator(
     mock_channel.cooling_position = 20
     mock_channel.device.is_multi_device = False
 
-    mock_free_at_home = MagicMock()
+    mock_channel_index = MagicMock()
 
     def get_channels_by_class_side_effect(channel_class):
         """Return channels only for HeatingCoolingActuator."""
@@ -155,10 +168,14 @@ async def test_async_setup_entry_with_heating_cooling_actuator(
             return [mock_channel]
         return []
 
-    mock_free_at_home.get_channels_by_class.side_effect = (
+    mock_channel_index.get_channels_by_class.side_effect = (
         get_channels_by_class_side_effect
     )
-    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_free_at_home}
+    hass.data[DOMAIN] = {
+        mock_config_entry.entry_id: FreeAtHomeData(
+            free_at_home=MagicMock(), channel_index=mock_channel_index
+        )
+    }
 
     entities_added = []
 
@@ -340,14 +357,14 @@ async def test_valve_entity_callbacks(hass: HomeAssistant) -> None:
     await entity.async_added_to_hass()
     mock_channel.register_callback.assert_called_once_with(
         callback_attribute="position",
-        callback=entity.async_write_ha_state,
+        callback=entity.async_schedule_write,
     )
 
     # Test callback removal
     await entity.async_will_remove_from_hass()
     mock_channel.remove_callback.assert_called_once_with(
         callback_attribute="position",
-        callback=entity.async_write_ha_state,
+        callback=entity.async_schedule_write,
     )
 
 
@@ -0,0 +1,189 @@
+"""Test the ABB-free@home websocket supervisor."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.abbfreeathome_ci.websocket import (
+    ConnectionState,
+    WebsocketSupervisor,
+)
+from homeassistant.core import HomeAssistant
+
+
+async def test_websocket_supervisor_reconnect(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test the websocket reconnects with backoff and resyncs the states."""
+    mock_config_entry.add_to_hass(hass)
+    sessions = 0
+
+    async def ws_listen() -> None:
+        nonlocal sessions
+        sessions += 1
+
+        if sessions == 1:
+            # Connection established, then dropped by the SysAP
+            supervisor.async_connected()
+            await asyncio.sleep(0.05)
+        elif sessions == 2:
+            # Connection refused
+            raise ConnectionError("boom")
+        else:
+            supervisor.async_connected()
+            await asyncio.Event().wait()
+
+    mock_free_at_home = MagicMock()
+    mock_free_at_home.ws_listen = ws_listen
+    mock_free_at_home.ws_close = AsyncMock()
+    mock_resync = AsyncMock()
+    supervisor = WebsocketSupervisor(mock_free_at_home, mock_resync)
+
+    with (
+        patch("custom_components.abbfreeathome_ci.websocket.WS_BACKOFF_MIN", 0.01),
+    ):
+        supervisor.async_start(hass, mock_config_entry)
+
+        for _ in range(100):
+            if sessions == 3 and supervisor.is_connected:
+                break
+            await asyncio.sleep(0.01)
+
+    assert supervisor.state is ConnectionState.CONNECTED
+    assert supervisor.connects == 2
+    assert supervisor.disconnects == 1
+    assert supervisor.last_error == "ConnectionError('boom')"
+    mock_resync.assert_called_once()
+
+    await supervisor.async_stop()
+
+    assert supervisor.state is ConnectionState.STOPPED
+    assert supervisor.as_dict()["state"] == "stopped"
+
+
+async def test_websocket_supervisor_resync_in_background(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test a hanging or failing resync does not hold up the connection."""
+    mock_config_entry.add_to_hass(hass)
+    sessions = 0
+    resyncs = 0
+    drop = asyncio.Event()
+    resync_cancelled = asyncio.Event()
+
+    async def ws_listen() -> None:
+        nonlocal sessions
+        sessions += 1
+
+        supervisor.async_connected()
+        if sessions == 1:
+            await asyncio.sleep(0.05)
+        elif sessions == 2:
+            # Dropped again while the resync is still running
+            await drop.wait()
+        else:
+            await asyncio.Event().wait()
+
+    async def resync() -> None:
+        nonlocal resyncs
+        resyncs += 1
+
+        if resyncs == 1:
+            # The SysAP does not answer, the resync keeps retrying
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                resync_cancelled.set()
+                raise
+        raise ConnectionError("boom")
+
+    mock_free_at_home = MagicMock()
+    mock_free_at_home.ws_listen = ws_listen
+    mock_free_at_home.ws_close = AsyncMock()
+    supervisor = WebsocketSupervisor(mock_free_at_home, resync)
+
+    with (
+        patch("custom_components.abbfreeathome_ci.websocket.WS_BACKOFF_MIN", 0.01),
+    ):
+        supervisor.async_start(hass, mock_config_entry)
+
+        for _ in range(100):
+            if resyncs == 1:
+                drop.set()
+            if resyncs == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+    # The hanging resync ended with its session, the drop was noticed
+    assert resync_cancelled.is_set()
+    assert supervisor.disconnects == 2
+
+    # The failed resync is no connection failure and kept the session
+    assert supervisor.is_connected
+    assert supervisor.connects == 3
+    assert supervisor.last_error is None
+
+    await supervisor.async_stop()
+
+
+async def test_websocket_supervisor_waits_for_connect(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test a websocket which is listening but not connected is not connected."""
+    mock_config_entry.add_to_hass(hass)
+    connect = asyncio.Event()
+
+    async def ws_listen() -> None:
+        # The SysAP does not answer the connection attempt
+        await connect.wait()
+        supervisor.async_connected()
+        await asyncio.Event().wait()
+
+    mock_free_at_home = MagicMock()
+    mock_free_at_home.ws_listen = ws_listen
+    mock_free_at_home.ws_close = AsyncMock()
+    supervisor = WebsocketSupervisor(mock_free_at_home, AsyncMock())
+    supervisor.async_start(hass, mock_config_entry)
+
+    await asyncio.sleep(0.05)
+    assert supervisor.state is ConnectionState.CONNECTING
+    assert supervisor.connects == 0
+
+    connect.set()
+    await asyncio.sleep(0)
+    assert supervisor.is_connected
+    assert supervisor.connects == 1
+
+    await supervisor.async_stop()
+
+
+async def test_websocket_supervisor_library_reconnect(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test a reconnect inside the library counts as a reconnect and resyncs."""
+    mock_config_entry.add_to_hass(hass)
+    reconnect = asyncio.Event()
+
+    async def ws_listen() -> None:
+        supervisor.async_connected()
+        await reconnect.wait()
+        supervisor.async_connected()
+        await asyncio.Event().wait()
+
+    mock_free_at_home = MagicMock()
+    mock_free_at_home.ws_listen = ws_listen
+    mock_free_at_home.ws_close = AsyncMock()
+    mock_resync = AsyncMock()
+    supervisor = WebsocketSupervisor(mock_free_at_home, mock_resync)
+    supervisor.async_start(hass, mock_config_entry)
+
+    await asyncio.sleep(0)
+    reconnect.set()
+    await asyncio.sleep(0.01)
+
+    assert supervisor.is_connected
+    assert supervisor.connects == 2
+    assert supervisor.disconnects == 1
+    mock_resync.assert_called_once()
+
+    await supervisor.async_stop()